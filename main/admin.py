@@ -1,18 +1,47 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.db.models import Q
+from django.db.models.functions import Lower
 from .models import Tutorial, TutorialCategory, TutorialSeries, ContactMessage
+from .paginator import EstimatedCountPaginator
+from .search import get_search_backend, TUTORIAL
 
 # Register your models here.
 
+ADMIN_SEARCH_LIMIT = 1000
+
 
 class TutorialAdmin(admin.ModelAdmin):
 	fieldsets = [
 			("Title/Date", {"fields": ["tutorial_title", "tutorial_published"]}),
 			("URL", {"fields": ["tutorial_slug"]}),
 			("Series", {"fields": ["tutorial_series"]}),
-			("Content", {"fields": ["tutorial_content"]})
+			("Content", {"fields": ["tutorial_format", "tutorial_content"]})
 	]
 	list_display = ['tutorial_title', 'tutorial_series', 'tutorial_published']
-	search_fields = ['tutorial_title', 'tutorial_content']
+	list_select_related = ['tutorial_series']
+	search_fields = ['tutorial_title']
+	paginator = EstimatedCountPaginator
+	show_full_result_count = False
+
+	def get_queryset(self, request):
+		queryset = super().get_queryset(request)
+		match = request.resolver_match
+		if match is not None and match.url_name.endswith("_changelist"):
+			queryset = queryset.defer("tutorial_content", "rendered_html", "tutorial_toc")
+		return queryset
+
+	def get_search_results(self, request, queryset, search_term):
+		"""Search titles and bodies through the full-text index, or a slug exactly."""
+		if not search_term:
+			return queryset, False
+		found = get_search_backend().search(search_term, 0, ADMIN_SEARCH_LIMIT, kinds=[TUTORIAL])
+		if found.total > ADMIN_SEARCH_LIMIT:
+			self.message_user(
+				request, f"Showing the best {ADMIN_SEARCH_LIMIT} of {found.total} matches; "
+				"refine the search to see the rest.", messages.WARNING)
+		pks = [pk for kind, pk in found.hits]
+		pks += queryset.filter(tutorial_slug=search_term.strip()).values_list("pk", flat=True)
+		return queryset.filter(pk__in=pks), False
 
 
 class TutorialCategoryAdmin(admin.ModelAdmin):
@@ -21,17 +50,73 @@ class TutorialCategoryAdmin(admin.ModelAdmin):
 
 class TutorialSeriesAdmin(admin.ModelAdmin):
 	list_display = ['tutorial_series', 'tutorial_category', 'series_summary']
+	list_select_related = ['tutorial_category']
 
 
 class ContactMessageAdmin(admin.ModelAdmin):
-	list_display = ['subject', 'name', 'email', 'created_at', 'is_read']
-	list_filter = ['is_read', 'created_at']
-	search_fields = ['name', 'email', 'subject', 'message']
+	list_display = ['subject', 'name', 'email', 'created_at', 'is_read', 'is_archived']
+	list_filter = ['is_archived', 'is_read', 'created_at']
+	search_fields = ['email', 'name', 'subject']
+	search_help_text = (
+		"Matches an exact email, or the start of a name or subject. "
+		"Prefix the term with * to search inside names, emails, subjects and messages (slower).")
 	readonly_fields = ['name', 'email', 'subject', 'message', 'created_at']
+	actions = ['mark_read', 'mark_unread', 'archive', 'unarchive']
+	paginator = EstimatedCountPaginator
+	show_full_result_count = False
+
+	def get_queryset(self, request):
+		queryset = super().get_queryset(request)
+		match = request.resolver_match
+		if match is not None and match.url_name.endswith("_changelist"):
+			queryset = queryset.defer("message")
+		return queryset
+
+	def get_search_results(self, request, queryset, search_term):
+		"""
+		Exact email, or a case-insensitive name or subject prefix, all
+		answered from an index; "*term" scans for term anywhere instead.
+		"""
+		term = search_term.strip()
+		if term.startswith("*"):
+			term = term[1:].strip()
+			if not term:
+				return queryset, False
+			return queryset.filter(
+				Q(name__icontains=term) | Q(email__icontains=term)
+				| Q(subject__icontains=term) | Q(message__icontains=term)), False
+		if not term:
+			return queryset, False
+		# Range filters on the same expressions as the contact_*_lower indexes.
+		prefix = term.lower()
+		return queryset.alias(name_lower=Lower("name"), subject_lower=Lower("subject")).filter(
+			Q(email=term)
+			| Q(name_lower__gte=prefix, name_lower__lt=prefix + "\uffff")
+			| Q(subject_lower__gte=prefix, subject_lower__lt=prefix + "\uffff")), False
+
+	def _bulk_update(self, request, queryset, label, **values):
+		# A single UPDATE, rather than loading and saving each object.
+		updated = queryset.order_by().update(**values)
+		self.message_user(request, f"{updated} message{'s' if updated != 1 else ''} {label}.")
+
+	@admin.action(description="Mark selected messages as read")
+	def mark_read(self, request, queryset):
+		self._bulk_update(request, queryset, "marked as read", is_read=True)
+
+	@admin.action(description="Mark selected messages as unread")
+	def mark_unread(self, request, queryset):
+		self._bulk_update(request, queryset, "marked as unread", is_read=False)
+
+	@admin.action(description="Archive selected messages")
+	def archive(self, request, queryset):
+		self._bulk_update(request, queryset, "archived", is_archived=True)
+
+	@admin.action(description="Unarchive selected messages")
+	def unarchive(self, request, queryset):
+		self._bulk_update(request, queryset, "unarchived", is_archived=False)
 
 
 admin.site.register(TutorialCategory, TutorialCategoryAdmin)
 admin.site.register(TutorialSeries, TutorialSeriesAdmin)
 admin.site.register(Tutorial, TutorialAdmin)
 admin.site.register(ContactMessage, ContactMessageAdmin)
-
@@ -0,0 +1,283 @@
+"""
+Read-only JSON API over categories, series and tutorials.
+
+List endpoints page with an opaque cursor instead of OFFSET. Tutorials
+are ordered newest first on (tutorial_published, id), and categories and
+series on id, so every page is an index range scan however deep it is.
+``fields=`` picks the columns to load, which keeps the tutorial bodies
+(html, source) out of the query unless they are asked for. Lists are
+streamed as they are read from the database.
+
+Responses carry an ETag, plus Last-Modified where it means something.
+Lists derive them from the row count and newest updated_at of what they
+list, as main.freshness does for pages. Details derive them from the
+row itself.
+"""
+import base64
+import binascii
+import hashlib
+import json
+from collections import namedtuple
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Max, Q
+from django.http import JsonResponse
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_safe
+
+from .feeds import streaming_response
+from .models import Tutorial, TutorialCategory, TutorialSeries
+
+
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+# Rows serialised per streamed chunk.
+CHUNK_ROWS = 100
+
+Resource = namedtuple("Resource", ["model", "fields", "default_fields", "ordering", "filters"])
+Resource.__doc__ = "A model as the API lists it: {public name: column}, defaults, keyset and {param: lookup}."
+
+CATEGORIES = Resource(
+	model=TutorialCategory,
+	fields={
+		"id": "pk",
+		"slug": "category_slug",
+		"title": "tutorial_category",
+		"summary": "category_summary",
+		"updated": "updated_at",
+	},
+	default_fields=("id", "slug", "title", "summary", "updated"),
+	ordering=("pk",),
+	filters={},
+)
+
+SERIES = Resource(
+	model=TutorialSeries,
+	fields={
+		"id": "pk",
+		"title": "tutorial_series",
+		"summary": "series_summary",
+		"category": "tutorial_category_id",
+		"updated": "updated_at",
+	},
+	default_fields=("id", "title", "summary", "category", "updated"),
+	ordering=("pk",),
+	filters={"category": "tutorial_category__category_slug"},
+)
+
+TUTORIALS = Resource(
+	model=Tutorial,
+	fields={
+		"id": "pk",
+		"slug": "tutorial_slug",
+		"title": "tutorial_title",
+		"published": "tutorial_published",
+		"updated": "updated_at",
+		"series": "tutorial_series_id",
+		"position": "series_position",
+		"excerpt": "tutorial_excerpt",
+		"toc": "tutorial_toc",
+		"html": "rendered_html",
+		"format": "tutorial_format",
+		"source": "tutorial_content",
+	},
+	default_fields=("id", "slug", "title", "published", "updated", "series", "position", "excerpt"),
+	ordering=("tutorial_published", "pk"),
+	filters={"series": "tutorial_series_id"},
+)
+
+
+class BadRequest(ValueError):
+	pass
+
+
+def _error(message, status=400):
+	return JsonResponse({"error": message}, status=status)
+
+
+def _fields(request, resource):
+	requested = request.GET.get("fields")
+	if not requested:
+		return list(resource.default_fields)
+	names = [name.strip() for name in requested.split(",") if name.strip()]
+	unknown = [name for name in names if name not in resource.fields]
+	if unknown or not names:
+		raise BadRequest(f"Unknown fields: {', '.join(unknown) or requested}. "
+						 f"Choose from: {', '.join(resource.fields)}.")
+	return list(dict.fromkeys(names))
+
+
+def _limit(request):
+	try:
+		limit = int(request.GET.get("limit", PAGE_SIZE))
+	except ValueError:
+		raise BadRequest("limit must be an integer.")
+	if not 1 <= limit <= MAX_PAGE_SIZE:
+		raise BadRequest(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+	return limit
+
+
+def encode_cursor(values):
+	# isoformat() rather than DjangoJSONEncoder, which drops microseconds.
+	values = [value.isoformat() if hasattr(value, "isoformat") else value for value in values]
+	raw = json.dumps(values, separators=(",", ":"))
+	return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, resource):
+	"""The keyset values a cursor encodes, typed like the ordering columns."""
+	try:
+		values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+		if not isinstance(values, list) or len(values) != len(resource.ordering):
+			raise ValueError
+		if resource.ordering[0] == "tutorial_published":
+			published = parse_datetime(values[0])
+			if published is None:
+				raise ValueError
+			values[0] = published
+		if not isinstance(values[-1], int):
+			raise ValueError
+	except (ValueError, TypeError, binascii.Error, UnicodeDecodeError):
+		raise BadRequest("Invalid cursor.")
+	return values
+
+
+def _after(resource, values):
+	"""Rows that come after the keyset values in newest-first order."""
+	if len(resource.ordering) == 1:
+		return Q(pk__lt=values[0])
+	first, pk = resource.ordering[0], values[1]
+	# The redundant <= bound lets the database seek the index to the cursor.
+	return Q(**{f"{first}__lte": values[0]}) & (Q(**{f"{first}__lt": values[0]}) | Q(pk__lt=pk))
+
+
+def _filtered(request, resource):
+	queryset = resource.model.objects.all()
+	for param, lookup in resource.filters.items():
+		if param in request.GET:
+			try:
+				queryset = queryset.filter(**{lookup: request.GET[param]})
+			except (ValueError, ValidationError):
+				raise BadRequest(f"Invalid {param}.")
+	return queryset
+
+
+def _etag(request, *parts):
+	raw = "|".join(map(str, (request.get_full_path(),) + parts))
+	return quote_etag(hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest())
+
+
+def _not_modified(request, etag, last_modified):
+	timestamp = int(last_modified.timestamp()) if last_modified else None
+	response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+	return response if response is None else _set_validators(response, etag, last_modified)
+
+
+def _set_validators(response, etag, last_modified):
+	response["ETag"] = etag
+	if last_modified is not None:
+		response["Last-Modified"] = http_date(last_modified.timestamp())
+	return response
+
+
+def _rows_json(rows, names, columns, ordering, limit):
+	"""
+	Stream {"results": [...], "next": cursor} from rows, which holds up to
+	limit + 1 tuples; the extra row only tells us there is a next page.
+	"""
+	positions = [(name, columns.index(column)) for name, column in names]
+	keyset = [columns.index(column) for column in ordering]
+	yield '{"results":['
+	batch, last, sent = [], None, 0
+	for row in rows:
+		if sent == limit:
+			yield "".join(batch)
+			yield '],"next":' + json.dumps(encode_cursor([last[i] for i in keyset])) + "}"
+			return
+		item = {name: row[i] for name, i in positions}
+		batch.append(("," if sent else "") + json.dumps(item, cls=DjangoJSONEncoder))
+		last, sent = row, sent + 1
+		if len(batch) >= CHUNK_ROWS:
+			yield "".join(batch)
+			batch = []
+	yield "".join(batch)
+	yield '],"next":null}'
+
+
+def _list(request, resource):
+	try:
+		names = _fields(request, resource)
+		limit = _limit(request)
+		cursor = request.GET.get("cursor")
+		after = decode_cursor(cursor, resource) if cursor else None
+		queryset = _filtered(request, resource)
+	except BadRequest as e:
+		return _error(str(e))
+
+	# Counts catch deletions, which leave no newer updated_at behind.
+	state = queryset.order_by().aggregate(n=Count("pk"), last=Max("updated_at"))
+	etag = _etag(request, state["n"], state["last"] and state["last"].isoformat())
+	response = _not_modified(request, etag, state["last"])
+	if response is not None:
+		return response
+
+	if after is not None:
+		queryset = queryset.filter(_after(resource, after))
+	# Requested columns, then whatever the keyset needs that was not requested.
+	columns = list(dict.fromkeys([resource.fields[name] for name in names] + list(resource.ordering)))
+	rows = (queryset
+		.order_by(*[f"-{column}" for column in resource.ordering])
+		.values_list(*columns)[:limit + 1]
+		.iterator(chunk_size=CHUNK_ROWS))
+	chunks = _rows_json(rows, [(name, resource.fields[name]) for name in names], columns, resource.ordering, limit)
+	return _set_validators(streaming_response(chunks, "application/json"), etag, state["last"])
+
+
+def _detail(request, resource, **lookup):
+	try:
+		names = _fields(request, resource)
+	except BadRequest as e:
+		return _error(str(e))
+	columns = list(dict.fromkeys([resource.fields[name] for name in names] + ["updated_at"]))
+	row = resource.model.objects.filter(**lookup).values_list(*columns).first()
+	if row is None:
+		return _error("Not found.", status=404)
+	last_modified = row[columns.index("updated_at")]
+	etag = _etag(request, last_modified.isoformat())
+	response = _not_modified(request, etag, last_modified)
+	if response is None:
+		response = JsonResponse({name: row[columns.index(resource.fields[name])] for name in names})
+	return _set_validators(response, etag, last_modified)
+
+
+@require_safe
+def category_list(request):
+	return _list(request, CATEGORIES)
+
+
+@require_safe
+def category_detail(request, slug):
+	return _detail(request, CATEGORIES, category_slug=slug)
+
+
+@require_safe
+def series_list(request):
+	return _list(request, SERIES)
+
+
+@require_safe
+def series_detail(request, pk):
+	return _detail(request, SERIES, pk=pk)
+
+
+@require_safe
+def tutorial_list(request):
+	return _list(request, TUTORIALS)
+
+
+@require_safe
+def tutorial_detail(request, slug):
+	return _detail(request, TUTORIALS, tutorial_slug=slug)
@@ -0,0 +1,210 @@
+"""
+CSS build helpers used by main.storage during collectstatic.
+
+materialize.css is compiled from materialize-src/sass; rather than
+requiring a Sass toolchain at deploy time we post-process that compiled
+output: rules whose classes or ids never appear in our templates, forms
+or the materialize components we initialise are dropped, then the rest
+is minified.
+
+critical_css() goes further for a single rendered page and keeps only
+what its first screenful needs; build_critical_css writes one such file
+per page type for header.html to inline.
+"""
+import glob
+import os
+import re
+
+from django.conf import settings
+
+
+# Components initialised in header.html (M.AutoInit, sidenav, collapsible,
+# toasts) add classes at runtime, so their sources count as usage too.
+MATERIALIZE_JS = ("global", "cash", "component", "forms", "sidenav", "collapsible", "toasts", "waves")
+
+
+CRITICAL_PAGES = ("categories", "category", "tutorial", "search")
+
+
+def critical_css_dir():
+	return getattr(settings, "CRITICAL_CSS_DIR", os.path.join(settings.BASE_DIR, "main", "critical"))
+
+
+def sample_pages():
+	"""[(page type, url)] for one page of each CRITICAL_PAGES type in the database."""
+	from .models import Tutorial, TutorialCategory
+
+	category = TutorialCategory.objects.order_by("pk").only("category_slug").first()
+	tutorial = (Tutorial.objects.order_by("tutorial_series_id", "series_position")
+		.only("tutorial_slug", "tutorial_title").first())
+	if category is None or tutorial is None:
+		return []
+	query = (re.findall(r"\w+", tutorial.tutorial_title) or ["a"])[0]
+	return [
+		("categories", "/"),
+		("category", f"/{category.category_slug}"),
+		("tutorial", f"/{tutorial.tutorial_slug}"),
+		("search", f"/search/?q={query}"),
+	]
+
+
+def default_sources():
+	base = settings.BASE_DIR
+	sources = glob.glob(os.path.join(base, "main", "templates", "**", "*.html"), recursive=True)
+	sources.append(os.path.join(base, "main", "forms.py"))
+	sources += [os.path.join(base, "materialize-src", "js", f"{name}.js") for name in MATERIALIZE_JS]
+	return [path for path in sources if os.path.exists(path)]
+
+
+def used_tokens(paths=None):
+	"""Every identifier-like word in the given sources; a superset of the classes and ids used."""
+	tokens = set()
+	for path in paths or getattr(settings, "CSS_PURGE_SOURCES", None) or default_sources():
+		with open(path, encoding="utf-8") as f:
+			tokens.update(re.findall(r"[A-Za-z_][\w-]*", f.read()))
+	return tokens
+
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_NAMES = re.compile(r"[.#](-?[A-Za-z_][\w-]*)")
+# Blocks kept verbatim; everything else is a rule or a conditional group.
+_KEEP_AT_RULES = ("@font-face", "@keyframes", "@-webkit-keyframes", "@-moz-keyframes", "@page", "@charset", "@import")
+
+
+def _split_selectors(prelude):
+	parts, depth, start = [], 0, 0
+	for i, ch in enumerate(prelude):
+		if ch in "([":
+			depth += 1
+		elif ch in ")]":
+			depth -= 1
+		elif ch == "," and depth == 0:
+			parts.append(prelude[start:i])
+			start = i + 1
+	parts.append(prelude[start:])
+	return [p.strip() for p in parts if p.strip()]
+
+
+def _selector_used(selector, tokens):
+	# Only names outside :not(...) have to be present for the rule to apply.
+	selector = re.sub(r":not\([^)]*\)", "", selector)
+	return all(name in tokens for name in _NAMES.findall(selector))
+
+
+def _block_end(css, start):
+	"""Index just past the '}' matching the '{' at css[start]."""
+	depth = 0
+	for i in range(start, len(css)):
+		if css[i] == "{":
+			depth += 1
+		elif css[i] == "}":
+			depth -= 1
+			if depth == 0:
+				return i + 1
+	return len(css)
+
+
+def _filter_rules(css, keep_selector, keep_at_rule):
+	"""
+	Rebuild css keeping only the selectors keep_selector(selector) accepts;
+	rules left with no selectors are dropped. Conditional groups such as
+	@media are filtered recursively; other block at-rules are kept whole
+	when keep_at_rule(prelude) is true.
+	"""
+	css = _COMMENT.sub("", css)
+	out, pos = [], 0
+	while pos < len(css):
+		brace = css.find("{", pos)
+		semi = css.find(";", pos)
+		if brace == -1:
+			break
+		prelude = css[pos:brace].strip()
+		if prelude.startswith("@") and semi != -1 and semi < brace:
+			if keep_at_rule(prelude):
+				out.append(css[pos:semi + 1].strip())  # statement at-rule, e.g. @charset
+			pos = semi + 1
+			continue
+		end = _block_end(css, brace)
+		body = css[brace + 1:end - 1]
+		if prelude.startswith(_KEEP_AT_RULES):
+			if keep_at_rule(prelude):
+				out.append(f"{prelude}{{{body}}}")
+		elif prelude.startswith("@"):
+			if keep_at_rule(prelude):
+				inner = _filter_rules(body, keep_selector, keep_at_rule)
+				if inner.strip():
+					out.append(f"{prelude}{{{inner}}}")
+		else:
+			selectors = [s for s in _split_selectors(prelude) if keep_selector(s)]
+			if selectors:
+				out.append(f"{','.join(selectors)}{{{body}}}")
+		pos = end
+	return "\n".join(out)
+
+
+def purge_css(css, tokens):
+	"""Drop selectors naming classes or ids absent from tokens."""
+	return _filter_rules(css, lambda selector: _selector_used(selector, tokens), lambda prelude: True)
+
+
+# Critical CSS: only what the first paint of a page needs.
+
+FOLD_CHARS = 8000
+# States that cannot apply before the user interacts with the page.
+_INTERACTIVE = re.compile(r":(hover|focus|focus-within|focus-visible|active|visited)\b|::?(-moz-)?selection\b")
+_TAG = re.compile(r"<([a-zA-Z][\w-]*)")
+_ATTRIBUTE = re.compile(r"""\b(class|id)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_COMPOUND_TYPE = re.compile(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)")
+
+
+def above_the_fold(html, fold_chars=FOLD_CHARS):
+	"""
+	The classes, ids and element names used in the first fold_chars of
+	<body>, which approximates what is on screen at first paint.
+	"""
+	start = html.find("<body")
+	body = html[max(start, 0):][:fold_chars]
+	names = set()
+	for match in _ATTRIBUTE.finditer(body):
+		names.update((match.group(2) or match.group(3) or "").split())
+	tags = {tag.lower() for tag in _TAG.findall(body)} | {"html", "body"}
+	return names, tags
+
+
+def _selector_critical(selector, names, tags):
+	if _INTERACTIVE.search(selector):
+		return False
+	if not _selector_used(selector, names):
+		return False
+	bare = re.sub(r":not\([^)]*\)|\[[^\]]*\]|::?[\w-]+(\([^)]*\))?", "", selector)
+	return all(tag.lower() in tags for tag in _COMPOUND_TYPE.findall(bare))
+
+
+def _at_rule_critical(prelude):
+	# Animations, fonts and print styles are not needed to lay the page out.
+	return not (prelude.startswith(("@keyframes", "@-webkit-keyframes", "@-moz-keyframes", "@font-face", "@page",
+									"@charset", "@import"))
+				or (prelude.startswith("@media") and "print" in prelude))
+
+
+def critical_css(css, html, fold_chars=FOLD_CHARS):
+	"""The rules of css that style the above-the-fold part of html, minified."""
+	names, tags = above_the_fold(html, fold_chars)
+	return minify_css(_filter_rules(
+		css, lambda selector: _selector_critical(selector, names, tags), _at_rule_critical))
+
+
+_STRING = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+
+
+def minify_css(css):
+	"""Strip comments and redundant whitespace, leaving strings untouched."""
+	css = _COMMENT.sub("", css)
+	parts = _STRING.split(css)
+	for i in range(0, len(parts), 2):
+		chunk = re.sub(r"\s+", " ", parts[i])
+		chunk = re.sub(r"\s*([{};,>~])\s*", r"\1", chunk)
+		chunk = re.sub(r":\s+", ":", chunk)
+		chunk = chunk.replace(";}", "}")
+		parts[i] = chunk
+	return "".join(parts).strip()
@@ -0,0 +1,22 @@
+"""
+main.urls with the async views swapped in, for serving under ASGI.
+
+See my_site.asgi_urls; every other URL keeps its sync view.
+"""
+from django.urls import path
+
+from . import async_views
+from .urls import app_name, urlpatterns as sync_urlpatterns  # noqa: F401
+
+
+ASYNC_VIEWS = {
+	"homepage": async_views.homepage,
+	"single_slug": async_views.single_slug,
+	"search": async_views.search,
+}
+
+urlpatterns = [
+	path(str(pattern.pattern), ASYNC_VIEWS[pattern.name], name=pattern.name)
+	if pattern.name in ASYNC_VIEWS else pattern
+	for pattern in sync_urlpatterns
+]
@@ -0,0 +1,118 @@
+"""
+Async versions of the read-heavy views, routed by main.async_urls.
+
+They render the same pages as main.views and share its helpers. Rows
+are loaded with the async ORM and fully materialised before rendering,
+because templates may not touch the database from the event loop. The
+parts that are still sync only (the slug registry, the freshness
+aggregates, the raw full-text query) run through sync_to_async.
+"""
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user
+from django.shortcuts import render
+from django.views.decorators.http import condition
+
+from . import freshness
+from . import search as search_index
+from . import views
+from .models import Tutorial, TutorialCategory
+from .pagecache import cache_anonymous_page, tag_response, category_tag, series_tag, CATEGORIES_TAG
+from .slugs import slug_registry, resolve_for_request, CATEGORY
+
+
+def _prepare(state_func=None):
+	"""
+	Load request.user, and the page's freshness state if given, in one
+	worker-thread hop; condition() and the page cache then read them
+	without touching the database from the event loop.
+	"""
+	def load(request, *args, **kwargs):
+		request.user = get_user(request)
+		if state_func is not None:
+			state_func(request, *args, **kwargs)
+
+	def decorator(view):
+		@wraps(view)
+		async def wrapped(request, *args, **kwargs):
+			await sync_to_async(load)(request, *args, **kwargs)
+			return await view(request, *args, **kwargs)
+		return wrapped
+	return decorator
+
+
+async def _resolve_slug(request, single_slug):
+	"""Async views._resolve_slug()."""
+	for attempt in range(2):
+		if attempt == 0:
+			match = await sync_to_async(resolve_for_request)(request, single_slug)
+		else:
+			match = await sync_to_async(slug_registry.resolve)(single_slug)
+		if match is None:
+			return None, None
+		kind, pk = match
+		if kind == CATEGORY:
+			obj = await TutorialCategory.objects.filter(pk=pk, category_slug=single_slug).afirst()
+		else:
+			obj = await (Tutorial.objects
+				.select_related("tutorial_series__tutorial_category")
+				.defer("tutorial_content")
+				.filter(pk=pk, tutorial_slug=single_slug)
+				.afirst())
+		if obj is not None:
+			return kind, obj
+		await sync_to_async(slug_registry.discard)(single_slug)
+	return None, None
+
+
+@_prepare(freshness.single_slug_state)
+@condition(etag_func=freshness.single_slug_etag,
+           last_modified_func=freshness.single_slug_last_modified)
+@cache_anonymous_page
+async def single_slug(request, single_slug):
+	kind, obj = await _resolve_slug(request, single_slug)
+	if kind == CATEGORY:
+		series_urls = {m: m.part_one_slug async for m in views._category_series(obj)}
+		response = render(request, "main/category.html", {"part_ones": series_urls})
+		return tag_response(response, category_tag(obj.pk),
+		                    *[series_tag(m.pk) for m in series_urls])
+
+	if kind is not None:
+		context = views._tutorial_context(obj, [t async for t in views._series_tutorials(obj)])
+		if context is None:
+			context = await sync_to_async(views._renumbered_tutorial_context)(obj)
+		response = render(request, "main/tutorial.html", context)
+		return tag_response(response, *views._tutorial_tags(obj))
+
+	return render(request, "main/404.html", status=404)
+
+
+@_prepare(freshness.homepage_state)
+@condition(etag_func=freshness.homepage_etag,
+           last_modified_func=freshness.homepage_last_modified)
+@cache_anonymous_page
+async def homepage(request):
+	categories = [c async for c in TutorialCategory.objects.all()]
+	response = render(request, "main/categories.html", {"categories": categories})
+	return tag_response(response, CATEGORIES_TAG)
+
+
+@_prepare()
+async def search(request):
+	query, page = views._search_params(request)
+	results = []
+	total = 0
+
+	if query:
+		offset = (page - 1) * views.SEARCH_PAGE_SIZE
+		backend = search_index.get_search_backend()
+		found = await sync_to_async(backend.search)(query, offset, views.SEARCH_PAGE_SIZE)
+		total = found.total
+		loaded = {kind: await queryset.ain_bulk(pks)
+				  for kind, queryset, pks in views._search_lookups(found.hits)}
+		results = views._search_rows(found.hits, loaded)
+
+	context = views._search_context(query, page, total, results)
+	context["categories"] = [c async for c in context["categories"]]
+	return render(request, "main/search.html", context)
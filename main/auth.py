@@ -0,0 +1,65 @@
+"""
+Authentication backend that keeps User rows in the cache and verifies
+passwords on the bounded main.hashing executor.
+
+AuthenticationMiddleware loads request.user on every request from a
+signed-in visitor. Caching it for AUTH_USER_CACHE_TIMEOUT seconds,
+together with a cache-backed session engine, lets read-only pages skip
+the auth queries entirely. main.signals drops the entry whenever the
+user is saved (profile edits, password changes, last_login) or deleted.
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import get_hasher, identify_hasher
+from django.core.cache import caches
+
+from . import hashing
+
+
+USER_PREFIX = "auth:user:"
+
+
+def _cache():
+	return caches[getattr(settings, "AUTH_USER_CACHE_ALIAS", "default")]
+
+
+def invalidate_cached_user(pk):
+	_cache().delete(f"{USER_PREFIX}{pk}")
+
+
+class CachedModelBackend(ModelBackend):
+
+	def authenticate(self, request, username=None, password=None, **kwargs):
+		UserModel = get_user_model()
+		if username is None:
+			username = kwargs.get(UserModel.USERNAME_FIELD)
+		if username is None or password is None:
+			return None
+		try:
+			user = UserModel._default_manager.get_by_natural_key(username)
+		except UserModel.DoesNotExist:
+			# Hash anyway so that unknown usernames take as long as wrong passwords.
+			hashing.make_password(password)
+			return None
+		if not hashing.check_password(password, user.password) or not self.user_can_authenticate(user):
+			return None
+		preferred = get_hasher("default")
+		if (identify_hasher(user.password).algorithm != preferred.algorithm
+				or preferred.must_update(user.password)):
+			user.password = hashing.make_password(password)
+			user.save(update_fields=["password"])
+		return user
+
+	def get_user(self, user_id):
+		key = f"{USER_PREFIX}{user_id}"
+		cache = _cache()
+		user = cache.get(key)
+		if user is None:
+			user = super().get_user(user_id)
+			if user is None:
+				return None
+			cache.set(key, user, getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 60))
+		# user_can_authenticate() is checked on the way in as well, so a
+		# deactivated user is rejected once their cache entry is dropped.
+		return user if self.user_can_authenticate(user) else None
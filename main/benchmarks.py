@@ -0,0 +1,92 @@
+"""
+Small helpers shared by the benchmark_* management commands.
+
+Each benchmark produces a list of result dicts and writes them as JSON
+next to some run metadata so runs can be diffed over time.
+"""
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from contextlib import ExitStack
+
+import django
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+
+def percentile(values, pct):
+	if not values:
+		return None
+	ordered = sorted(values)
+	index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+	return ordered[index]
+
+
+def measure(name, func, repeat=20, warmup=2, before_each=None):
+	"""
+	Call func repeatedly and report latency percentiles in milliseconds,
+	plus the query count and peak traced memory (KiB) of one more call.
+	before_each runs outside the timed section, e.g. to clear caches.
+	"""
+	for _ in range(warmup):
+		if before_each:
+			before_each()
+		func()
+
+	timings = []
+	for _ in range(repeat):
+		if before_each:
+			before_each()
+		started = time.perf_counter()
+		func()
+		timings.append((time.perf_counter() - started) * 1000)
+
+	# Count queries and trace memory on a separate call so that the
+	# tracing overhead does not skew the timings above.
+	if before_each:
+		before_each()
+	tracemalloc.start()
+	try:
+		# Every alias, so reads a router sends to a replica are counted too.
+		with ExitStack() as stack:
+			captured = [stack.enter_context(CaptureQueriesContext(c)) for c in connections.all()]
+			func()
+		peak = tracemalloc.get_traced_memory()[1]
+	finally:
+		tracemalloc.stop()
+	queries = sum(len(c) for c in captured)
+
+	return {
+		"name": name,
+		"repeat": repeat,
+		"p50_ms": round(statistics.median(timings), 3),
+		"p95_ms": round(percentile(timings, 95), 3),
+		"max_ms": round(max(timings), 3),
+		"queries": queries,
+		"peak_kib": round(peak / 1024, 1),
+	}
+
+
+def format_table(results, columns=("name", "p50_ms", "p95_ms", "queries", "peak_kib")):
+	widths = [max(len(col), *(len(str(r.get(col, ""))) for r in results)) for col in columns]
+	lines = ["  ".join(col.ljust(w) for col, w in zip(columns, widths))]
+	for r in results:
+		lines.append("  ".join(str(r.get(col, "")).ljust(w) for col, w in zip(columns, widths)))
+	return "\n".join(lines)
+
+
+def write_report(path, benchmark, results, **extra):
+	report = {
+		"benchmark": benchmark,
+		"created": timezone.now().isoformat(),
+		"python": platform.python_version(),
+		"django": django.get_version(),
+		"database": connection.vendor,
+		"results": results,
+	}
+	report.update(extra)
+	with open(path, "w") as f:
+		json.dump(report, f, indent=2)
@@ -0,0 +1,231 @@
+"""
+Write-behind queue for contact form submissions.
+
+Validated submissions are appended, with the time they were made, to a
+per-process spool file and written to ContactMessage in bulk_create
+batches by a background thread, once BATCH_SIZE messages are waiting or
+FLUSH_INTERVAL seconds have passed. A flush first renames the spool
+aside, so rows are only dropped from disk after their batch has been
+inserted. A crash between the insert and the unlink can replay a batch,
+so delivery is at-least-once.
+
+Spools are named after a random owner id rather than the PID, and the
+owner holds an flock on <owner>.lock for as long as it lives. The lock
+is released by the kernel when the process dies, so the next flush in
+any process can tell an abandoned spool from a live one even when the
+PID has since been reused.
+"""
+import atexit
+import fcntl
+import glob
+import json
+import logging
+import os
+import threading
+import uuid
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import ContactMessage
+
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("name", "email", "subject", "message")
+
+
+def _owner_alive(spool_dir, owner):
+	"""Whether the process that wrote owner's spools still holds its lock."""
+	try:
+		fd = os.open(os.path.join(spool_dir, f"{owner}.lock"), os.O_RDWR)
+	except FileNotFoundError:
+		return False
+	try:
+		fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+	except BlockingIOError:
+		return True
+	finally:
+		os.close(fd)
+	return False
+
+
+class ContactQueue:
+
+	def __init__(self, spool_dir, batch_size=100, flush_interval=2.0, fsync=True, start_thread=True):
+		self.spool_dir = spool_dir
+		self.batch_size = batch_size
+		self.flush_interval = flush_interval
+		self.fsync = fsync
+		self.start_thread = start_thread
+		self._reset()
+
+	def _reset(self):
+		if getattr(self, "_lock_fd", None) is not None:
+			os.close(self._lock_fd)  # a forked child must not keep its parent's lock alive
+		self._pid = os.getpid()
+		self._owner = uuid.uuid4().hex
+		self._lock_fd = None
+		self._lock = threading.Lock()
+		self._flush_lock = threading.Lock()
+		self._wake = threading.Event()
+		self._spool = None
+		self._waiting = 0
+		self._thread = None
+
+	@property
+	def spool_path(self):
+		return os.path.join(self.spool_dir, f"{self._owner}.jsonl")
+
+	def _hold_owner_lock(self):
+		"""Lock <owner>.lock before any file carrying this owner id is written."""
+		if self._lock_fd is not None:
+			return
+		os.makedirs(self.spool_dir, exist_ok=True)
+		path = os.path.join(self.spool_dir, f"{self._owner}.lock")
+		while True:
+			fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+			fcntl.flock(fd, fcntl.LOCK_EX)
+			try:
+				# Another flush may have swept the file before we locked it.
+				if os.stat(path).st_ino == os.fstat(fd).st_ino:
+					break
+			except FileNotFoundError:
+				pass
+			os.close(fd)
+		self._lock_fd = fd
+
+	def submit(self, data):
+		"""Durably accept one validated submission (a ContactForm.cleaned_data dict)."""
+		if os.getpid() != self._pid:
+			self._reset()  # forked worker: don't share the parent's file or thread
+		record = {field: data[field] for field in FIELDS}
+		record["created_at"] = timezone.now().isoformat()
+		line = json.dumps(record) + "\n"
+		with self._lock:
+			if self._spool is None:
+				self._hold_owner_lock()
+				self._spool = open(self.spool_path, "a", encoding="utf-8")
+			self._spool.write(line)
+			self._spool.flush()
+			if self.fsync:
+				os.fsync(self._spool.fileno())
+			self._waiting += 1
+			full = self._waiting >= self.batch_size
+		if self.start_thread:
+			self._ensure_thread()
+			if full:
+				self._wake.set()
+
+	def _ensure_thread(self):
+		if self._thread is None or not self._thread.is_alive():
+			with self._lock:
+				if self._thread is None or not self._thread.is_alive():
+					self._thread = threading.Thread(target=self._run, name="contact-queue", daemon=True)
+					self._thread.start()
+
+	def _run(self):
+		while True:
+			self._wake.wait(self.flush_interval)
+			self._wake.clear()
+			try:
+				self.flush()
+			except Exception:
+				logger.exception("Flushing contact messages failed; spool kept for retry")
+			finally:
+				close_old_connections()
+
+	def _rotate(self):
+		"""Move the live spool aside so new submissions go to a fresh file."""
+		with self._lock:
+			if self._spool is None:
+				return
+			self._spool.close()
+			self._spool = None
+			self._waiting = 0
+			os.replace(self.spool_path, os.path.join(
+				self.spool_dir, f"{self._owner}.{uuid.uuid4().hex}.flushing"))
+
+	def _claim_orphans(self):
+		"""Take over spools left by processes that are no longer running, and sweep their locks."""
+		orphans = {}
+		for pattern in ("*.jsonl", "*.flushing", "*.lock"):
+			for path in glob.glob(os.path.join(self.spool_dir, pattern)):
+				owner = os.path.basename(path).split(".", 1)[0]
+				if owner != self._owner:
+					orphans.setdefault(owner, []).append(path)
+		for owner, paths in orphans.items():
+			if _owner_alive(self.spool_dir, owner):
+				continue
+			spools = [path for path in paths if not path.endswith(".lock")]
+			if spools:
+				self._hold_owner_lock()
+			for path in spools:
+				try:
+					os.replace(path, os.path.join(
+						self.spool_dir, f"{self._owner}.{uuid.uuid4().hex}.flushing"))
+				except FileNotFoundError:
+					pass  # another process claimed it first
+			try:
+				os.remove(os.path.join(self.spool_dir, f"{owner}.lock"))
+			except FileNotFoundError:
+				pass
+
+	def flush(self):
+		"""Insert every spooled submission owned by this process; returns the row count."""
+		if os.getpid() != self._pid:
+			self._reset()
+		if not os.path.isdir(self.spool_dir):
+			return 0
+		with self._flush_lock:
+			self._rotate()
+			self._claim_orphans()
+			written = 0
+			for path in sorted(glob.glob(os.path.join(self.spool_dir, f"{self._owner}.*.flushing"))):
+				written += self._flush_file(path)
+			return written
+
+	def _flush_file(self, path):
+		rows = []
+		with open(path, encoding="utf-8") as f:
+			for line in f:
+				try:
+					record = json.loads(line)
+					# Lines spooled before created_at was recorded get the flush time.
+					created_at = parse_datetime(record.pop("created_at", "")) or timezone.now()
+					rows.append(ContactMessage(created_at=created_at, **record))
+				except (ValueError, TypeError):
+					logger.warning("Skipping unreadable contact spool line in %s", path)
+		with transaction.atomic():
+			ContactMessage.objects.bulk_create(rows, batch_size=self.batch_size)
+		os.remove(path)
+		return len(rows)
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_contact_queue():
+	global _queue
+	if _queue is None:
+		# Two first requests at once must not start two flusher threads.
+		with _queue_lock:
+			if _queue is None:
+				options = getattr(settings, "CONTACT_QUEUE", {})
+				_queue = ContactQueue(
+					options.get("SPOOL_DIR", os.path.join(settings.BASE_DIR, "var", "contact-spool")),
+					batch_size=options.get("BATCH_SIZE", 100),
+					flush_interval=options.get("FLUSH_INTERVAL", 2.0),
+					fsync=options.get("FSYNC", True))
+				atexit.register(_flush_at_exit)
+	return _queue
+
+
+def _flush_at_exit():
+	try:
+		_queue.flush()
+	except Exception:
+		logger.exception("Could not flush contact messages at exit; they remain spooled")
@@ -0,0 +1,9 @@
+from django.conf import settings
+
+
+def assets(request):
+	return {"vendored_icon_font": getattr(settings, "VENDORED_ICON_FONT", False)}
+
+
+def fragment_cache(request):
+	return {"fragment_cache_timeout": getattr(settings, "FRAGMENT_CACHE_TIMEOUT", 600)}
@@ -0,0 +1,187 @@
+"""
+Static export of the public catalogue for serving from nginx or a CDN.
+
+The homepage, every category page and every tutorial page are rendered
+as an anonymous visitor sees them and written under an output directory:
+the homepage as index.html and each single_slug page as <slug>.html, so
+nginx can serve them with ``try_files $uri $uri.html $uri/index.html``.
+
+A manifest maps each file to a fingerprint of everything it is rendered
+from: the rows' counts and updated_at stamps, as in main.freshness, and
+the templates and built CSS. Re-runs only render pages whose fingerprint
+changed, and remove files for pages that no longer exist.
+"""
+import hashlib
+import json
+import os
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db.models import Count, Max
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+
+from .assets import critical_css_dir
+from .models import RESERVED_SLUGS, Tutorial, TutorialCategory, TutorialSeries
+from .views import _category_series, _tutorial_context
+
+
+MANIFEST_NAME = ".manifest.json"
+HOME = "home"
+CATEGORY = "category"
+SERIES = "series"
+
+
+def export_dir():
+	return getattr(settings, "STATIC_EXPORT_DIR", os.path.join(settings.BASE_DIR, "var", "site"))
+
+
+def page_path(slug):
+	"""
+	Relative file for the page at /<slug>, or None for slugs that cannot be
+	a file name. Reserved slugs are refused too: index.html is the homepage.
+	"""
+	if slug is None:
+		return "index.html"
+	if not slug or "/" in slug or "\\" in slug or slug.startswith(".") or slug.lower() in RESERVED_SLUGS:
+		return None
+	return f"{slug}.html"
+
+
+def _digest(*parts):
+	raw = "|".join(p.isoformat() if hasattr(p, "isoformat") else str(p) for p in parts)
+	return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
+
+def template_version():
+	"""A hash of the templates, the critical CSS and the static manifest every page embeds."""
+	roots = [os.path.join(settings.BASE_DIR, "main", "templates"), critical_css_dir()]
+	files = [os.path.join(settings.STATIC_ROOT, "staticfiles.json")]
+	for root in roots:
+		for directory, _, names in os.walk(root):
+			files += [os.path.join(directory, name) for name in names]
+	digest = hashlib.md5(usedforsecurity=False)
+	for path in sorted(files):
+		if os.path.isfile(path):
+			digest.update(path.encode())
+			with open(path, "rb") as f:
+				digest.update(f.read())
+	return digest.hexdigest()
+
+
+def plan(templates=None):
+	"""
+	Fingerprint every exportable page without rendering any of them.
+
+	Returns (pages, units): pages maps each relative path to its
+	fingerprint, and units lists the (kind, pk, {path: tutorial pk})
+	renders that produce them, one per category and one per series, so
+	a series' sidebar is loaded once for all of its tutorials.
+	"""
+	templates = templates or template_version()
+	categories = {pk: (slug, stamp) for pk, slug, stamp in
+				  TutorialCategory.objects.values_list("pk", "category_slug", "updated_at")}
+	series = {row["pk"]: row for row in TutorialSeries.objects.values("pk", "tutorial_category_id", "updated_at")}
+	series_state = {row["tutorial_series_id"]: (row["n"], row["last"]) for row in
+					Tutorial.objects.order_by().values("tutorial_series_id").annotate(n=Count("pk"), last=Max("updated_at"))}
+
+	pages = {"index.html": _digest(templates, HOME, len(categories),
+								   *sorted((pk, stamp) for pk, (slug, stamp) in categories.items()))}
+	units = [(HOME, None, {"index.html": None})]
+
+	category_parts = defaultdict(list)
+	for pk, row in sorted(series.items()):
+		category_parts[row["tutorial_category_id"]].append((pk, row["updated_at"], *series_state.get(pk, (0, None))))
+	for pk, (slug, stamp) in categories.items():
+		path = page_path(slug)
+		if path is not None:
+			pages[path] = _digest(templates, CATEGORY, pk, slug, stamp, *category_parts[pk])
+			units.append((CATEGORY, pk, {path: None}))
+
+	by_series = defaultdict(dict)
+	for pk, slug, series_id in Tutorial.objects.values_list("pk", "tutorial_slug", "tutorial_series_id").iterator(chunk_size=2000):
+		path = page_path(slug)
+		row = series.get(series_id)
+		if path is None or row is None:
+			continue
+		category_stamp = categories.get(row["tutorial_category_id"], (None, None))[1]
+		pages[path] = _digest(templates, "tutorial", pk, slug, row["updated_at"], category_stamp,
+							  *series_state[series_id])
+		by_series[series_id][path] = pk
+	units += [(SERIES, series_id, paths) for series_id, paths in sorted(by_series.items())]
+	return pages, units
+
+
+def read_manifest(output):
+	try:
+		with open(os.path.join(output, MANIFEST_NAME), encoding="utf-8") as f:
+			return json.load(f)
+	except (FileNotFoundError, ValueError):
+		return {}
+
+
+def write_manifest(output, manifest):
+	_write(output, MANIFEST_NAME, json.dumps(manifest, sort_keys=True, indent=0))
+
+
+def _write(output, path, content):
+	target = os.path.join(output, path)
+	partial = f"{target}.{os.getpid()}.tmp"
+	with open(partial, "w", encoding="utf-8") as f:
+		f.write(content)
+	os.replace(partial, target)
+
+
+def _request(path):
+	request = RequestFactory().get(path)
+	request.user = AnonymousUser()
+	return request
+
+
+def _render_home():
+	return render_to_string("main/categories.html", {"categories": TutorialCategory.objects.all},
+							request=_request("/"))
+
+
+def _render_category(category):
+	series_urls = {m: m.part_one_slug for m in _category_series(category)}
+	return render_to_string("main/category.html", {"part_ones": series_urls},
+							request=_request(f"/{category.category_slug}"))
+
+
+def _render_series(series_id, paths):
+	"""Render the wanted tutorials of one series, as {path: html}."""
+	# The order Tutorial.renumber_series stores, applied in memory so the
+	# export never writes to the database.
+	tutorials = list(Tutorial.objects
+		.filter(tutorial_series_id=series_id)
+		.select_related("tutorial_series__tutorial_category")
+		.defer("tutorial_content")
+		.order_by("tutorial_published", "pk"))
+	for position, tutorial in enumerate(tutorials):
+		tutorial.series_position = position
+	wanted = {pk: path for path, pk in paths.items()}
+	rendered = {}
+	for tutorial in tutorials:
+		path = wanted.get(tutorial.pk)
+		if path is not None:
+			rendered[path] = render_to_string("main/tutorial.html", _tutorial_context(tutorial, tutorials),
+											  request=_request(f"/{tutorial.tutorial_slug}"))
+	return rendered
+
+
+def render_unit(unit, output):
+	"""Render and write one unit from plan(); returns the paths written."""
+	kind, pk, paths = unit
+	if kind == HOME:
+		rendered = {"index.html": _render_home()}
+	elif kind == CATEGORY:
+		category = TutorialCategory.objects.filter(pk=pk).first()
+		rendered = {} if category is None else {path: _render_category(category) for path in paths}
+	else:
+		rendered = _render_series(pk, paths)
+	for path, content in rendered.items():
+		_write(output, path, content)
+	return list(rendered)
+
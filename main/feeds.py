@@ -0,0 +1,227 @@
+"""
+sitemap.xml and the Atom feed, written as streams of chunks.
+
+Rows are read with iterator() and turned into XML a batch at a time, so
+memory does not grow with the number of tutorials. Past SITEMAP_LIMIT
+URLs sitemap.xml becomes a sitemap index. The homepage and categories go
+in one section, and tutorials are bucketed by primary key so that no
+section holds more than the limit.
+
+Generated documents are cached a chunk at a time under the SITEMAP_TAG
+version of main.pagecache, which the page cache signals bump whenever a
+tutorial or category is saved or deleted.
+"""
+from itertools import islice
+from urllib.parse import quote
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F, Max
+from django.http import Http404, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.html import escape
+
+from . import pagecache
+from .models import Tutorial, TutorialCategory, TutorialSeries
+
+
+SITEMAP_LIMIT = 50000
+FEED_SIZE = 20
+FEED_AUTHOR = "Tutorials"
+CHUNK_ROWS = 500
+PAGES_SECTION = "pages"
+
+SITEMAP_HEAD = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+SITEMAP_TAIL = "</urlset>\n"
+INDEX_HEAD = '<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+INDEX_TAIL = "</sitemapindex>\n"
+FEED_HEAD = '<?xml version="1.0" encoding="utf-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom">\n'
+FEED_TAIL = "</feed>\n"
+
+
+def sitemap_limit():
+	return getattr(settings, "SITEMAP_LIMIT", SITEMAP_LIMIT)
+
+
+def _url(base, slug=""):
+	return escape(base + quote(slug))
+
+
+def _url_entry(loc, lastmod):
+	if lastmod is None:
+		return f"<url><loc>{loc}</loc></url>\n"
+	return f"<url><loc>{loc}</loc><lastmod>{lastmod.date().isoformat()}</lastmod></url>\n"
+
+
+def _batched(lines):
+	"""Join lines into chunks of CHUNK_ROWS so the response is not written row by row."""
+	batch = []
+	for line in lines:
+		batch.append(line)
+		if len(batch) >= CHUNK_ROWS:
+			yield "".join(batch)
+			batch = []
+	if batch:
+		yield "".join(batch)
+
+
+def _page_urls(base):
+	yield _url_entry(_url(base), TutorialCategory.objects.aggregate(last=Max("updated_at"))["last"])
+	categories = TutorialCategory.objects.order_by("pk").values_list("category_slug", "updated_at")
+	for slug, updated in categories.iterator(chunk_size=CHUNK_ROWS):
+		yield _url_entry(_url(base, slug), updated)
+
+
+def _tutorial_urls(base, queryset):
+	rows = queryset.order_by("pk").values_list("tutorial_slug", "updated_at")
+	for slug, updated in rows.iterator(chunk_size=CHUNK_ROWS):
+		yield _url_entry(_url(base, slug), updated)
+
+
+def _shards():
+	"""[(bucket, last updated)] for the buckets of SITEMAP_LIMIT primary keys that hold tutorials."""
+	return list(Tutorial.objects.order_by()
+		.annotate(bucket=F("pk") / sitemap_limit())
+		.values_list("bucket")
+		.annotate(last=Max("updated_at"))
+		.order_by("bucket"))
+
+
+def is_sharded():
+	return TutorialCategory.objects.count() + Tutorial.objects.count() + 1 > sitemap_limit()
+
+
+def sitemap_chunks(base):
+	"""The whole sitemap as one urlset, or the sitemap index once it would exceed the limit."""
+	if not is_sharded():
+		yield SITEMAP_HEAD
+		yield from _batched(_page_urls(base))
+		yield from _batched(_tutorial_urls(base, Tutorial.objects.all()))
+		yield SITEMAP_TAIL
+		return
+	yield INDEX_HEAD
+	entries = [(PAGES_SECTION, TutorialCategory.objects.aggregate(last=Max("updated_at"))["last"])]
+	entries += [(str(bucket), last) for bucket, last in _shards()]
+	for section, last in entries:
+		lastmod = f"<lastmod>{last.date().isoformat()}</lastmod>" if last else ""
+		yield f"<sitemap><loc>{_url(base, f'sitemap-{section}.xml')}</loc>{lastmod}</sitemap>\n"
+	yield INDEX_TAIL
+
+
+def _urlset(lines):
+	yield SITEMAP_HEAD
+	yield from _batched(lines)
+	yield SITEMAP_TAIL
+
+
+def section_chunks(base, section):
+	"""
+	One section of a sharded sitemap. Checked before streaming starts, so
+	sections the index does not list raise Http404.
+	"""
+	if not is_sharded():
+		raise Http404
+	if section == PAGES_SECTION:
+		return _urlset(_page_urls(base))
+	if section.isdigit():
+		limit = sitemap_limit()
+		low = int(section) * limit
+		queryset = Tutorial.objects.filter(pk__gte=low, pk__lt=low + limit)
+		if queryset.exists():
+			return _urlset(_tutorial_urls(base, queryset))
+	raise Http404
+
+
+def _timestamp(value):
+	return value.isoformat(timespec="seconds")
+
+
+def _feed_updated():
+	"""The newest tutorial change; failing that the newest category or series change, or now."""
+	updated = Tutorial.objects.aggregate(last=Max("updated_at"))["last"]
+	if updated is None:
+		stamps = [model.objects.aggregate(last=Max("updated_at"))["last"]
+				  for model in (TutorialCategory, TutorialSeries)]
+		updated = max(filter(None, stamps), default=None) or timezone.now()
+	return updated
+
+
+def feed_chunks(base, size=None):
+	"""An Atom feed of the most recently published tutorials."""
+	size = size or getattr(settings, "FEED_SIZE", FEED_SIZE)
+	recent = (Tutorial.objects.order_by("-tutorial_published", "-pk")
+		.values_list("tutorial_title", "tutorial_slug", "tutorial_excerpt", "tutorial_published", "updated_at")[:size])
+	author = escape(getattr(settings, "FEED_AUTHOR", FEED_AUTHOR))
+	yield FEED_HEAD
+	# RFC 4287 requires <updated> and, since entries carry none, a feed <author>.
+	yield (f"<title>Tutorials</title>\n<id>{_url(base)}</id>\n"
+		   f'<link href="{_url(base)}"/>\n<link rel="self" href="{_url(base, "feed.atom")}"/>\n'
+		   f"<updated>{_timestamp(_feed_updated())}</updated>\n<author><name>{author}</name></author>\n")
+	for title, slug, excerpt, published, modified in recent.iterator(chunk_size=CHUNK_ROWS):
+		link = _url(base, slug)
+		yield (f"<entry><title>{escape(title)}</title><link href=\"{link}\"/><id>{link}</id>"
+			   f"<published>{_timestamp(published)}</published><updated>{_timestamp(modified)}</updated>"
+			   f"<summary>{escape(excerpt)}</summary></entry>\n")
+	yield FEED_TAIL
+
+
+def _storing(cache, key, chunks, timeout):
+	"""
+	Encode and yield chunks, storing each one under its own key as it
+	goes. The chunk count is stored last, marking the copy complete.
+	"""
+	count = 0
+	for chunk in chunks:
+		chunk = chunk.encode("utf-8")
+		cache.set(f"{key}:{count}", chunk, timeout)
+		count += 1
+		yield chunk
+	cache.set(key, count, timeout)
+
+
+def _stored(cache, key, count, rebuild):
+	for index in range(count):
+		chunk = cache.get(f"{key}:{index}")
+		if chunk is None:
+			# Evicted mid-document: rebuild the copy and send the rest from it.
+			yield from islice(rebuild(), index, None)
+			return
+		yield chunk
+
+
+async def _async_chunks(chunks):
+	# Pull from the sync generator on the thread that owns the database connection.
+	chunks = iter(chunks)
+	while True:
+		chunk = await sync_to_async(next)(chunks, None)
+		if chunk is None:
+			return
+		yield chunk
+
+
+def streaming_response(chunks, content_type):
+	"""A StreamingHttpResponse for a sync iterator of chunks, under WSGI or ASGI."""
+	if getattr(settings, "ASYNC_VIEWS", False):
+		# Under ASGI a sync iterator would be read into memory before sending.
+		chunks = _async_chunks(chunks)
+	return StreamingHttpResponse(chunks, content_type=f"{content_type}; charset=utf-8")
+
+
+def streaming_xml(request, name, make_chunks, content_type="application/xml"):
+	"""
+	Stream the document make_chunks(base URL) builds, or the copy stored
+	by an earlier request. The copy is kept a chunk per key, so neither
+	path holds the whole document in memory. Keys include the current
+	SITEMAP_TAG version, so any tutorial or category change drops them.
+	"""
+	base = request.build_absolute_uri("/")
+	cache = caches[getattr(settings, "PAGE_CACHE_ALIAS", "default")]
+	key = f"feeds:{name}:{base}:{pagecache.content_version(pagecache.SITEMAP_TAG)}"
+	timeout = getattr(settings, "FEED_CACHE_TIMEOUT", 3600)
+	count = cache.get(key)
+	if count is not None:
+		chunks = _stored(cache, key, count, lambda: _storing(cache, key, make_chunks(base), timeout))
+	else:
+		chunks = _storing(cache, key, make_chunks(base), timeout)
+	return streaming_response(chunks, content_type)
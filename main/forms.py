@@ -1,6 +1,7 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
+from . import hashing
 from .models import ContactMessage
 
 
@@ -11,6 +12,17 @@ class NewUserForm(UserCreationForm):
 		model = User
 		fields = ("username", "email", "password1", "password2")
 
+	def set_password_and_save(self, user, password_field_name="password1", commit=True):
+		# Hash on the bounded executor instead of the request thread. Keep the
+		# raw password on the user, as set_password() does, so save() still
+		# runs the validators' password_changed() hooks.
+		password = self.cleaned_data[password_field_name]
+		user.password = hashing.make_password(password)
+		user._password = password
+		if commit:
+			user.save()
+		return user
+
 	def save(self, commit=True):
 		user = super(NewUserForm, self).save(commit=False)
 		user.email = self.cleaned_data['email']
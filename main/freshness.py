@@ -0,0 +1,103 @@
+import hashlib
+
+from django.db.models import Count, Max
+
+from . import pagecache
+from .models import Tutorial, TutorialCategory
+from .slugs import resolve_for_request, CATEGORY, TUTORIAL
+
+
+def _state(request, key, compute):
+	"""
+	Compute (etag, last_modified) once per request; condition() asks for
+	each validator separately. Pages served from the page cache reuse the
+	state stored with them instead of running the aggregates again.
+	"""
+	cache = request.__dict__.setdefault("_freshness", {})
+	if key not in cache:
+		# A current page-cache entry carries the validators it was sent with.
+		entry = pagecache.current_entry(request)
+		stored = entry.get("freshness", {}) if entry is not None else {}
+		cache[key] = stored[key] if key in stored else compute()
+	return cache[key]
+
+
+def _validators(request, parts, stamps):
+	"""
+	Build validators from the row counts and timestamps a page depends on.
+
+	Counts catch deletions, which leave no newer timestamp behind. Pages
+	for signed-in users differ by user and are only given an ETag.
+	"""
+	messages = getattr(request, "_messages", None)
+	if messages is not None and len(messages) > 0:
+		return None, None
+
+	stamps = [s for s in stamps if s is not None]
+	last_modified = max(stamps) if stamps else None
+	user = getattr(request, "user", None)
+	user_id = user.pk if user is not None and user.is_authenticated else 0
+	raw = "|".join([str(p) for p in parts] + [s.isoformat() for s in stamps] + [f"u{user_id}"])
+	etag = hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+	return etag, (last_modified if not user_id else None)
+
+
+def homepage_state(request):
+	def compute():
+		agg = TutorialCategory.objects.aggregate(n=Count("pk"), last=Max("updated_at"))
+		return _validators(request, ["home", agg["n"]], [agg["last"]])
+	return _state(request, "homepage", compute)
+
+
+def _category_state(request, pk):
+	agg = TutorialCategory.objects.filter(pk=pk).aggregate(
+		category=Max("updated_at"),
+		series_n=Count("tutorialseries", distinct=True),
+		series=Max("tutorialseries__updated_at"),
+		tutorials_n=Count("tutorialseries__tutorial"),
+		tutorials=Max("tutorialseries__tutorial__updated_at"))
+	return _validators(request,
+		["category", pk, agg["series_n"], agg["tutorials_n"]],
+		[agg["category"], agg["series"], agg["tutorials"]])
+
+
+def _tutorial_state(request, pk):
+	series = Tutorial.objects.filter(pk=pk).values("tutorial_series_id")
+	agg = Tutorial.objects.filter(tutorial_series_id__in=series).aggregate(
+		n=Count("pk"),
+		tutorials=Max("updated_at"),
+		series=Max("tutorial_series__updated_at"),
+		category=Max("tutorial_series__tutorial_category__updated_at"))
+	return _validators(request,
+		["tutorial", pk, agg["n"]],
+		[agg["tutorials"], agg["series"], agg["category"]])
+
+
+def single_slug_state(request, single_slug):
+	def compute():
+		match = resolve_for_request(request, single_slug)
+		if match is None:
+			return None, None
+		kind, pk = match
+		if kind == CATEGORY:
+			return _category_state(request, pk)
+		if kind == TUTORIAL:
+			return _tutorial_state(request, pk)
+		return None, None
+	return _state(request, "single_slug", compute)
+
+
+def homepage_etag(request):
+	return homepage_state(request)[0]
+
+
+def homepage_last_modified(request):
+	return homepage_state(request)[1]
+
+
+def single_slug_etag(request, single_slug):
+	return single_slug_state(request, single_slug)[0]
+
+
+def single_slug_last_modified(request, single_slug):
+	return single_slug_state(request, single_slug)[1]
@@ -0,0 +1,76 @@
+"""
+Bounded executor for password hashing.
+
+PBKDF2 is deliberately expensive, so a burst of sign-in attempts would
+otherwise take every worker's CPU. All hashing done for login and
+registration goes through run(): at most MAX_WORKERS hashes run at
+once, at most MAX_QUEUE more wait for a slot, and a caller that cannot
+get one within QUEUE_TIMEOUT seconds gets PasswordHashingBusy instead of
+piling on. Only the pure hasher functions run on the executor; database
+work stays on the request thread and its connection.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+DEFAULTS = {"MAX_WORKERS": max(1, (os.cpu_count() or 2) // 2), "MAX_QUEUE": 16, "QUEUE_TIMEOUT": 2.0}
+
+
+class PasswordHashingBusy(Exception):
+	"""Raised when no hashing slot frees up within the queue timeout."""
+
+
+class BoundedExecutor:
+
+	def __init__(self, max_workers, max_queue, queue_timeout):
+		self.options = (max_workers, max_queue, queue_timeout)
+		self.queue_timeout = queue_timeout
+		self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="password-hashing")
+		self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+
+	def run(self, func, *args):
+		"""Run func(*args) on the executor and return its result."""
+		if not self._slots.acquire(timeout=self.queue_timeout):
+			raise PasswordHashingBusy
+		try:
+			future = self._executor.submit(func, *args)
+		except BaseException:
+			self._slots.release()
+			raise
+		future.add_done_callback(lambda f: self._slots.release())
+		return future.result()
+
+	def shutdown(self):
+		self._executor.shutdown(wait=False)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+	global _executor
+	options = {**DEFAULTS, **getattr(settings, "PASSWORD_HASHING", {})}
+	wanted = (options["MAX_WORKERS"], options["MAX_QUEUE"], options["QUEUE_TIMEOUT"])
+	with _executor_lock:
+		if _executor is None or _executor.options != wanted:
+			if _executor is not None:
+				_executor.shutdown()
+			_executor = BoundedExecutor(*wanted)
+		return _executor
+
+
+def run(func, *args):
+	return get_executor().run(func, *args)
+
+
+def check_password(password, encoded):
+	return run(hashers.check_password, password, encoded)
+
+
+def make_password(password):
+	return run(hashers.make_password, password)
@@ -0,0 +1,234 @@
+"""
+Per-view request metrics kept in process memory.
+
+RequestMetricsMiddleware samples requests and records wall time, DB time,
+query count, template render time and response size into fixed-bucket
+histograms keyed by the resolved URL name (e.g. "main:single_slug").
+"""
+import bisect
+import json
+import os
+import random
+import threading
+import time
+
+from asgiref.local import Local
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.template.backends.django import Template as DjangoTemplate
+
+
+MS_BOUNDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+COUNT_BOUNDS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+BYTES_BOUNDS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+METRICS = {
+	"wall_ms": MS_BOUNDS,
+	"db_ms": MS_BOUNDS,
+	"template_ms": MS_BOUNDS,
+	"queries": COUNT_BOUNDS,
+	"response_bytes": BYTES_BOUNDS,
+}
+
+
+class Histogram:
+	"""Fixed buckets: bucket i counts values <= bounds[i], the last one is overflow."""
+
+	def __init__(self, bounds):
+		self.bounds = bounds
+		self.buckets = [0] * (len(bounds) + 1)
+		self.count = 0
+		self.total = 0.0
+		self.max = 0.0
+
+	def observe(self, value):
+		self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+		self.count += 1
+		self.total += value
+		if value > self.max:
+			self.max = value
+
+	def quantile(self, q):
+		"""Upper bound of the bucket holding the q-th value (max for the overflow bucket)."""
+		if not self.count:
+			return None
+		rank, seen = q * self.count, 0
+		for i, n in enumerate(self.buckets):
+			seen += n
+			if seen >= rank and n:
+				return self.bounds[i] if i < len(self.bounds) else self.max
+		return self.max
+
+	def snapshot(self):
+		return {
+			"count": self.count,
+			"mean": round(self.total / self.count, 3) if self.count else None,
+			"p50": self.quantile(0.5),
+			"p95": self.quantile(0.95),
+			"max": round(self.max, 3),
+			"buckets": dict(zip([str(b) for b in self.bounds] + ["+Inf"], self.buckets)),
+		}
+
+
+class MetricsRegistry:
+
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._views = {}
+
+	def record(self, view_name, sample):
+		with self._lock:
+			histograms = self._views.get(view_name)
+			if histograms is None:
+				histograms = self._views[view_name] = {
+					name: Histogram(bounds) for name, bounds in METRICS.items()}
+			for name, value in sample.items():
+				histograms[name].observe(value)
+
+	def snapshot(self):
+		with self._lock:
+			return {
+				view_name: {name: h.snapshot() for name, h in histograms.items()}
+				for view_name, histograms in sorted(self._views.items())
+			}
+
+	def reset(self):
+		with self._lock:
+			self._views = {}
+
+	def dump(self, path):
+		data = {"pid": os.getpid(), "created": time.time(), "views": self.snapshot()}
+		tmp = f"{path}.{os.getpid()}.tmp"
+		with open(tmp, "w") as f:
+			json.dump(data, f, indent=2)
+		os.replace(tmp, path)
+
+
+metrics = MetricsRegistry()
+
+# Per request: thread-local under WSGI, per task under ASGI.
+_active = Local()
+
+
+class _QueryTimer:
+	"""connection.execute_wrapper hook that adds up query time and count."""
+
+	def __init__(self):
+		self.count = 0
+		self.seconds = 0.0
+
+	def __call__(self, execute, sql, params, many, context):
+		started = time.perf_counter()
+		try:
+			return execute(sql, params, many, context)
+		finally:
+			self.seconds += time.perf_counter() - started
+			self.count += 1
+
+
+def _install_template_timer():
+	"""Wrap the Django template backend once so top-level renders are timed."""
+	if getattr(DjangoTemplate.render, "_timed", False):
+		return
+	original = DjangoTemplate.render
+
+	def render(self, context=None, request=None):
+		sample = getattr(_active, "sample", None)
+		# Form widgets render through this backend too; only time the outermost call.
+		if sample is None or getattr(_active, "rendering", False):
+			return original(self, context, request)
+		_active.rendering = True
+		started = time.perf_counter()
+		try:
+			return original(self, context, request)
+		finally:
+			_active.rendering = False
+			sample["template_ms"] += (time.perf_counter() - started) * 1000
+
+	render._timed = True
+	DjangoTemplate.render = render
+
+
+def _add_query_timer(timer):
+	# Every alias, so reads a router sends to a replica are counted too.
+	for connection in connections.all():
+		connection.execute_wrappers.append(timer)
+
+
+def _remove_query_timer(timer):
+	for connection in connections.all():
+		connection.execute_wrappers.remove(timer)
+
+
+class RequestMetricsMiddleware:
+	"""
+	Record metrics for a sample of requests. Unsampled requests cost one
+	random() call; settings.REQUEST_METRICS_SAMPLE_RATE of 0 turns it off.
+	"""
+
+	sync_capable = True
+	async_capable = True
+
+	def __init__(self, get_response):
+		self.get_response = get_response
+		self.sample_rate = getattr(settings, "REQUEST_METRICS_SAMPLE_RATE", 1.0)
+		self.dump_path = getattr(settings, "REQUEST_METRICS_DUMP_PATH", None)
+		self.dump_interval = getattr(settings, "REQUEST_METRICS_DUMP_INTERVAL", 60)
+		self._last_dump = time.monotonic()
+		_install_template_timer()
+		if iscoroutinefunction(self.get_response):
+			markcoroutinefunction(self)
+
+	def _sampled(self):
+		return self.sample_rate > 0 and random.random() < self.sample_rate
+
+	def __call__(self, request):
+		if iscoroutinefunction(self):
+			return self.__acall__(request)
+		if not self._sampled():
+			return self.get_response(request)
+
+		sample = {"template_ms": 0.0}
+		timer = _QueryTimer()
+		_active.sample = sample
+		started = time.perf_counter()
+		_add_query_timer(timer)
+		try:
+			response = self.get_response(request)
+		finally:
+			_active.sample = None
+			_remove_query_timer(timer)
+		self._record(request, response, sample, timer, started)
+		return response
+
+	async def __acall__(self, request):
+		if not self._sampled():
+			return await self.get_response(request)
+
+		sample = {"template_ms": 0.0}
+		timer = _QueryTimer()
+		_active.sample = sample
+		started = time.perf_counter()
+		# Async views query through sync_to_async, whose thread has its own
+		# connection, so the timer is installed from that thread.
+		await sync_to_async(_add_query_timer)(timer)
+		try:
+			response = await self.get_response(request)
+		finally:
+			_active.sample = None
+			await sync_to_async(_remove_query_timer)(timer)
+		self._record(request, response, sample, timer, started)
+		return response
+
+	def _record(self, request, response, sample, timer, started):
+		sample["wall_ms"] = (time.perf_counter() - started) * 1000
+		sample["db_ms"] = timer.seconds * 1000
+		sample["queries"] = timer.count
+		sample["response_bytes"] = 0 if response.streaming else len(response.content)
+		match = getattr(request, "resolver_match", None)
+		metrics.record(match.view_name if match else "<unresolved>", sample)
+
+		if self.dump_path and time.monotonic() - self._last_dump >= self.dump_interval:
+			self._last_dump = time.monotonic()
+			metrics.dump(self.dump_path)
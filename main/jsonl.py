@@ -0,0 +1,237 @@
+"""
+The tutorial corpus as JSON Lines, for moving content between sites.
+
+Each line is one object with a "type". Categories come first, then
+series, then tutorials, so a reader can resolve every reference from
+lines it has already seen:
+
+	{"type": "category", "slug": ..., "title": ..., "summary": ...}
+	{"type": "series", "category": <category slug>, "title": ..., "summary": ...}
+	{"type": "tutorial", "slug": ..., "title": ..., "published": <ISO 8601>,
+	 "category": <category slug>, "series": <series title>, "format": ..., "content": ...}
+
+Rows are matched by natural key rather than primary key: categories and
+tutorials by slug, and series by (category slug, title), since series
+have no slug. Only the source is exchanged. Rendered HTML, the table of
+contents and series positions are derived on the receiving side.
+"""
+import gzip
+import json
+import sys
+
+from django.db import reset_queries, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import RENDERED_FIELDS, Tutorial, TutorialCategory, TutorialSeries
+from .rendering import FORMATS
+
+
+CATEGORY = "category"
+SERIES = "series"
+TUTORIAL = "tutorial"
+
+CHUNK_ROWS = 2000
+
+# Tutorial columns a record sets, besides the slug it is matched on.
+TUTORIAL_FIELDS = ("tutorial_title", "tutorial_published", "tutorial_series_id", "tutorial_format", "tutorial_content")
+
+
+class InvalidRecord(ValueError):
+	pass
+
+
+def iter_records():
+	"""Yield every category, series and tutorial as a record dict, streaming from the database."""
+	categories = TutorialCategory.objects.order_by("pk").values_list(
+		"category_slug", "tutorial_category", "category_summary")
+	for slug, title, summary in categories.iterator(chunk_size=CHUNK_ROWS):
+		yield {"type": CATEGORY, "slug": slug, "title": title, "summary": summary}
+
+	series = TutorialSeries.objects.order_by("pk").values_list(
+		"tutorial_category__category_slug", "tutorial_series", "series_summary")
+	for category, title, summary in series.iterator(chunk_size=CHUNK_ROWS):
+		yield {"type": SERIES, "category": category, "title": title, "summary": summary}
+
+	tutorials = Tutorial.objects.order_by("pk").values_list(
+		"tutorial_slug", "tutorial_title", "tutorial_published",
+		"tutorial_series__tutorial_category__category_slug", "tutorial_series__tutorial_series",
+		"tutorial_format", "tutorial_content")
+	for slug, title, published, category, series_title, source_format, content in tutorials.iterator(chunk_size=CHUNK_ROWS):
+		yield {"type": TUTORIAL, "slug": slug, "title": title, "published": published.isoformat(),
+			   "category": category, "series": series_title, "format": source_format, "content": content}
+
+
+def open_jsonl(path, mode):
+	"""Open path for text mode "r" or "w": "-" is stdin or stdout, and *.gz is gzipped."""
+	if path == "-":
+		return open((sys.stdin if mode == "r" else sys.stdout).fileno(), mode, encoding="utf-8", closefd=False)
+	if path.endswith(".gz"):
+		return gzip.open(path, mode + "t", encoding="utf-8")
+	return open(path, mode, encoding="utf-8")
+
+
+def dump(record):
+	return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _text(record, key, line, required=True):
+	value = record.get(key)
+	if not isinstance(value, str) or (required and not value):
+		raise InvalidRecord(f"line {line}: {record.get('type')} needs a {key!r} string")
+	return value
+
+
+class Importer:
+	"""
+	Upsert records by natural key, batch_size rows per bulk_create /
+	bulk_update and per transaction. Rows are only written when a field
+	differs, so re-importing the same file changes nothing.
+
+	A tutorial whose source changes has its rendered fields cleared, which
+	marks it for render_tutorials --stale-only. Series positions, the
+	search index and cached pages are refreshed by the caller from
+	touched_series once the import is done; bulk writes skip the signals
+	that normally maintain them.
+	"""
+
+	def __init__(self, batch_size=1000):
+		self.batch_size = batch_size
+		self.counts = {kind: {"created": 0, "updated": 0, "unchanged": 0} for kind in (CATEGORY, SERIES, TUTORIAL)}
+		self.touched_categories = set()
+		self.touched_series = set()
+		self.categories = dict(TutorialCategory.objects.values_list("category_slug", "pk"))
+		self.series = {(category, title): pk for pk, category, title in
+					   TutorialSeries.objects.values_list("pk", "tutorial_category_id", "tutorial_series")}
+		self.pending_kind = None
+		self.pending = []
+
+	def feed(self, record, line):
+		kind = record.get("type") if isinstance(record, dict) else None
+		if kind not in self.counts:
+			raise InvalidRecord(f"line {line}: unknown record type {kind!r}")
+		if kind != self.pending_kind or len(self.pending) >= self.batch_size:
+			self.flush()
+			self.pending_kind = kind
+		self.pending.append((line, record))
+
+	def flush(self):
+		if not self.pending:
+			return
+		pending, self.pending = self.pending, []
+		with transaction.atomic():
+			getattr(self, f"_upsert_{self.pending_kind}")(pending)
+		# Under DEBUG, connection.queries keeps the last 9000 statements, and
+		# bulk inserts carry whole tutorial bodies.
+		reset_queries()
+
+	def _count(self, kind, created, updated, total):
+		self.counts[kind]["created"] += created
+		self.counts[kind]["updated"] += updated
+		self.counts[kind]["unchanged"] += total - created - updated
+
+	def _upsert_category(self, pending):
+		wanted = {}
+		for line, record in pending:
+			wanted[_text(record, "slug", line)] = (_text(record, "title", line), _text(record, "summary", line, False))
+		existing = TutorialCategory.objects.in_bulk(list(wanted), field_name="category_slug")
+		now = timezone.now()
+		new, changed = [], []
+		for slug, (title, summary) in wanted.items():
+			category = existing.get(slug)
+			if category is None:
+				new.append(TutorialCategory(category_slug=slug, tutorial_category=title, category_summary=summary))
+			elif (category.tutorial_category, category.category_summary) != (title, summary):
+				category.tutorial_category, category.category_summary, category.updated_at = title, summary, now
+				changed.append(category)
+		TutorialCategory.objects.bulk_create(new)
+		TutorialCategory.objects.bulk_update(changed, ["tutorial_category", "category_summary", "updated_at"])
+		for category in new + changed:
+			self.categories[category.category_slug] = category.pk
+			self.touched_categories.add(category.pk)
+		self._count(CATEGORY, len(new), len(changed), len(wanted))
+
+	def _category_pk(self, record, line):
+		slug = _text(record, "category", line)
+		if slug not in self.categories:
+			raise InvalidRecord(f"line {line}: unknown category {slug!r}")
+		return self.categories[slug]
+
+	def _upsert_series(self, pending):
+		wanted = {}
+		for line, record in pending:
+			key = (self._category_pk(record, line), _text(record, "title", line))
+			wanted[key] = _text(record, "summary", line, False)
+		pks = [self.series[key] for key in wanted if key in self.series]
+		existing = TutorialSeries.objects.in_bulk(pks)
+		now = timezone.now()
+		new, changed = [], []
+		for (category, title), summary in wanted.items():
+			series = existing.get(self.series.get((category, title)))
+			if series is None:
+				new.append(TutorialSeries(tutorial_category_id=category, tutorial_series=title, series_summary=summary))
+			elif series.series_summary != summary:
+				series.series_summary, series.updated_at = summary, now
+				changed.append(series)
+		TutorialSeries.objects.bulk_create(new)
+		TutorialSeries.objects.bulk_update(changed, ["series_summary", "updated_at"])
+		for series in new + changed:
+			self.series[(series.tutorial_category_id, series.tutorial_series)] = series.pk
+			self.touched_series.add(series.pk)
+			self.touched_categories.add(series.tutorial_category_id)
+		self._count(SERIES, len(new), len(changed), len(wanted))
+
+	def _tutorial_fields(self, record, line):
+		key = (self._category_pk(record, line), _text(record, "series", line))
+		if key not in self.series:
+			raise InvalidRecord(f"line {line}: unknown series {key[1]!r} in category {record['category']!r}")
+		published = parse_datetime(_text(record, "published", line))
+		if published is None:
+			raise InvalidRecord(f"line {line}: published is not an ISO 8601 datetime")
+		if timezone.is_naive(published):
+			published = timezone.make_aware(published)
+		source_format = record.get("format") or FORMATS[0][0]
+		if source_format not in dict(FORMATS):
+			raise InvalidRecord(f"line {line}: unknown format {source_format!r}")
+		return {
+			"tutorial_title": _text(record, "title", line),
+			"tutorial_published": published,
+			"tutorial_series_id": self.series[key],
+			"tutorial_format": source_format,
+			"tutorial_content": _text(record, "content", line, False),
+		}
+
+	def _upsert_tutorial(self, pending):
+		wanted = {}
+		for line, record in pending:
+			wanted[_text(record, "slug", line)] = self._tutorial_fields(record, line)
+		existing = Tutorial.objects.defer(*RENDERED_FIELDS).in_bulk(list(wanted), field_name="tutorial_slug")
+		now = timezone.now()
+		new, changed, resourced = [], [], []
+		for slug, fields in wanted.items():
+			tutorial = existing.get(slug)
+			if tutorial is None:
+				new.append(Tutorial(tutorial_slug=slug, **fields))
+				continue
+			if all(getattr(tutorial, name) == value for name, value in fields.items()):
+				continue
+			source = (tutorial.tutorial_format, tutorial.tutorial_content)
+			# The old series loses a tutorial, so it needs renumbering too.
+			self.touched_series.add(tutorial.tutorial_series_id)
+			for name, value in fields.items():
+				setattr(tutorial, name, value)
+			tutorial.updated_at = now
+			if source != (tutorial.tutorial_format, tutorial.tutorial_content):
+				tutorial.rendered_html, tutorial.tutorial_toc, tutorial.tutorial_excerpt = "", [], ""
+				resourced.append(tutorial)
+			else:
+				changed.append(tutorial)
+		Tutorial.objects.bulk_create(new)
+		Tutorial.objects.bulk_update(changed, [*TUTORIAL_FIELDS, "updated_at"])
+		Tutorial.objects.bulk_update(resourced, [*TUTORIAL_FIELDS, *RENDERED_FIELDS, "updated_at"])
+		self.touched_series.update(tutorial.tutorial_series_id for tutorial in new + changed + resourced)
+		self._count(TUTORIAL, len(new), len(changed) + len(resourced), len(wanted))
+
+	@property
+	def changed(self):
+		return any(counts["created"] or counts["updated"] for counts in self.counts.values())
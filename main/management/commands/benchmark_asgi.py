@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from wsgiref.util import setup_testing_defaults
+
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+from django.test.utils import override_settings
+
+from main.assets import sample_pages
+from main.benchmarks import percentile, format_table, write_report
+
+
+def _wsgi_get(app, url, delay):
+	# A slow client: a sync worker sits blocked until the request has arrived.
+	time.sleep(delay)
+	parts = urlsplit(url)
+	environ = {"PATH_INFO": parts.path, "QUERY_STRING": parts.query, "HTTP_HOST": "localhost"}
+	setup_testing_defaults(environ)
+	status = []
+	body = app(environ, lambda s, headers, exc_info=None: status.append(s))
+	try:
+		for _ in body:
+			pass
+	finally:
+		body.close()
+	return int(status[0].split()[0])
+
+
+async def _asgi_get(app, url, delay):
+	parts = urlsplit(url)
+	scope = {
+		"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+		"method": "GET", "scheme": "http", "path": parts.path, "raw_path": parts.path.encode(),
+		"query_string": parts.query.encode(), "root_path": "",
+		"headers": [(b"host", b"localhost")],
+		"client": ("127.0.0.1", 50000), "server": ("localhost", 80),
+	}
+	requested = False
+	status = []
+
+	async def receive():
+		nonlocal requested
+		if not requested:
+			requested = True
+			await asyncio.sleep(delay)
+			return {"type": "http.request", "body": b"", "more_body": False}
+		# The client never disconnects; Django cancels this wait itself.
+		await asyncio.Event().wait()
+
+	async def send(message):
+		if message["type"] == "http.response.start":
+			status.append(message["status"])
+
+	await app(scope, receive, send)
+	return status[0]
+
+
+def _summary(name, connections_, delay, timings, errors, elapsed):
+	return {
+		"name": name,
+		"connections": connections_,
+		"client_delay_ms": round(delay * 1000),
+		"requests": len(timings),
+		"errors": errors,
+		"rps": round(len(timings) / elapsed, 1),
+		"p50_ms": round(percentile(timings, 50), 3) if timings else None,
+		"p95_ms": round(percentile(timings, 95), 3) if timings else None,
+	}
+
+
+class Command(BaseCommand):
+	help = ("Compare throughput at a fixed number of concurrent connections for the WSGI "
+			"handler on a worker thread pool and the ASGI handler with the async views.")
+
+	def add_arguments(self, parser):
+		parser.add_argument("--connections", type=int, nargs="+", default=[1, 8, 32])
+		parser.add_argument("--workers", type=int, default=4,
+							help="WSGI worker threads, as for a threaded WSGI server.")
+		parser.add_argument("--client-delay-ms", type=float, nargs="+", default=[0, 50],
+							help="How long each simulated client takes to send its request.")
+		parser.add_argument("--duration", type=float, default=5.0, help="Seconds per run.")
+		parser.add_argument("--output", default="bench_output.json")
+
+	def _wsgi(self, urls, clients, delay, workers, duration):
+		app = get_wsgi_application()
+		pool = ThreadPoolExecutor(workers)
+		lock, timings, errors = threading.Lock(), [], [0]
+		deadline = time.monotonic() + duration
+
+		def serve(url):
+			try:
+				return _wsgi_get(app, url, delay)
+			finally:
+				connections.close_all()
+
+		def client(n):
+			i = n
+			while time.monotonic() < deadline:
+				started = time.perf_counter()
+				status = pool.submit(serve, urls[i % len(urls)]).result()
+				with lock:
+					timings.append((time.perf_counter() - started) * 1000)
+					errors[0] += status >= 400 and status != 404
+				i += 1
+
+		started = time.monotonic()
+		threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		pool.shutdown()
+		return _summary("wsgi", clients, delay, timings, errors[0], time.monotonic() - started)
+
+	def _asgi(self, urls, clients, delay, duration):
+		app = get_asgi_application()
+		timings, errors = [], [0]
+
+		async def client(n, deadline):
+			i = n
+			while time.monotonic() < deadline:
+				started = time.perf_counter()
+				status = await _asgi_get(app, urls[i % len(urls)], delay)
+				timings.append((time.perf_counter() - started) * 1000)
+				errors[0] += status >= 400 and status != 404
+				i += 1
+
+		async def run():
+			deadline = time.monotonic() + duration
+			await asyncio.gather(*(client(n, deadline) for n in range(clients)))
+
+		started = time.monotonic()
+		with override_settings(ROOT_URLCONF="my_site.asgi_urls"):
+			asyncio.run(run())
+		return _summary("asgi", clients, delay, timings, errors[0], time.monotonic() - started)
+
+	def handle(self, *args, **options):
+		urls = [url for page, url in sample_pages()]
+		if not urls:
+			raise CommandError("No content to benchmark; run seed_corpus first.")
+
+		results = []
+		with override_settings(DEBUG=False, ALLOWED_HOSTS=["localhost"]):
+			for delay_ms in options["client_delay_ms"]:
+				delay = delay_ms / 1000
+				for clients in options["connections"]:
+					results.append(self._wsgi(urls, clients, delay, options["workers"], options["duration"]))
+					results.append(self._asgi(urls, clients, delay, options["duration"]))
+
+		self.stdout.write(format_table(results, columns=(
+			"name", "connections", "client_delay_ms", "requests", "errors", "rps", "p50_ms", "p95_ms")))
+		write_report(options["output"], "asgi", results, urls=urls, wsgi_workers=options["workers"])
+		self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
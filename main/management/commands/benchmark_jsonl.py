@@ -0,0 +1,113 @@
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from main.benchmarks import format_table, write_report
+from main.management.commands.seed_corpus import clear_seeded
+from main.models import Tutorial, TutorialCategory, TutorialSeries
+
+
+def _sha256(path):
+	digest = hashlib.sha256()
+	with open(path, "rb") as f:
+		for block in iter(lambda: f.read(1 << 20), b""):
+			digest.update(block)
+	return digest.hexdigest()
+
+
+def _records():
+	return TutorialCategory.objects.count() + TutorialSeries.objects.count() + Tutorial.objects.count()
+
+
+class Command(BaseCommand):
+	help = (
+		"Round-trip a seeded corpus through export_tutorials and "
+		"import_tutorials: export, delete the seeded rows, import, import "
+		"again (nothing to change), export again and check both exports "
+		"match. Each step runs in its own process so its peak RSS is its own."
+	)
+
+	def add_arguments(self, parser):
+		parser.add_argument("--tutorials", type=int, default=1_000_000)
+		parser.add_argument("--categories", type=int, default=10)
+		parser.add_argument("--series", type=int, default=100, help="Series per category.")
+		parser.add_argument("--content-size", type=int, default=500,
+							help="Approximate tutorial body size in characters.")
+		parser.add_argument("--batch-size", type=int, default=1000)
+		parser.add_argument("--prefix", default="jsonl")
+		parser.add_argument("--workdir", default=None, help="Where the exports go (default: a temporary directory).")
+		parser.add_argument("--keep", action="store_true", help="Keep the seeded rows and the exports.")
+		parser.add_argument("--output", default="bench_output.json")
+
+	def _step(self, name, *args):
+		"""
+		Run a manage.py command in a child process; returns its wall time and
+		peak RSS in MiB. A child's peak starts at its parent's size, so this
+		process stays small and does no heavy lifting itself.
+		"""
+		started = time.perf_counter()
+		child = subprocess.Popen([sys.executable, os.path.join(settings.BASE_DIR, "manage.py"), *args])
+		_, status, usage = os.wait4(child.pid, 0)
+		child.returncode = os.waitstatus_to_exitcode(status)
+		elapsed = time.perf_counter() - started
+		if child.returncode:
+			raise CommandError(f"{name} failed with exit status {child.returncode}")
+		# ru_maxrss is in KiB on Linux.
+		return elapsed, round(usage.ru_maxrss / 1024, 1)
+
+	def handle(self, *args, **options):
+		per_series = options["tutorials"] // (options["categories"] * options["series"])
+		if per_series < 1:
+			raise CommandError("--tutorials must be at least --categories x --series")
+		prefix = options["prefix"]
+		workdir = options["workdir"] or tempfile.mkdtemp(prefix="jsonl-bench-")
+		os.makedirs(workdir, exist_ok=True)
+		first, second = os.path.join(workdir, "first.jsonl"), os.path.join(workdir, "second.jsonl")
+
+		records = None
+		batch = str(options["batch_size"])
+		seed = ["seed_corpus", "--prefix", prefix, "--clear", "--categories", str(options["categories"]),
+				"--series", str(options["series"]), "--tutorials", str(per_series),
+				"--content-size", str(options["content_size"]), "--batch-size", batch, "--no-render", "--no-reindex"]
+
+		results = []
+		try:
+			steps = [
+				("seed", seed),
+				("export", ["export_tutorials", "--output", first]),
+				("import (new rows)", ["import_tutorials", first, "--batch-size", batch, "--no-render", "--no-reindex"]),
+				("import (unchanged)", ["import_tutorials", first, "--batch-size", batch, "--no-render", "--no-reindex"]),
+				("export again", ["export_tutorials", "--output", second]),
+			]
+			for name, command in steps:
+				if name == "import (new rows)":
+					with transaction.atomic():
+						clear_seeded(prefix)
+				elapsed, rss = self._step(name, *command)
+				records = records or _records()
+				results.append({"name": name, "records": records, "seconds": round(elapsed, 1),
+								"rows_per_s": round(records / elapsed), "peak_rss_mib": rss})
+			matches = _sha256(first) == _sha256(second)
+			size_mib = round(os.path.getsize(first) / 2 ** 20, 1)
+		finally:
+			if not options["keep"]:
+				with transaction.atomic():
+					clear_seeded(prefix)
+				if not options["workdir"]:
+					shutil.rmtree(workdir, ignore_errors=True)
+
+		self.stdout.write(format_table(results, ("name", "records", "seconds", "rows_per_s", "peak_rss_mib")))
+		self.stdout.write(f"Export size {size_mib} MiB; round trip {'matches' if matches else 'DIFFERS'}")
+		write_report(options["output"], "jsonl", results, tutorials=options["categories"] * options["series"] * per_series,
+					 content_size=options["content_size"], export_mib=size_mib, round_trip_matches=matches)
+		self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+		if not matches:
+			raise CommandError("The second export differs from the first.")
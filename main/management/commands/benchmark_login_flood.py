@@ -0,0 +1,87 @@
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.test.utils import override_settings
+
+from main.benchmarks import measure, format_table, write_report
+from main.models import Tutorial
+from main import throttle
+
+
+def _attacker(number, ips, stop, statuses, lock):
+	client = Client()
+	seen = Counter()
+	attempt = 0
+	while not stop.is_set():
+		attempt += 1
+		response = client.post("/login/", {
+			"username": f"victim{attempt % 50}", "password": f"guess-{number}-{attempt}",
+		}, REMOTE_ADDR=f"10.0.{number % 256}.{attempt % ips}")
+		seen[response.status_code] += 1
+	connections.close_all()
+	with lock:
+		statuses.update(seen)
+
+
+class Command(BaseCommand):
+	help = ("Measure tutorial page latency while threads flood /login/ with bad credentials, "
+			"with and without the login throttle and bounded hashing executor.")
+
+	def add_arguments(self, parser):
+		parser.add_argument("--attackers", type=int, default=8, help="Concurrent login flood threads.")
+		parser.add_argument("--ips", type=int, default=1, help="Source addresses per attacker.")
+		parser.add_argument("--flood-seconds", type=float, default=10.0,
+							help="How long the flood runs before tutorial latency is measured.")
+		parser.add_argument("--repeat", type=int, default=30)
+		parser.add_argument("--output", default="bench_output.json")
+
+	def _phase(self, name, path, attackers, ips, repeat, flood_seconds):
+		throttle._configured.clear()
+		stop, lock, statuses = threading.Event(), threading.Lock(), Counter()
+		threads = [threading.Thread(target=_attacker, args=(n, ips, stop, statuses, lock))
+				   for n in range(attackers)]
+		for thread in threads:
+			thread.start()
+		# Let the flood reach a steady state, e.g. drained token buckets.
+		if attackers:
+			stop.wait(flood_seconds)
+		client = Client()
+		page_cache = caches[getattr(settings, "PAGE_CACHE_ALIAS", "default")]
+		try:
+			result = measure(name, lambda: client.get(path), repeat=repeat, before_each=page_cache.clear)
+		finally:
+			stop.set()
+			for thread in threads:
+				thread.join()
+		result["logins"] = sum(statuses.values())
+		result["login_statuses"] = dict(sorted(statuses.items()))
+		return result
+
+	def handle(self, *args, **options):
+		tutorial = Tutorial.objects.order_by("pk").only("tutorial_slug").first()
+		if tutorial is None:
+			raise CommandError("No content to benchmark; run seed_corpus first.")
+		path = f"/{tutorial.tutorial_slug}"
+		attackers, ips, repeat = options["attackers"], options["ips"], options["repeat"]
+		flood_seconds = options["flood_seconds"]
+
+		unprotected = {"LOGIN_THROTTLE": None,
+					   "PASSWORD_HASHING": {"MAX_WORKERS": attackers, "MAX_QUEUE": 0, "QUEUE_TIMEOUT": None}}
+		results = []
+		with override_settings(DEBUG=False):
+			results.append(self._phase("idle", path, 0, ips, repeat, flood_seconds))
+			with override_settings(**unprotected):
+				results.append(self._phase("flood:unprotected", path, attackers, ips, repeat, flood_seconds))
+			results.append(self._phase("flood:protected", path, attackers, ips, repeat, flood_seconds))
+
+		self.stdout.write(format_table(results, columns=(
+			"name", "p50_ms", "p95_ms", "max_ms", "logins", "login_statuses")))
+		write_report(options["output"], "login_flood", results,
+					 attackers=attackers, password_hashing=getattr(settings, "PASSWORD_HASHING", {}),
+					 login_throttle=getattr(settings, "LOGIN_THROTTLE", None))
+		self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
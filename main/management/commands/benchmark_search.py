@@ -0,0 +1,34 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from main.search import LikeSearchBackend, get_search_backend
+
+
+DEFAULT_QUERIES = ["a", "python", "django models", "tutorial", "install", "zzzz"]
+
+
+class Command(BaseCommand):
+	help = "Compare query latency of the configured search backend against the LIKE scan."
+
+	def add_arguments(self, parser):
+		parser.add_argument("queries", nargs="*", default=DEFAULT_QUERIES)
+		parser.add_argument("--repeat", type=int, default=20)
+		parser.add_argument("--limit", type=int, default=20)
+
+	def _time(self, backend, query, repeat, limit):
+		timings = []
+		for _ in range(repeat):
+			started = time.perf_counter()
+			page = backend.search(query, 0, limit)
+			timings.append((time.perf_counter() - started) * 1000)
+		return page.total, statistics.median(timings), max(timings)
+
+	def handle(self, *args, **options):
+		backends = [("like", LikeSearchBackend()), ("indexed", get_search_backend())]
+		self.stdout.write(f"{'query':<20} {'backend':<8} {'hits':>8} {'p50 ms':>10} {'max ms':>10}")
+		for query in options["queries"]:
+			for name, backend in backends:
+				total, p50, worst = self._time(backend, query, options["repeat"], options["limit"])
+				self.stdout.write(f"{query:<20} {name:<8} {total:>8} {p50:>10.2f} {worst:>10.2f}")
@@ -0,0 +1,102 @@
+import multiprocessing
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from main.benchmarks import percentile, format_table, write_report
+from main.models import ContactMessage, Tutorial
+
+
+BENCH_SUBJECT = "benchmark_sqlite_concurrency"
+
+
+def _reader(slugs, duration, results):
+	connections.close_all()
+	rng = random.Random()
+	timings = []
+	deadline = time.monotonic() + duration
+	while time.monotonic() < deadline:
+		started = time.perf_counter()
+		tutorial = (Tutorial.objects
+			.select_related("tutorial_series__tutorial_category")
+			.get(tutorial_slug=rng.choice(slugs)))
+		list(Tutorial.objects
+			.filter(tutorial_series_id=tutorial.tutorial_series_id)
+			.order_by("series_position")
+			.only("tutorial_title", "tutorial_slug"))
+		timings.append((time.perf_counter() - started) * 1000)
+	connections.close_all()
+	results.put(("reader", timings))
+
+
+def _writer(duration, results):
+	connections.close_all()
+	timings = []
+	deadline = time.monotonic() + duration
+	while time.monotonic() < deadline:
+		started = time.perf_counter()
+		ContactMessage.objects.create(
+			name="Bench", email="bench@example.com",
+			subject=BENCH_SUBJECT, message="x" * 500)
+		timings.append((time.perf_counter() - started) * 1000)
+	connections.close_all()
+	results.put(("writer", timings))
+
+
+class Command(BaseCommand):
+	help = ("Measure tutorial read throughput with and without concurrent contact-form "
+			"writes. Run once per database profile (DJANGO_DB_PROFILE) to compare them.")
+
+	def add_arguments(self, parser):
+		parser.add_argument("--readers", type=int, default=4)
+		parser.add_argument("--writers", type=int, default=1)
+		parser.add_argument("--duration", type=float, default=5.0, help="Seconds per phase.")
+		parser.add_argument("--output", default="bench_output.json")
+
+	def _phase(self, name, slugs, readers, writers, duration):
+		ctx = multiprocessing.get_context("fork")
+		results = ctx.Queue()
+		procs = [ctx.Process(target=_reader, args=(slugs, duration, results)) for _ in range(readers)]
+		procs += [ctx.Process(target=_writer, args=(duration, results)) for _ in range(writers)]
+		for p in procs:
+			p.start()
+		collected = {"reader": [], "writer": []}
+		for _ in procs:
+			role, timings = results.get()
+			collected[role].extend(timings)
+		for p in procs:
+			p.join()
+
+		reads, writes = collected["reader"], collected["writer"]
+		return {
+			"name": name,
+			"reads_per_s": round(len(reads) / duration, 1),
+			"read_p50_ms": round(percentile(reads, 50), 3) if reads else None,
+			"read_p95_ms": round(percentile(reads, 95), 3) if reads else None,
+			"writes_per_s": round(len(writes) / duration, 1),
+			"write_p95_ms": round(percentile(writes, 95), 3) if writes else None,
+		}
+
+	def handle(self, *args, **options):
+		slugs = list(Tutorial.objects.values_list("tutorial_slug", flat=True)[:5000])
+		if not slugs:
+			raise CommandError("No tutorials to read; run seed_corpus first.")
+		with connection.cursor() as cursor:
+			cursor.execute("PRAGMA journal_mode")
+			journal_mode = cursor.fetchone()[0]
+		connections.close_all()
+
+		results = [
+			self._phase("readers", slugs, options["readers"], 0, options["duration"]),
+			self._phase("readers+writers", slugs, options["readers"], options["writers"], options["duration"]),
+		]
+		ContactMessage.objects.filter(subject=BENCH_SUBJECT).delete()
+
+		self.stdout.write(f"journal_mode={journal_mode}")
+		self.stdout.write(format_table(results, columns=(
+			"name", "reads_per_s", "read_p50_ms", "read_p95_ms", "writes_per_s", "write_p95_ms")))
+		write_report(options["output"], "sqlite_concurrency", results,
+					 journal_mode=journal_mode, readers=options["readers"], writers=options["writers"])
+		self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
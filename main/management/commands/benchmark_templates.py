@@ -0,0 +1,66 @@
+import copy
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+
+from main.assets import sample_pages
+from main.benchmarks import measure, format_table, write_report
+from main.models import Tutorial
+
+
+def _uncached_templates():
+	"""settings.TEMPLATES with the cached loader unwrapped."""
+	templates = copy.deepcopy(settings.TEMPLATES)
+	for engine in templates:
+		loaders = []
+		for loader in engine.get("OPTIONS", {}).get("loaders", []):
+			if isinstance(loader, (list, tuple)) and loader[0].endswith("cached.Loader"):
+				loaders += loader[1]
+			else:
+				loaders.append(loader)
+		engine.setdefault("OPTIONS", {})["loaders"] = loaders
+	return templates
+
+
+class Command(BaseCommand):
+	help = (
+		"Time full page renders for a signed-in user (so the page cache is "
+		"bypassed) with and without the cached template loader and the "
+		"fragment cache, and write a JSON report."
+	)
+
+	def add_arguments(self, parser):
+		parser.add_argument("--repeat", type=int, default=50)
+		parser.add_argument("--output", default="bench_output.json")
+
+	def handle(self, *args, **options):
+		pages = sample_pages()
+		if not pages:
+			raise CommandError("No content to benchmark; run seed_corpus first.")
+		modes = [
+			("no cached loader, no fragments", {"TEMPLATES": _uncached_templates(), "FRAGMENT_CACHE_TIMEOUT": 0}),
+			("cached loader, no fragments", {"FRAGMENT_CACHE_TIMEOUT": 0}),
+			("cached loader + fragments", {}),
+		]
+
+		results = []
+		with transaction.atomic():
+			# The session and user only exist for the run.
+			user = User.objects.create_user("template-benchmark", password=None)
+			client = Client()
+			client.force_login(user)
+			for mode, overrides in modes:
+				with override_settings(DEBUG=False, **overrides):
+					for page, url in pages:
+						result = measure(f"{page} [{mode}]", lambda: client.get(url), repeat=options["repeat"])
+						result.update(page=page, mode=mode)
+						results.append(result)
+			transaction.set_rollback(True)
+
+		self.stdout.write(format_table(results))
+		write_report(options["output"], "templates", results, tutorials=Tutorial.objects.count())
+		self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
@@ -0,0 +1,63 @@
+from django.core.cache import caches
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+
+from main.benchmarks import measure, format_table, write_report
+from main.models import Tutorial, TutorialCategory
+
+
+class Command(BaseCommand):
+	help = "Benchmark the main views through the test client and write a JSON report."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--repeat", type=int, default=20)
+		parser.add_argument("--query", default="python", help="Search term to benchmark.")
+		parser.add_argument("--warm-cache", action="store_true",
+							help="Let the page cache serve repeats instead of clearing it per request.")
+		parser.add_argument("--output", default="bench_output.json")
+
+	def _scenarios(self, client, query):
+		category = TutorialCategory.objects.order_by("pk").first()
+		tutorial = (Tutorial.objects.order_by("tutorial_series_id", "series_position")
+			.only("tutorial_slug").first())
+		if category is None or tutorial is None:
+			raise CommandError("No content to benchmark; run seed_corpus first.")
+
+		def contact_post():
+			# handle() turns the spool and the throttle off, so this times
+			# the insert itself and the rollback undoes it.
+			with transaction.atomic():
+				response = client.post("/contact/", {
+					"name": "Bench", "email": "bench@example.com",
+					"subject": "Benchmark", "message": "Benchmark message."})
+				transaction.set_rollback(True)
+			if response.status_code != 302:
+				raise CommandError(f"contact:post returned {response.status_code}")
+
+		return [
+			("homepage", lambda: client.get("/")),
+			("single_slug:category", lambda: client.get(f"/{category.category_slug}")),
+			("single_slug:tutorial", lambda: client.get(f"/{tutorial.tutorial_slug}")),
+			("search", lambda: client.get("/search/", {"q": query})),
+			("contact:get", lambda: client.get("/contact/")),
+			("contact:post", contact_post),
+		]
+
+	def handle(self, *args, **options):
+		client = Client()
+		cache = caches[getattr(settings, "PAGE_CACHE_ALIAS", "default")]
+		before_each = None if options["warm_cache"] else cache.clear
+
+		results = []
+		with override_settings(DEBUG=False, CONTACT_QUEUE={"ENABLED": False}, CONTACT_THROTTLE=None):
+			for name, func in self._scenarios(client, options["query"]):
+				results.append(measure(name, func, repeat=options["repeat"], before_each=before_each))
+
+		self.stdout.write(format_table(results))
+		write_report(options["output"], "views", results,
+					 tutorials=Tutorial.objects.count(),
+					 warm_cache=options["warm_cache"])
+		self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
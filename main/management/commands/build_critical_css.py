@@ -0,0 +1,51 @@
+import os
+
+from django.conf import settings
+from django.core.cache import caches
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+
+from main.assets import FOLD_CHARS, critical_css, critical_css_dir, sample_pages
+from main.templatetags.stylesheets import STYLESHEETS
+
+
+class Command(BaseCommand):
+	help = "Extract the above-the-fold CSS of each page type for header.html to inline."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--fold", type=int, default=FOLD_CHARS,
+							help="Characters of <body> treated as above the fold.")
+		parser.add_argument("--output-dir", default=None)
+
+	def handle(self, *args, **options):
+		pages = sample_pages()
+		if not pages:
+			raise CommandError("No content to render; run seed_corpus first.")
+
+		css = []
+		for name in STYLESHEETS:
+			path = finders.find(name)
+			if path is None:
+				raise CommandError(f"Static file {name} not found.")
+			with open(path, encoding="utf-8") as f:
+				css.append(f.read())
+		css = "\n".join(css)
+
+		output_dir = options["output_dir"] or critical_css_dir()
+		os.makedirs(output_dir, exist_ok=True)
+		client = Client()
+		caches[getattr(settings, "PAGE_CACHE_ALIAS", "default")].clear()
+		# Render with the blocking stylesheets so the page markup is what
+		# the extractor sees, not a previous build.
+		with override_settings(CRITICAL_CSS=False, DEBUG=False):
+			for page, url in pages:
+				response = client.get(url)
+				if response.status_code != 200:
+					raise CommandError(f"{url} returned {response.status_code}.")
+				critical = critical_css(css, response.content.decode(response.charset), options["fold"])
+				with open(os.path.join(output_dir, f"{page}.css"), "w", encoding="utf-8") as f:
+					f.write(critical + "\n")
+				self.stdout.write(f"{page}: {len(critical.encode())} bytes from {url}")
+		self.stdout.write(self.style.SUCCESS(f"Wrote critical CSS to {output_dir}"))
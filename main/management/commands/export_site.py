@@ -0,0 +1,89 @@
+import multiprocessing
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from main import export
+
+
+def _render(job):
+	unit, output = job
+	return export.render_unit(unit, output)
+
+
+def _split(units, batch_size):
+	"""Cap each series unit at batch_size tutorials so long series spread over workers."""
+	for kind, pk, paths in units:
+		items = list(paths.items())
+		for start in range(0, max(len(items), 1), batch_size):
+			yield kind, pk, dict(items[start:start + batch_size])
+
+
+class Command(BaseCommand):
+	help = (
+		"Render the homepage, category pages and tutorial pages to static "
+		"files. Only pages whose content or templates changed since the last "
+		"export are rendered again."
+	)
+
+	def add_arguments(self, parser):
+		parser.add_argument("--output", default=None, help="Directory to write to (default: STATIC_EXPORT_DIR).")
+		parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+		parser.add_argument("--batch-size", type=int, default=200,
+							help="Tutorials rendered per task.")
+		parser.add_argument("--force", action="store_true", help="Ignore the manifest and render every page.")
+
+	def handle(self, *args, **options):
+		if options["processes"] < 1 or options["batch_size"] < 1:
+			raise CommandError("--processes and --batch-size must be positive")
+		output = options["output"] or export.export_dir()
+		os.makedirs(output, exist_ok=True)
+
+		started = time.perf_counter()
+		pages, units = export.plan()
+		previous = {} if options["force"] else export.read_manifest(output)
+		stale = {path for path, fingerprint in pages.items()
+				 if previous.get(path) != fingerprint or not os.path.exists(os.path.join(output, path))}
+		units = [(kind, pk, {path: value for path, value in paths.items() if path in stale})
+				 for kind, pk, paths in units]
+		jobs = [(unit, output) for unit in _split([u for u in units if u[2]], options["batch_size"])]
+		planned = time.perf_counter() - started
+
+		manifest = {path: fingerprint for path, fingerprint in previous.items()
+					if path in pages and path not in stale}
+		written = 0
+		try:
+			if options["processes"] == 1 or len(jobs) <= 1:
+				results = map(_render, jobs)
+				written = self._record(results, pages, manifest)
+			else:
+				# Forked workers must open their own database connections.
+				connections.close_all()
+				with multiprocessing.get_context("fork").Pool(options["processes"]) as pool:
+					written = self._record(pool.imap_unordered(_render, jobs), pages, manifest)
+		finally:
+			# Whatever was written is recorded, so an interrupted run resumes.
+			export.write_manifest(output, manifest)
+
+		removed = 0
+		for path in set(previous) - set(pages):
+			try:
+				os.remove(os.path.join(output, path))
+				removed += 1
+			except FileNotFoundError:
+				pass
+
+		elapsed = time.perf_counter() - started
+		self.stdout.write(self.style.SUCCESS(
+			f"Wrote {written} of {len(pages)} pages and removed {removed} to {output} "
+			f"in {elapsed:.1f}s ({planned:.1f}s planning)"))
+
+	def _record(self, results, pages, manifest):
+		written = 0
+		for paths in results:
+			for path in paths:
+				manifest[path] = pages[path]
+			written += len(paths)
+		return written
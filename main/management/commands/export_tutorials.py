@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from main import jsonl
+
+
+class Command(BaseCommand):
+	help = (
+		"Write every category, series and tutorial as JSON Lines, streaming "
+		"from the database so memory stays flat however large the corpus is. "
+		"See main.jsonl for the format."
+	)
+
+	def add_arguments(self, parser):
+		parser.add_argument("--output", default="-",
+							help='File to write, gzipped if it ends in .gz (default: "-", stdout).')
+
+	def handle(self, *args, **options):
+		started = time.perf_counter()
+		total = 0
+		with jsonl.open_jsonl(options["output"], "w") as f:
+			for record in jsonl.iter_records():
+				f.write(jsonl.dump(record))
+				total += 1
+		elapsed = time.perf_counter() - started
+		# Keep stdout clean when it carries the export itself.
+		report = self.stderr if options["output"] == "-" else self.stdout
+		report.write(self.style.SUCCESS(
+			f"Exported {total} records in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.0f} rows/s)"))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from main.models import Tutorial, TutorialCategory
+from main.slug_cleanup import apply_slug_fixes, plan_category_slugs, plan_tutorial_slugs
+
+
+class Command(BaseCommand):
+	help = "Find and fix duplicate, blank, placeholder ('1') or reserved ('index') category and tutorial slugs."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--dry-run", action="store_true", help="Only report what would change.")
+
+	def handle(self, *args, **options):
+		with transaction.atomic():
+			category_changes = plan_category_slugs()
+			tutorial_changes = plan_tutorial_slugs(category_changes)
+			# Read the current slugs before the fixes rewrite them.
+			old = {
+				"category": dict(TutorialCategory.objects.filter(pk__in=category_changes).values_list("pk", "category_slug")),
+				"tutorial": dict(Tutorial.objects.filter(pk__in=tutorial_changes).values_list("pk", "tutorial_slug")),
+			}
+			if not options["dry_run"]:
+				apply_slug_fixes(category_changes, tutorial_changes)
+
+		for label, changes in (("category", category_changes), ("tutorial", tutorial_changes)):
+			for pk, slug in changes.items():
+				self.stdout.write(f"{label} {pk}: {old[label].get(pk)!s} -> {slug}")
+
+		verb = "Would fix" if options["dry_run"] else "Fixed"
+		self.stdout.write(self.style.SUCCESS(
+			f"{verb} {len(category_changes)} category and {len(tutorial_changes)} tutorial slugs"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from main.contact_queue import get_contact_queue
+
+
+class Command(BaseCommand):
+	help = "Insert contact messages left in spool files by stopped or crashed workers."
+
+	def handle(self, *args, **options):
+		written = get_contact_queue().flush()
+		self.stdout.write(self.style.SUCCESS(f"Inserted {written} spooled contact messages"))
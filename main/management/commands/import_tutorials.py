@@ -0,0 +1,74 @@
+import json
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from main import jsonl, pagecache
+from main.models import Tutorial
+from main.search import get_search_backend
+from main.slugs import slug_registry
+
+
+class Command(BaseCommand):
+	help = (
+		"Create or update categories, series and tutorials from a JSON Lines "
+		"export, matching rows by slug (series by category and title). Each "
+		"batch commits on its own, so an import that stops on a bad line can "
+		"be fixed and re-run; rows already imported are left unchanged."
+	)
+
+	def add_arguments(self, parser):
+		parser.add_argument("path", help='File to read, gzipped if it ends in .gz, or "-" for stdin.')
+		parser.add_argument("--batch-size", type=int, default=1000,
+							help="Rows per bulk write and per transaction.")
+		parser.add_argument("--no-render", action="store_true",
+							help="Leave new and edited tutorials unrendered, for render_tutorials --stale-only.")
+		parser.add_argument("--no-reindex", action="store_true",
+							help="Skip rebuilding the search index afterwards.")
+
+	def handle(self, *args, **options):
+		if options["batch_size"] < 1:
+			raise CommandError("--batch-size must be positive")
+		started = time.perf_counter()
+		importer = jsonl.Importer(batch_size=options["batch_size"])
+		total = 0
+		try:
+			with jsonl.open_jsonl(options["path"], "r") as f:
+				for line, text in enumerate(f, 1):
+					if not text.strip():
+						continue
+					try:
+						record = json.loads(text)
+					except ValueError as e:
+						raise jsonl.InvalidRecord(f"line {line}: {e}")
+					importer.feed(record, line)
+					total += 1
+			importer.flush()
+		except (jsonl.InvalidRecord, OSError) as e:
+			raise CommandError(f"{e} (earlier batches were committed)")
+		finally:
+			# Whatever was committed still needs its derived state refreshed.
+			self._refresh(importer, options)
+		elapsed = time.perf_counter() - started
+
+		for kind, counts in importer.counts.items():
+			self.stdout.write(f"{kind}: {counts['created']} created, {counts['updated']} updated, "
+							  f"{counts['unchanged']} unchanged")
+		self.stdout.write(self.style.SUCCESS(
+			f"Imported {total} records in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.0f} rows/s)"))
+
+	def _refresh(self, importer, options):
+		if not importer.changed:
+			return
+		# Bulk writes skip the signals, so redo what they normally maintain.
+		Tutorial.renumber_many_series(importer.touched_series)
+		slug_registry.clear()
+		pagecache.invalidate(
+			pagecache.CATEGORIES_TAG, pagecache.SITEMAP_TAG,
+			*(pagecache.category_tag(pk) for pk in importer.touched_categories),
+			*(pagecache.series_tag(pk) for pk in importer.touched_series))
+		if not options["no_render"]:
+			call_command("render_tutorials", stale_only=True, no_reindex=True, stdout=self.stdout)
+		if not options["no_reindex"]:
+			get_search_backend().rebuild()
@@ -0,0 +1,95 @@
+import gzip
+import re
+
+from django.conf import settings
+from django.core.cache import caches
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+
+from main.assets import sample_pages
+from main.benchmarks import format_table, write_report
+
+
+# <link rel="stylesheet"> in <head>, ignoring the <noscript> fallbacks.
+_NOSCRIPT = re.compile(r"<noscript>.*?</noscript>", re.S)
+_LINK = re.compile(r"<link\b[^>]*>")
+_HREF = re.compile(r"""\shref=["']([^"']+)["']""")
+_REL_STYLESHEET = re.compile(r"""\srel=["']stylesheet["']""")
+
+
+def blocking_stylesheets(head):
+	head = _NOSCRIPT.sub("", head)
+	hrefs = []
+	for tag in _LINK.findall(head):
+		href = _HREF.search(tag)
+		if href and _REL_STYLESHEET.search(tag):
+			hrefs.append(href.group(1))
+	return hrefs
+
+
+def static_bytes(href):
+	"""The bytes served for a same-origin static href, or None for other URLs."""
+	if not href.startswith(settings.STATIC_URL):
+		return None
+	name = href[len(settings.STATIC_URL):]
+	if settings.STATIC_ROOT and staticfiles_storage.exists(name):
+		with staticfiles_storage.open(name) as f:
+			return f.read()
+	path = finders.find(name)
+	if path is None:
+		return None
+	with open(path, "rb") as f:
+		return f.read()
+
+
+class Command(BaseCommand):
+	help = ("Report the bytes a browser must fetch before first paint for each page type: "
+			"the HTML <head> plus every render-blocking stylesheet.")
+
+	def add_arguments(self, parser):
+		parser.add_argument("--output", default="bench_output.json")
+
+	def measure(self, client, page, url, mode):
+		response = client.get(url)
+		if response.status_code != 200:
+			raise CommandError(f"{url} returned {response.status_code}.")
+		html = response.content
+		head = html[:html.find(b"</head>") + len(b"</head>")]
+		blocking, external = [head], 0
+		for href in blocking_stylesheets(head.decode(response.charset)):
+			data = static_bytes(href)
+			if data is None:
+				external += 1
+			else:
+				blocking.append(data)
+		return {
+			"name": page,
+			"mode": mode,
+			"head_bytes": len(head),
+			"css_bytes": sum(len(data) for data in blocking[1:]),
+			"total_bytes": sum(len(data) for data in blocking),
+			"total_gzip": sum(len(gzip.compress(data)) for data in blocking),
+			"external_css": external,
+		}
+
+	def handle(self, *args, **options):
+		pages = sample_pages()
+		if not pages:
+			raise CommandError("No content to render; run seed_corpus first.")
+
+		client = Client()
+		page_cache = caches[getattr(settings, "PAGE_CACHE_ALIAS", "default")]
+		results = []
+		for mode, enabled in (("blocking", False), ("critical", True)):
+			page_cache.clear()
+			with override_settings(CRITICAL_CSS=enabled, DEBUG=False):
+				for page, url in pages:
+					results.append(self.measure(client, page, url, mode))
+
+		self.stdout.write(format_table(results, columns=(
+			"name", "mode", "head_bytes", "css_bytes", "total_bytes", "total_gzip", "external_css")))
+		write_report(options["output"], "first_paint", results)
+		self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
@@ -0,0 +1,16 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from main.search import get_search_backend
+
+
+class Command(BaseCommand):
+	help = "Rebuild the full-text search index from tutorials, series and categories."
+
+	def handle(self, *args, **options):
+		started = time.perf_counter()
+		count = get_search_backend().rebuild()
+		elapsed = time.perf_counter() - started
+		self.stdout.write(self.style.SUCCESS(
+			f"Indexed {count or 0} documents in {elapsed:.2f}s"))
@@ -0,0 +1,83 @@
+import multiprocessing
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from main import pagecache
+from main.models import RENDERED_FIELDS, Tutorial, make_excerpt
+from main.rendering import render_content
+from main.search import get_search_backend
+
+
+def _render(row):
+	pk, source_format, content = row
+	rendered = render_content(content, source_format)
+	return pk, rendered.html, rendered.toc, make_excerpt(rendered.html)
+
+
+class Command(BaseCommand):
+	help = (
+		"Re-render every tutorial body (e.g. after changing the sanitizer or "
+		"highlighting). Rendering runs in worker processes; this process is "
+		"the only one writing to the database."
+	)
+
+	def add_arguments(self, parser):
+		parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+		parser.add_argument("--batch-size", type=int, default=500)
+		parser.add_argument("--stale-only", action="store_true",
+							help="Only tutorials that have never been rendered.")
+		parser.add_argument("--no-reindex", action="store_true",
+							help="Skip rebuilding the search index afterwards.")
+
+	def handle(self, *args, **options):
+		if options["processes"] < 1 or options["batch_size"] < 1:
+			raise CommandError("--processes and --batch-size must be positive")
+		batch_size = options["batch_size"]
+		queryset = Tutorial.objects.order_by("pk")
+		if options["stale_only"]:
+			queryset = queryset.filter(rendered_html="")
+		rows = queryset.values_list("pk", "tutorial_format", "tutorial_content").iterator(chunk_size=batch_size)
+
+		started = time.perf_counter()
+		total = 0
+		if options["processes"] == 1:
+			total = self._write(map(_render, rows), batch_size)
+		else:
+			# fork, so workers inherit the configured settings without a second django.setup().
+			context = multiprocessing.get_context("fork")
+			with context.Pool(options["processes"]) as pool:
+				total = self._write(pool.imap(_render, rows, chunksize=max(batch_size // options["processes"], 1)), batch_size)
+		elapsed = time.perf_counter() - started
+
+		if total and not options["no_reindex"]:
+			get_search_backend().rebuild()
+		self.stdout.write(self.style.SUCCESS(f"Rendered {total} tutorials in {elapsed:.1f}s"))
+
+	def _write(self, results, batch_size):
+		total, pending = 0, []
+		for pk, body, toc, excerpt in results:
+			pending.append(Tutorial(pk=pk, rendered_html=body, tutorial_toc=toc, tutorial_excerpt=excerpt))
+			if len(pending) >= batch_size:
+				total += self._flush(pending)
+				pending = []
+		if pending:
+			total += self._flush(pending)
+		return total
+
+	def _flush(self, tutorials):
+		now = timezone.now()
+		for tutorial in tutorials:
+			tutorial.updated_at = now
+		with transaction.atomic():
+			Tutorial.objects.bulk_update(tutorials, [*RENDERED_FIELDS, "updated_at"])
+		# bulk_update skips signals, so drop the cached pages ourselves.
+		series = Tutorial.objects.filter(pk__in=[t.pk for t in tutorials]).values_list("tutorial_series_id", flat=True).distinct()
+		pagecache.invalidate(
+			*(pagecache.tutorial_tag(t.pk) for t in tutorials),
+			*(pagecache.series_tag(pk) for pk in series if pk is not None),
+			pagecache.SITEMAP_TAG)
+		return len(tutorials)
@@ -0,0 +1,135 @@
+import datetime
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import reset_queries, transaction
+from django.utils import timezone
+
+from main.models import Tutorial, TutorialCategory, TutorialSeries
+from main.rendering import HTML
+from main.search import get_search_backend
+from main.slugs import slug_registry
+
+
+WORDS = (
+	"python django model view template query index cache request response "
+	"function class object method string list dict tuple loop import module "
+	"package server client database table column row field form test debug "
+	"deploy static file path url route slug series category tutorial learn "
+	"build write read update delete create install configure run async thread"
+).split()
+
+
+def fake_sentence(rng, words=12):
+	text = " ".join(rng.choice(WORDS) for _ in range(words))
+	return text.capitalize() + "."
+
+
+def fake_body(rng, size):
+	"""HTML of roughly size characters: headings, paragraphs and code blocks."""
+	parts, length = [], 0
+	while length < size:
+		kind = rng.random()
+		if kind < 0.1:
+			part = f"<h2>{fake_sentence(rng, 4)}</h2>"
+		elif kind < 0.25:
+			code = "\n".join(f"{rng.choice(WORDS)} = {rng.choice(WORDS)}()" for _ in range(rng.randint(2, 8)))
+			part = f"<pre><code>{code}</code></pre>"
+		else:
+			part = "<p>" + " ".join(fake_sentence(rng) for _ in range(rng.randint(2, 6))) + "</p>"
+		parts.append(part)
+		length += len(part)
+	return "\n".join(parts)
+
+
+def clear_seeded(prefix):
+	"""Delete the rows seeded with prefix, without loading them."""
+	categories = TutorialCategory.objects.filter(category_slug__startswith=f"{prefix}-")
+	series = TutorialSeries.objects.filter(tutorial_category__in=categories)
+	Tutorial.objects.filter(tutorial_series__in=series)._raw_delete(Tutorial.objects.db)
+	series._raw_delete(TutorialSeries.objects.db)
+	categories._raw_delete(TutorialCategory.objects.db)
+
+
+class Command(BaseCommand):
+	help = "Seed a synthetic corpus of categories x series x tutorials for benchmarking."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--categories", type=int, default=10)
+		parser.add_argument("--series", type=int, default=10, help="Series per category.")
+		parser.add_argument("--tutorials", type=int, default=10, help="Tutorials per series.")
+		parser.add_argument("--content-size", type=int, default=6000,
+							help="Approximate tutorial body size in characters.")
+		parser.add_argument("--batch-size", type=int, default=1000)
+		parser.add_argument("--prefix", default="bench",
+							help="Slug prefix, so seeded rows can be told apart and cleared.")
+		parser.add_argument("--clear", action="store_true",
+							help="Delete rows previously seeded with the same prefix first.")
+		parser.add_argument("--seed", type=int, default=0)
+		parser.add_argument("--no-render", action="store_true",
+							help="Leave tutorials unrendered, for render_tutorials --stale-only to pick up.")
+		parser.add_argument("--no-reindex", action="store_true",
+							help="Skip rebuilding the search index afterwards.")
+
+	def handle(self, *args, **options):
+		prefix = options["prefix"]
+		batch_size = options["batch_size"]
+		rng = random.Random(options["seed"])
+		started = time.perf_counter()
+
+		with transaction.atomic():
+			if options["clear"]:
+				clear_seeded(prefix)
+			elif TutorialCategory.objects.filter(category_slug__startswith=f"{prefix}-").exists():
+				raise CommandError(f"Rows with prefix '{prefix}' already exist; pass --clear to replace them.")
+
+			categories = TutorialCategory.objects.bulk_create([
+				TutorialCategory(
+					tutorial_category=f"Category {c}",
+					category_summary=fake_sentence(rng, 8)[:200],
+					category_slug=f"{prefix}-c{c}")
+				for c in range(options["categories"])
+			], batch_size=batch_size)
+
+			series = TutorialSeries.objects.bulk_create([
+				TutorialSeries(
+					tutorial_series=f"Series {c.pk}.{s}",
+					tutorial_category=c,
+					series_summary=fake_sentence(rng, 8)[:200])
+				for c in categories for s in range(options["series"])
+			], batch_size=batch_size)
+
+			base = timezone.now() - datetime.timedelta(days=365)
+			pending, total = [], 0
+			for s in series:
+				for position in range(options["tutorials"]):
+					body = fake_body(rng, options["content_size"])
+					tutorial = Tutorial(
+						tutorial_title=fake_sentence(rng, 5)[:200],
+						tutorial_content=body,
+						tutorial_format=HTML,
+						tutorial_published=base + datetime.timedelta(minutes=total),
+						tutorial_series=s,
+						tutorial_slug=f"{prefix}-s{s.pk}-t{position}",
+						series_position=position)
+					if not options["no_render"]:
+						tutorial.render()
+					pending.append(tutorial)
+					total += 1
+					if len(pending) >= batch_size:
+						Tutorial.objects.bulk_create(pending, batch_size=batch_size)
+						pending = []
+						reset_queries()
+			if pending:
+				Tutorial.objects.bulk_create(pending, batch_size=batch_size)
+
+			# bulk_create skips signals, so refresh what they normally maintain.
+			if not options["no_reindex"]:
+				get_search_backend().rebuild()
+		slug_registry.clear()
+
+		elapsed = time.perf_counter() - started
+		self.stdout.write(self.style.SUCCESS(
+			f"Seeded {len(categories)} categories, {len(series)} series and "
+			f"{total} tutorials in {elapsed:.1f}s"))
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:33
+
+from django.db import migrations, models
+
+
+def number_series(apps, schema_editor):
+    Tutorial = apps.get_model("main", "Tutorial")
+    changed = []
+    series_id, position = None, 0
+    for tutorial in Tutorial.objects.order_by("tutorial_series_id", "tutorial_published", "pk").only("pk", "tutorial_series_id"):
+        if tutorial.tutorial_series_id != series_id:
+            series_id, position = tutorial.tutorial_series_id, 0
+        tutorial.series_position = position
+        changed.append(tutorial)
+        position += 1
+    Tutorial.objects.bulk_update(changed, ["series_position"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0014_contactmessage_alter_tutorial_tutorial_published'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tutorial',
+            name='series_position',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(number_series, migrations.RunPython.noop),
+    ]
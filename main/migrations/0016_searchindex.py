@@ -0,0 +1,52 @@
+from django.db import migrations
+from django.utils.html import strip_tags
+
+
+KINDS = ("tutorial", "series", "category")
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    Tutorial = apps.get_model("main", "Tutorial")
+    TutorialSeries = apps.get_model("main", "TutorialSeries")
+    TutorialCategory = apps.get_model("main", "TutorialCategory")
+
+    documents = []
+    for t in Tutorial.objects.iterator():
+        documents.append(("tutorial", t.pk, t.tutorial_title, strip_tags(t.tutorial_content)))
+    for s in TutorialSeries.objects.iterator():
+        documents.append(("series", s.pk, s.tutorial_series, s.series_summary))
+    for c in TutorialCategory.objects.iterator():
+        documents.append(("category", c.pk, c.tutorial_category, c.category_summary))
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS main_searchindex USING fts5("
+            "title, body, kind UNINDEXED, object_id UNINDEXED, "
+            "tokenize = 'porter unicode61')"
+        )
+        cursor.executemany(
+            "INSERT INTO main_searchindex (rowid, title, body, kind, object_id) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            [(pk * len(KINDS) + KINDS.index(kind), title, body, kind, pk)
+             for kind, pk, title, body in documents],
+        )
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS main_searchindex")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0015_tutorial_series_position'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:35
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+
+def fill_excerpts(apps, schema_editor):
+    Tutorial = apps.get_model("main", "Tutorial")
+    changed = []
+    for tutorial in Tutorial.objects.only("pk", "tutorial_content").iterator():
+        text = " ".join(strip_tags(tutorial.tutorial_content).split())
+        tutorial.tutorial_excerpt = text[:150] + '...' if len(text) > 150 else text
+        changed.append(tutorial)
+    Tutorial.objects.bulk_update(changed, ["tutorial_excerpt"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0016_searchindex'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tutorial',
+            name='tutorial_excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=153),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
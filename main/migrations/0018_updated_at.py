@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0017_tutorial_excerpt'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tutorial',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='tutorialcategory',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='tutorialseries',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.db import migrations
+from django.utils import timezone
+from django.utils.text import slugify
+
+
+# A frozen copy of the repair in main.slug_cleanup at the time of this
+# migration, so later changes to that module cannot change what it does.
+PLACEHOLDER_SLUGS = {"", "1"}
+
+
+def _unique(base, taken):
+    base = (base or "untitled")[:190]
+    candidate, n = base, 2
+    while candidate in taken:
+        candidate = f"{base}-{n}"
+        n += 1
+    taken.add(candidate)
+    return candidate
+
+
+def fix_slugs(apps, schema_editor):
+    Tutorial = apps.get_model("main", "Tutorial")
+    TutorialCategory = apps.get_model("main", "TutorialCategory")
+    now = timezone.now()
+
+    rows = list(TutorialCategory.objects.order_by("pk").values_list("pk", "tutorial_category", "category_slug"))
+    taken = {slug for _, _, slug in rows if slug}
+    seen = set()
+    for pk, name, slug in rows:
+        if slug and slug not in seen:
+            seen.add(slug)
+            continue
+        TutorialCategory.objects.filter(pk=pk).update(category_slug=_unique(slugify(name), taken), updated_at=now)
+
+    category_slugs = set(TutorialCategory.objects.values_list("category_slug", flat=True))
+    rows = list(Tutorial.objects.order_by("pk").values_list("pk", "tutorial_title", "tutorial_slug"))
+    taken = set(category_slugs)
+    taken.update(str(slug) for _, _, slug in rows)
+    seen = set()
+    for pk, title, slug in rows:
+        slug = str(slug)
+        if slug not in PLACEHOLDER_SLUGS and slug not in seen and slug not in category_slugs:
+            seen.add(slug)
+            continue
+        Tutorial.objects.filter(pk=pk).update(tutorial_slug=_unique(slugify(title), taken), updated_at=now)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0018_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(fix_slugs, migrations.RunPython.noop),
+    ]
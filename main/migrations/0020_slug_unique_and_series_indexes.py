@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0019_fix_duplicate_slugs'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tutorial',
+            name='tutorial_slug',
+            field=models.CharField(max_length=200, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='tutorialcategory',
+            name='category_slug',
+            field=models.CharField(max_length=200, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='tutorial',
+            index=models.Index(fields=['tutorial_series', 'tutorial_published'], name='tutorial_series_published'),
+        ),
+        migrations.AddIndex(
+            model_name='tutorial',
+            index=models.Index(fields=['tutorial_series', 'series_position'], name='tutorial_series_position'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:02
+
+from html import unescape
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+
+def render_existing(apps, schema_editor):
+    # Existing tutorials were written as HTML, so render them as such.
+    from main.rendering import render_content
+
+    Tutorial = apps.get_model("main", "Tutorial")
+    changed = []
+    for tutorial in Tutorial.objects.only("pk", "tutorial_content").iterator():
+        rendered = render_content(tutorial.tutorial_content, "html")
+        tutorial.rendered_html = rendered.html
+        tutorial.tutorial_toc = rendered.toc
+        text = " ".join(unescape(strip_tags(rendered.html)).split())
+        tutorial.tutorial_excerpt = text[:150] + '...' if len(text) > 150 else text
+        changed.append(tutorial)
+    Tutorial.objects.bulk_update(
+        changed, ["rendered_html", "tutorial_toc", "tutorial_excerpt"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0021_contactmessage_archive_and_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tutorial',
+            name='rendered_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='tutorial',
+            name='tutorial_format',
+            field=models.CharField(choices=[('markdown', 'Markdown'), ('html', 'HTML')], default='html', max_length=10, verbose_name='source format'),
+        ),
+        migrations.AlterField(
+            model_name='tutorial',
+            name='tutorial_format',
+            field=models.CharField(choices=[('markdown', 'Markdown'), ('html', 'HTML')], default='markdown', max_length=10, verbose_name='source format'),
+        ),
+        migrations.AddField(
+            model_name='tutorial',
+            name='tutorial_toc',
+            field=models.JSONField(blank=True, default=list, editable=False, verbose_name='table of contents'),
+        ),
+        migrations.RunPython(render_existing, migrations.RunPython.noop),
+    ]
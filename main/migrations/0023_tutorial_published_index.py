@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0022_tutorial_rendered_html'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tutorial',
+            index=models.Index(fields=['tutorial_published'], name='tutorial_published'),
+        ),
+    ]
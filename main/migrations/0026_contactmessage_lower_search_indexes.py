@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:41
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0025_contactmessage_created_at_default'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='contactmessage',
+            name='contact_subject',
+        ),
+        migrations.RemoveIndex(
+            model_name='contactmessage',
+            name='contact_name',
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='contact_name_lower'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(django.db.models.functions.text.Lower('subject'), name='contact_subject_lower'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:44
+
+import main.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0026_contactmessage_lower_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tutorial',
+            name='tutorial_slug',
+            field=models.CharField(max_length=200, unique=True, validators=[main.models.validate_slug]),
+        ),
+        migrations.AlterField(
+            model_name='tutorialcategory',
+            name='category_slug',
+            field=models.CharField(max_length=200, unique=True, validators=[main.models.validate_slug]),
+        ),
+    ]
@@ -1,12 +1,40 @@
-from django.db import models
+from collections import defaultdict
+from html import unescape
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
+from django.utils.html import strip_tags
+
+from .rendering import FORMATS, MARKDOWN, render_content
+
+EXCERPT_LENGTH = 150
+
+
+def make_excerpt(content, length=EXCERPT_LENGTH):
+	"""Plain-text teaser for a tutorial body, as shown in search results."""
+	text = " ".join(unescape(strip_tags(content)).split())
+	return text[:length] + '...' if len(text) > length else text
+
+
+# The static export writes the homepage to index.html, so no page may be /index.
+RESERVED_SLUGS = {"index"}
+
+
+def validate_slug(value):
+	if str(value).lower() in RESERVED_SLUGS:
+		raise ValidationError("“%(value)s” is reserved and cannot be used as a slug.",
+							  code="reserved", params={"value": value})
+
 
 # Create your models here.
 
 class TutorialCategory(models.Model):
 	tutorial_category = models.CharField(max_length=200)
 	category_summary = models.CharField(max_length=200)
-	category_slug = models.CharField(max_length=200)
+	category_slug = models.CharField(max_length=200, unique=True, validators=[validate_slug])
+	updated_at = models.DateTimeField(auto_now=True)
 
 	class Meta:
 		verbose_name_plural = "Categories"
@@ -22,6 +50,7 @@ class TutorialSeries(models.Model):
 										  verbose_name="Category",
 										  on_delete=models.SET_DEFAULT)
 	series_summary = models.CharField(max_length=200)
+	updated_at = models.DateTimeField(auto_now=True)
 
 	class Meta:
 		verbose_name_plural = "Series"
@@ -30,32 +59,134 @@ class TutorialSeries(models.Model):
 		return self.tutorial_series
 
 
+RENDERED_FIELDS = ("rendered_html", "tutorial_toc", "tutorial_excerpt")
+
+
 class Tutorial(models.Model):
 	tutorial_title = models.CharField(max_length=200)
 	tutorial_content = models.TextField()
+	tutorial_format = models.CharField("source format", max_length=10, choices=FORMATS, default=MARKDOWN)
+	rendered_html = models.TextField(blank=True, editable=False)
+	tutorial_toc = models.JSONField("table of contents", default=list, blank=True, editable=False)
 	tutorial_published = models.DateTimeField("date published", default=timezone.now)
 
 	tutorial_series = models.ForeignKey(TutorialSeries, default=1,
 									   verbose_name="Series",
 									   on_delete=models.SET_DEFAULT)
-	tutorial_slug = models.CharField(max_length=200, default=1)
+	tutorial_slug = models.CharField(max_length=200, unique=True, validators=[validate_slug])
+	series_position = models.PositiveIntegerField(default=0, editable=False)
+	tutorial_excerpt = models.CharField(max_length=EXCERPT_LENGTH + 3, blank=True, editable=False)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	class Meta:
+		indexes = [
+			models.Index(fields=["tutorial_series", "tutorial_published"], name="tutorial_series_published"),
+			models.Index(fields=["tutorial_series", "series_position"], name="tutorial_series_position"),
+			models.Index(fields=["tutorial_published"], name="tutorial_published"),
+		]
 
 
 	def __str__(self):
 		return self.tutorial_title
 
+	# (format, content) that rendered_html was produced from.
+	_rendered_source = None
+
+	@classmethod
+	def from_db(cls, db, field_names, values):
+		instance = super().from_db(db, field_names, values)
+		if instance.__dict__.get("rendered_html"):
+			instance._rendered_source = (instance.__dict__.get("tutorial_format"),
+										 instance.__dict__.get("tutorial_content"))
+		return instance
+
+	def render(self):
+		"""Produce rendered_html, tutorial_toc and tutorial_excerpt from the source."""
+		rendered = render_content(self.tutorial_content, self.tutorial_format)
+		self.rendered_html = rendered.html
+		self.tutorial_toc = rendered.toc
+		self.tutorial_excerpt = make_excerpt(rendered.html)
+		self._rendered_source = (self.tutorial_format, self.tutorial_content)
+
+	def save(self, *args, **kwargs):
+		# Render once per edit of the source, never per request.
+		update_fields = kwargs.get("update_fields")
+		if update_fields is None or {"tutorial_content", "tutorial_format"} & set(update_fields):
+			if self._rendered_source != (self.tutorial_format, self.tutorial_content):
+				self.render()
+			if update_fields is not None:
+				kwargs["update_fields"] = set(update_fields) | set(RENDERED_FIELDS) | {"updated_at"}
+		super().save(*args, **kwargs)
+
+	@classmethod
+	def renumber_series(cls, series_id):
+		"""
+		Store each tutorial's 0-based place in its series, ordered by
+		publish date, so navigation can index it instead of scanning.
+		"""
+		tutorials = list(cls.objects
+			.filter(tutorial_series_id=series_id)
+			.order_by("tutorial_published", "pk")
+			.only("tutorial_title", "tutorial_slug", "series_position"))
+		changed = []
+		for position, tutorial in enumerate(tutorials):
+			if tutorial.series_position != position:
+				tutorial.series_position = position
+				changed.append(tutorial)
+		if changed:
+			cls.objects.bulk_update(changed, ["series_position"])
+		return tutorials
+
+	@classmethod
+	def renumber_many_series(cls, series_ids, chunk_size=100):
+		"""
+		renumber_series for many series at once, for bulk loads. Rows are
+		read chunk_size series at a time in order and moved with one UPDATE
+		per new position, rather than bulk_update's CASE per row.
+		"""
+		series_ids = sorted(series_ids)
+		moved = 0
+		for start in range(0, len(series_ids), chunk_size):
+			rows = (cls.objects
+				.filter(tutorial_series_id__in=series_ids[start:start + chunk_size])
+				.order_by("tutorial_series_id", "tutorial_published", "pk")
+				.values_list("pk", "tutorial_series_id", "series_position"))
+			moves = defaultdict(list)
+			series_id, position = None, 0
+			for pk, row_series, current in rows.iterator(chunk_size=2000):
+				position = position + 1 if row_series == series_id else 0
+				series_id = row_series
+				if current != position:
+					moves[position].append(pk)
+			with transaction.atomic():
+				for position, pks in moves.items():
+					for offset in range(0, len(pks), 1000):
+						cls.objects.filter(pk__in=pks[offset:offset + 1000]).update(series_position=position)
+			moved += sum(len(pks) for pks in moves.values())
+		return moved
+
 
 class ContactMessage(models.Model):
 	name = models.CharField(max_length=200)
 	email = models.EmailField()
 	subject = models.CharField(max_length=200)
 	message = models.TextField()
-	created_at = models.DateTimeField(auto_now_add=True)
+	# A default rather than auto_now_add, so the contact queue can keep the
+	# time a spooled submission was made when it inserts it later.
+	created_at = models.DateTimeField(default=timezone.now, editable=False)
 	is_read = models.BooleanField(default=False)
+	is_archived = models.BooleanField(default=False)
 
 	class Meta:
 		ordering = ['-created_at']
 		verbose_name_plural = "Contact Messages"
+		indexes = [
+			models.Index(fields=["created_at"], name="contact_created"),
+			models.Index(fields=["is_archived", "is_read", "created_at"], name="contact_inbox"),
+			models.Index(fields=["email"], name="contact_email"),
+			models.Index(Lower("name"), name="contact_name_lower"),
+			models.Index(Lower("subject"), name="contact_subject_lower"),
+		]
 
 	def __str__(self):
 		return f"{self.subject} - {self.name}"
@@ -0,0 +1,226 @@
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+
+TAG_PREFIX = "pagecache:tag:"
+PAGE_PREFIX = "pagecache:page:"
+
+
+def _cache():
+	return caches[getattr(settings, "PAGE_CACHE_ALIAS", "default")]
+
+
+def category_tag(pk):
+	return f"category:{pk}"
+
+
+def series_tag(pk):
+	return f"series:{pk}"
+
+
+def tutorial_tag(pk):
+	return f"tutorial:{pk}"
+
+
+CATEGORIES_TAG = "categories"
+# sitemap.xml and the Atom feed, see main.feeds.
+SITEMAP_TAG = "sitemap"
+
+
+def tag_response(response, *tags):
+	"""Mark a response as cacheable for anonymous users, depending on tags."""
+	response.cache_tags = set(tags)
+	return response
+
+
+def invalidate(*tags):
+	"""
+	Expire every cached page that depends on any of tags.
+
+	Each tag carries a version; pages remember the versions they were
+	rendered against, so bumping a version orphans exactly those pages.
+	"""
+	if not tags:
+		return
+	version = time.time_ns()
+	_cache().set_many({TAG_PREFIX + tag: version for tag in tags}, None)
+
+
+def _fresh_version():
+	"""
+	A version for a tag nobody has invalidated yet. Negative, so that it is
+	still unique but never newer than a render (see _unchanged_since).
+	"""
+	return -time.time_ns()
+
+
+def _tag_versions(cache, tags):
+	"""Current version of each tag, starting unseen tags at a fresh version."""
+	keys = [TAG_PREFIX + tag for tag in tags]
+	versions = cache.get_many(keys)
+	missing = {key: _fresh_version() for key in keys if key not in versions}
+	if missing:
+		cache.set_many(missing, None)
+		versions.update(missing)
+	return versions
+
+
+def content_version(*tags):
+	"""
+	A string that changes whenever any of tags is invalidated, for keying
+	template fragments on the same versions as the pages around them.
+	"""
+	versions = _tag_versions(_cache(), tags)
+	return ".".join(str(versions[TAG_PREFIX + tag]) for tag in tags)
+
+
+def _has_pending_messages(request):
+	storage = getattr(request, "_messages", None)
+	return storage is not None and len(storage) > 0
+
+
+def _bypass(request):
+	if request.method not in ("GET", "HEAD"):
+		return True
+	user = getattr(request, "user", None)
+	if user is not None and user.is_authenticated:
+		return True
+	return _has_pending_messages(request)
+
+
+def _current(entry, current_versions):
+	return entry if entry is not None and current_versions == entry["versions"] else None
+
+
+def _response(entry):
+	return HttpResponse(entry["content"], content_type=entry["content_type"])
+
+
+def _cacheable(request, response):
+	tags = getattr(response, "cache_tags", None)
+	if (tags is not None and response.status_code == 200
+			and not response.streaming and not _has_pending_messages(request)):
+		return tags
+	return None
+
+
+def _started(request):
+	"""When this request first looked at its page: the freshness check, or else the render."""
+	return request.__dict__.setdefault("_page_started", time.time_ns())
+
+
+def _unchanged_since(versions, started):
+	"""
+	Whether no tag was invalidated after started. Tags are only known once
+	the view has rendered, so a save that lands mid-render shows up here
+	as a version newer than the render, and the page must not be stored.
+	invalidate() stamps versions with the time, so they compare with it.
+	"""
+	return all(version <= started for version in versions.values())
+
+
+def _entry(request, versions, response):
+	return {
+		"versions": versions,
+		"content": response.content,
+		"content_type": response["Content-Type"],
+		# The main.freshness validators this page was sent with, so hits can
+		# answer conditional GETs with the same ETag and without SQL.
+		"freshness": dict(request.__dict__.get("_freshness", {})),
+	}
+
+
+def current_entry(request):
+	"""
+	The cached page for request if every tag is still at its stored
+	version, else None. Looked up once per request and shared with the
+	cache_anonymous_page wrapper.
+	"""
+	if _bypass(request):
+		return None
+	if "_page_entry" not in request.__dict__:
+		_started(request)
+		cache = _cache()
+		entry = cache.get(PAGE_PREFIX + request.get_full_path())
+		request._page_entry = _current(entry, entry and cache.get_many(list(entry["versions"])))
+	return request._page_entry
+
+
+def cache_anonymous_page(view):
+	"""
+	Serve anonymous GETs of view from the page cache.
+
+	Only responses the view tagged with tag_response() are stored, and
+	authenticated users or requests carrying messages always render.
+	Async views get an async wrapper using the cache's async API.
+	"""
+	if iscoroutinefunction(view):
+		return _cache_anonymous_page_async(view)
+
+	@wraps(view)
+	def wrapped(request, *args, **kwargs):
+		if _bypass(request):
+			return view(request, *args, **kwargs)
+
+		entry = current_entry(request)
+		if entry is not None:
+			return _response(entry)
+
+		started = _started(request)
+		response = view(request, *args, **kwargs)
+		tags = _cacheable(request, response)
+		if tags is not None:
+			cache = _cache()
+			versions = _tag_versions(cache, tags)
+			if _unchanged_since(versions, started):
+				cache.set(PAGE_PREFIX + request.get_full_path(), _entry(request, versions, response),
+						  getattr(settings, "PAGE_CACHE_TIMEOUT", 600))
+		return response
+
+	return wrapped
+
+
+async def _atag_versions(cache, tags):
+	keys = [TAG_PREFIX + tag for tag in tags]
+	versions = await cache.aget_many(keys)
+	missing = {key: _fresh_version() for key in keys if key not in versions}
+	if missing:
+		await cache.aset_many(missing, None)
+		versions.update(missing)
+	return versions
+
+
+def _cache_anonymous_page_async(view):
+	@wraps(view)
+	async def wrapped(request, *args, **kwargs):
+		if _bypass(request):
+			return await view(request, *args, **kwargs)
+
+		cache = _cache()
+		key = PAGE_PREFIX + request.get_full_path()
+		if "_page_entry" in request.__dict__:
+			# Already looked up by the freshness check.
+			entry = request._page_entry
+		else:
+			_started(request)
+			entry = await cache.aget(key)
+			entry = _current(entry, entry and await cache.aget_many(list(entry["versions"])))
+		if entry is not None:
+			return _response(entry)
+
+		started = _started(request)
+		response = await view(request, *args, **kwargs)
+		tags = _cacheable(request, response)
+		if tags is not None:
+			versions = await _atag_versions(cache, tags)
+			if _unchanged_since(versions, started):
+				await cache.aset(key, _entry(request, versions, response), getattr(settings, "PAGE_CACHE_TIMEOUT", 600))
+		return response
+
+	return wrapped
@@ -0,0 +1,36 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Max
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+	"""
+	Paginator that avoids COUNT(*) over a whole large table.
+
+	Unfiltered querysets are counted from table statistics (pg_class on
+	Postgres, the highest primary key elsewhere) once the estimate passes
+	exact_below; filtered querysets and small tables get an exact count.
+	"""
+
+	exact_below = 10000
+
+	def _estimate(self, queryset):
+		model = queryset.model
+		connection = connections[queryset.db]
+		if connection.vendor == "postgresql":
+			with connection.cursor() as cursor:
+				cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+							   [model._meta.db_table])
+				row = cursor.fetchone()
+			return row[0] if row else None
+		return model._default_manager.using(queryset.db).aggregate(n=Max("pk"))["n"] or 0
+
+	@cached_property
+	def count(self):
+		queryset = self.object_list
+		if getattr(queryset, "query", None) is not None and not queryset.query.where:
+			estimate = self._estimate(queryset)
+			if estimate is not None and estimate >= self.exact_below:
+				return estimate
+		return super().count
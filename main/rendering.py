@@ -0,0 +1,196 @@
+"""
+Tutorial body rendering, done once when a tutorial is saved.
+
+The source (Markdown, or the hand-written HTML older tutorials use) is
+converted to HTML and rebuilt from an allowlist of tags and attributes.
+Code blocks are then highlighted with Pygments, and headings get anchors
+that are collected into a table of contents. Views only output the
+stored result.
+"""
+import html
+import re
+from collections import namedtuple
+from html.parser import HTMLParser
+
+import markdown
+from django.utils.text import slugify
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
+
+
+MARKDOWN = "markdown"
+HTML = "html"
+FORMATS = [(MARKDOWN, "Markdown"), (HTML, "HTML")]
+
+RenderedContent = namedtuple("RenderedContent", ["html", "toc"])
+RenderedContent.__doc__ = "Safe body HTML plus [{level, id, title}, ...] for its headings."
+
+MARKDOWN_EXTENSIONS = ["fenced_code", "tables", "sane_lists"]
+MARKDOWN_CONFIG = {"tables": {"use_align_attribute": True}}
+
+ALLOWED_TAGS = {
+	"a", "abbr", "b", "blockquote", "br", "code", "dd", "del", "div", "dl", "dt", "em",
+	"h1", "h2", "h3", "h4", "h5", "h6", "hr", "i", "img", "kbd", "li", "ol", "p", "pre",
+	"s", "span", "strong", "sub", "sup", "table", "tbody", "td", "tfoot", "th", "thead",
+	"tr", "u", "ul",
+}
+ALLOWED_ATTRIBUTES = {
+	"a": {"href", "title"},
+	"abbr": {"title"},
+	"img": {"src", "alt", "title", "width", "height"},
+	"ol": {"start"},
+	"td": {"align", "colspan", "rowspan"},
+	"th": {"align", "colspan", "rowspan"},
+}
+URL_ATTRIBUTES = {"href", "src"}
+URL_SCHEMES = {"http", "https", "mailto"}
+VOID_TAGS = {"br", "hr", "img"}
+# Dropped together with everything inside them.
+DROP_CONTENT_TAGS = {"script", "style", "iframe", "object", "embed", "template", "noscript", "textarea", "select"}
+HEADINGS = {"h1", "h2", "h3", "h4"}
+CODE_LANGUAGE = re.compile(r"^language-([\w+#-]+)$")
+
+
+# Browsers drop these before parsing a URL (tab/LF/CR anywhere, other C0
+# controls and spaces at either end), so "java&#9;script:" is "javascript:".
+URL_CONTROL_CHARACTERS = re.compile(r"[\x00-\x1f\x7f]")
+URL_SCHEME = re.compile(r"^([a-zA-Z][a-zA-Z0-9+.-]*):")
+
+
+def _clean_url(value):
+	"""Return value normalised the way a browser reads it, or None if its scheme is not allowed."""
+	value = URL_CONTROL_CHARACTERS.sub("", value).strip(" ")
+	scheme = URL_SCHEME.match(value)
+	if scheme is not None and scheme.group(1).lower() not in URL_SCHEMES:
+		return None
+	return value
+
+
+class _Sanitizer(HTMLParser):
+	"""Rebuild HTML from allowed tags and attributes, anchoring headings on the way."""
+
+	def __init__(self):
+		super().__init__(convert_charrefs=True)
+		self.out = []
+		self.open = []
+		self.skipping = 0
+		self.toc = []
+		self.anchors = set()
+		self.heading = None  # (tag, index of its start tag in out, text parts)
+
+	def _attributes(self, tag, attrs):
+		allowed = ALLOWED_ATTRIBUTES.get(tag, set())
+		kept = []
+		for name, value in attrs:
+			value = value or ""
+			if name == "class" and tag in ("pre", "code") and CODE_LANGUAGE.match(value):
+				kept.append((name, value))
+			elif name in allowed and name in URL_ATTRIBUTES:
+				value = _clean_url(value)
+				if value is not None:
+					kept.append((name, value))
+			elif name in allowed:
+				kept.append((name, value))
+		return "".join(f' {name}="{html.escape(value)}"' for name, value in kept)
+
+	def handle_starttag(self, tag, attrs):
+		if tag in DROP_CONTENT_TAGS:
+			self.skipping += 1
+			return
+		if self.skipping or tag not in ALLOWED_TAGS:
+			return
+		self.out.append(f"<{tag}{self._attributes(tag, attrs)}>")
+		if tag in VOID_TAGS:
+			return
+		self.open.append(tag)
+		if tag in HEADINGS and self.heading is None:
+			self.heading = (tag, len(self.out) - 1, [])
+
+	def handle_startendtag(self, tag, attrs):
+		self.handle_starttag(tag, attrs)
+		if tag not in VOID_TAGS and not self.skipping and tag in ALLOWED_TAGS:
+			self.handle_endtag(tag)
+
+	def handle_endtag(self, tag):
+		if tag in DROP_CONTENT_TAGS:
+			self.skipping = max(self.skipping - 1, 0)
+			return
+		if self.skipping or tag not in self.open:
+			return
+		while self.open:
+			closing = self.open.pop()
+			if self.heading is not None and closing == self.heading[0]:
+				self._anchor_heading()
+			self.out.append(f"</{closing}>")
+			if closing == tag:
+				break
+
+	def handle_data(self, data):
+		if self.skipping:
+			return
+		self.out.append(html.escape(data, quote=False))
+		if self.heading is not None:
+			self.heading[2].append(data)
+
+	def _anchor_heading(self):
+		tag, index, parts = self.heading
+		self.heading = None
+		title = " ".join("".join(parts).split())
+		base = slugify(title) or "section"
+		anchor, n = base, 2
+		while anchor in self.anchors:
+			anchor, n = f"{base}-{n}", n + 1
+		self.anchors.add(anchor)
+		self.out[index] = self.out[index].replace(f"<{tag}", f'<{tag} id="{anchor}"', 1)
+		self.toc.append({"level": int(tag[1]), "id": anchor, "title": title})
+
+	def result(self):
+		self.close()
+		while self.open:
+			self.handle_endtag(self.open[-1])
+		return "".join(self.out), self.toc
+
+
+def sanitize(body):
+	"""Allowlisted HTML for body, and the table of contents of its headings."""
+	sanitizer = _Sanitizer()
+	sanitizer.feed(body)
+	return sanitizer.result()
+
+
+_CODE_BLOCK = re.compile(
+	r'<pre(?: class="language-(?P<pre>[^"]+)")?><code(?: class="language-(?P<code>[^"]+)")?>'
+	r'(?P<body>.*?)</code></pre>', re.S)
+# monokai matches the dark code blocks in style.css.
+_FORMATTER = HtmlFormatter(cssclass="highlight", style="monokai")
+
+
+def _highlight_block(match):
+	language = match.group("code") or match.group("pre")
+	if not language:
+		return match.group(0)
+	try:
+		lexer = get_lexer_by_name(language)
+	except ClassNotFound:
+		return match.group(0)
+	return highlight(html.unescape(match.group("body")), lexer, _FORMATTER)
+
+
+def highlight_code(body):
+	"""Replace language-tagged code blocks in sanitized HTML with Pygments markup."""
+	return _CODE_BLOCK.sub(_highlight_block, body)
+
+
+def render_content(source, source_format=MARKDOWN):
+	if source_format == MARKDOWN:
+		source = markdown.markdown(source, extensions=MARKDOWN_EXTENSIONS,
+								   extension_configs=MARKDOWN_CONFIG)
+	body, toc = sanitize(source)
+	return RenderedContent(highlight_code(body), toc)
+
+
+def highlight_css():
+	"""The stylesheet for highlighted code, as written to main/css/highlight.css."""
+	return _FORMATTER.get_style_defs(".highlight")
@@ -0,0 +1,30 @@
+from django.db import connections
+
+
+class PrimaryReplicaRouter:
+	"""
+	Send reads to the read-only 'replica' alias and writes to 'default'.
+
+	Reads made while 'default' has a transaction open stay on 'default' so
+	a request or command always sees its own uncommitted writes.
+	"""
+
+	primary = "default"
+	replica = "replica"
+
+	def db_for_read(self, model, **hints):
+		instance = hints.get("instance")
+		if instance is not None and instance._state.db == self.primary:
+			return self.primary
+		if connections[self.primary].in_atomic_block:
+			return self.primary
+		return self.replica
+
+	def db_for_write(self, model, **hints):
+		return self.primary
+
+	def allow_relation(self, obj1, obj2, **hints):
+		return True
+
+	def allow_migrate(self, db, app_label, model_name=None, **hints):
+		return db == self.primary
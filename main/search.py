@@ -0,0 +1,200 @@
+import re
+from collections import namedtuple
+from itertools import islice
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils.html import strip_tags
+from django.utils.module_loading import import_string
+
+from .models import Tutorial, TutorialCategory, TutorialSeries
+
+
+TUTORIAL = "tutorial"
+SERIES = "series"
+CATEGORY = "category"
+
+KINDS = (TUTORIAL, SERIES, CATEGORY)
+
+SearchPage = namedtuple("SearchPage", ["total", "hits"])
+SearchPage.__doc__ = "One page of search hits: total matches plus [(kind, pk), ...] in rank order."
+
+
+def document_for(obj):
+	"""Return (kind, pk, title, body) for an indexable model instance."""
+	if isinstance(obj, Tutorial):
+		return TUTORIAL, obj.pk, obj.tutorial_title, strip_tags(obj.rendered_html)
+	if isinstance(obj, TutorialSeries):
+		return SERIES, obj.pk, obj.tutorial_series, obj.series_summary
+	if isinstance(obj, TutorialCategory):
+		return CATEGORY, obj.pk, obj.tutorial_category, obj.category_summary
+	raise TypeError(f"{type(obj).__name__} is not searchable")
+
+
+def iter_documents():
+	"""Yield a document for every searchable row, streaming from the database."""
+	for model in (Tutorial, TutorialSeries, TutorialCategory):
+		for obj in model.objects.order_by("pk").iterator(chunk_size=500):
+			yield document_for(obj)
+
+
+class SearchBackend:
+	"""
+	Interface for the index behind main.views.search.
+
+	Backends are looked up from settings.SEARCH_BACKEND and receive every
+	save/delete of a searchable model, so a Postgres tsvector backend only
+	has to implement these four methods.
+	"""
+
+	def index(self, obj):
+		raise NotImplementedError
+
+	def remove(self, obj):
+		raise NotImplementedError
+
+	def rebuild(self):
+		raise NotImplementedError
+
+	def search(self, query, offset=0, limit=20, kinds=KINDS):
+		raise NotImplementedError
+
+
+class LikeSearchBackend(SearchBackend):
+	"""The original icontains scan. Needs no index, so works on any database."""
+
+	def index(self, obj):
+		pass
+
+	def remove(self, obj):
+		pass
+
+	def rebuild(self):
+		pass
+
+	def _querysets(self, query):
+		return [
+			(TUTORIAL, Tutorial.objects.filter(
+				Q(tutorial_title__icontains=query) |
+				Q(tutorial_content__icontains=query)
+			).order_by("pk")),
+			(CATEGORY, TutorialCategory.objects.filter(
+				Q(tutorial_category__icontains=query) |
+				Q(category_summary__icontains=query)
+			).order_by("pk")),
+			(SERIES, TutorialSeries.objects.filter(
+				Q(tutorial_series__icontains=query) |
+				Q(series_summary__icontains=query)
+			).order_by("pk")),
+		]
+
+	def search(self, query, offset=0, limit=20, kinds=KINDS):
+		total, hits = 0, []
+		for kind, qs in self._querysets(query):
+			if kind not in kinds:
+				continue
+			count = qs.count()
+			start = max(offset - total, 0)
+			wanted = limit - len(hits)
+			if wanted > 0 and start < count:
+				pks = qs.values_list("pk", flat=True)[start:start + wanted]
+				hits.extend((kind, pk) for pk in pks)
+			total += count
+		return SearchPage(total, hits)
+
+
+class SQLiteFTS5Backend(SearchBackend):
+	"""
+	BM25-ranked search over an FTS5 virtual table created by migration 0016.
+
+	The rowid encodes (kind, pk) so updates and deletes are rowid seeks
+	rather than scans of the unindexed columns.
+	"""
+
+	table = "main_searchindex"
+	title_weight = 10.0
+	body_weight = 1.0
+	rebuild_batch_size = 500
+
+	def _rowid(self, kind, pk):
+		return pk * len(KINDS) + KINDS.index(kind)
+
+	def _write(self, cursor, document):
+		kind, pk, title, body = document
+		rowid = self._rowid(kind, pk)
+		cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [rowid])
+		cursor.execute(
+			f"INSERT INTO {self.table} (rowid, title, body, kind, object_id) "
+			f"VALUES (%s, %s, %s, %s, %s)",
+			[rowid, title, body, kind, pk])
+
+	def index(self, obj):
+		with connection.cursor() as cursor:
+			self._write(cursor, document_for(obj))
+
+	def remove(self, obj):
+		kind, pk = document_for(obj)[:2]
+		with connection.cursor() as cursor:
+			cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [self._rowid(kind, pk)])
+
+	def rebuild(self):
+		# One transaction, so searches keep seeing the old index until the new
+		# one is complete, and a failure part way leaves the old one in place.
+		count = 0
+		documents = iter_documents()
+		with transaction.atomic(), connection.cursor() as cursor:
+			cursor.execute(f"DELETE FROM {self.table}")
+			while batch := list(islice(documents, self.rebuild_batch_size)):
+				cursor.executemany(
+					f"INSERT INTO {self.table} (rowid, title, body, kind, object_id) "
+					f"VALUES (%s, %s, %s, %s, %s)",
+					[(self._rowid(kind, pk), title, body, kind, pk) for kind, pk, title, body in batch])
+				count += len(batch)
+			cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES ('optimize')")
+		return count
+
+	@staticmethod
+	def match_expression(query):
+		"""
+		Turn free text into a safe FTS5 expression: every word must match,
+		and the last one is a prefix so results follow the user as they type.
+		"""
+		terms = re.findall(r"\w+", query)
+		if not terms:
+			return ""
+		quoted = ['"%s"' % term for term in terms]
+		quoted[-1] += "*"
+		return " ".join(quoted)
+
+	def search(self, query, offset=0, limit=20, kinds=KINDS):
+		expression = self.match_expression(query)
+		if not expression:
+			return SearchPage(0, [])
+		where = f"{self.table} MATCH %s"
+		params = [expression]
+		if set(kinds) != set(KINDS):
+			where += " AND kind IN (%s)" % ", ".join(["%s"] * len(kinds))
+			params += list(kinds)
+		with connection.cursor() as cursor:
+			cursor.execute(f"SELECT count(*) FROM {self.table} WHERE {where}", params)
+			total = cursor.fetchone()[0]
+			if not total or offset >= total:
+				return SearchPage(total, [])
+			cursor.execute(
+				f"SELECT kind, object_id FROM {self.table} WHERE {where} "
+				f"ORDER BY bm25({self.table}, %s, %s) LIMIT %s OFFSET %s",
+				params + [self.title_weight, self.body_weight, limit, offset])
+			hits = [(kind, int(pk)) for kind, pk in cursor.fetchall()]
+		return SearchPage(total, hits)
+
+
+_backend = None
+
+
+def get_search_backend():
+	global _backend
+	if _backend is None:
+		default = "main.search.SQLiteFTS5Backend" if connection.vendor == "sqlite" else "main.search.LikeSearchBackend"
+		_backend = import_string(getattr(settings, "SEARCH_BACKEND", default))()
+	return _backend
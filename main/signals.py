@@ -0,0 +1,107 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Tutorial, TutorialCategory, TutorialSeries
+from .search import get_search_backend
+from . import pagecache
+from .auth import invalidate_cached_user
+from .slugs import slug_registry, CATEGORY, TUTORIAL
+
+
+@receiver(post_save, sender=TutorialCategory)
+def category_saved(sender, instance, **kwargs):
+	slug_registry.update(CATEGORY, instance.pk, instance.category_slug)
+
+
+@receiver(post_delete, sender=TutorialCategory)
+def category_deleted(sender, instance, **kwargs):
+	slug_registry.remove(CATEGORY, instance.pk)
+
+
+@receiver(pre_save, sender=Tutorial)
+def tutorial_saving(sender, instance, raw=False, **kwargs):
+	instance._previous_series_id = None
+	if instance.pk is not None and not raw:
+		instance._previous_series_id = (Tutorial.objects
+			.filter(pk=instance.pk)
+			.values_list("tutorial_series_id", flat=True)
+			.first())
+
+
+@receiver(post_save, sender=Tutorial)
+def tutorial_saved(sender, instance, raw=False, **kwargs):
+	slug_registry.update(TUTORIAL, instance.pk, instance.tutorial_slug)
+	if raw:
+		return
+
+	for tutorial in Tutorial.renumber_series(instance.tutorial_series_id):
+		if tutorial.pk == instance.pk:
+			instance.series_position = tutorial.series_position
+	previous = getattr(instance, "_previous_series_id", None)
+	if previous is not None and previous != instance.tutorial_series_id:
+		Tutorial.renumber_series(previous)
+
+
+@receiver(post_delete, sender=Tutorial)
+def tutorial_deleted(sender, instance, **kwargs):
+	slug_registry.remove(TUTORIAL, instance.pk)
+	Tutorial.renumber_series(instance.tutorial_series_id)
+
+
+@receiver(post_save, sender=Tutorial)
+@receiver(post_save, sender=TutorialSeries)
+@receiver(post_save, sender=TutorialCategory)
+def searchable_saved(sender, instance, raw=False, **kwargs):
+	if not raw:
+		get_search_backend().index(instance)
+
+
+@receiver(post_delete, sender=Tutorial)
+@receiver(post_delete, sender=TutorialSeries)
+@receiver(post_delete, sender=TutorialCategory)
+def searchable_deleted(sender, instance, **kwargs):
+	get_search_backend().remove(instance)
+
+
+@receiver(pre_save, sender=TutorialSeries)
+def series_saving(sender, instance, raw=False, **kwargs):
+	instance._previous_category_id = None
+	if instance.pk is not None and not raw:
+		instance._previous_category_id = (TutorialSeries.objects
+			.filter(pk=instance.pk)
+			.values_list("tutorial_category_id", flat=True)
+			.first())
+
+
+@receiver(post_save, sender=TutorialCategory)
+@receiver(post_delete, sender=TutorialCategory)
+def category_changed(sender, instance, **kwargs):
+	pagecache.invalidate(pagecache.CATEGORIES_TAG, pagecache.category_tag(instance.pk), pagecache.SITEMAP_TAG)
+
+
+@receiver(post_save, sender=TutorialSeries)
+@receiver(post_delete, sender=TutorialSeries)
+def series_changed(sender, instance, **kwargs):
+	tags = [pagecache.series_tag(instance.pk), pagecache.category_tag(instance.tutorial_category_id)]
+	previous = getattr(instance, "_previous_category_id", None)
+	if previous is not None:
+		tags.append(pagecache.category_tag(previous))
+	pagecache.invalidate(*tags)
+
+
+@receiver(post_save, sender=Tutorial)
+@receiver(post_delete, sender=Tutorial)
+def tutorial_changed(sender, instance, **kwargs):
+	tags = [pagecache.tutorial_tag(instance.pk), pagecache.series_tag(instance.tutorial_series_id),
+	        pagecache.SITEMAP_TAG]
+	previous = getattr(instance, "_previous_series_id", None)
+	if previous is not None:
+		tags.append(pagecache.series_tag(previous))
+	pagecache.invalidate(*tags)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+	invalidate_cached_user(instance.pk)
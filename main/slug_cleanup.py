@@ -0,0 +1,103 @@
+"""
+Repair duplicate and placeholder slugs so they can carry a unique index,
+and move pages off reserved slugs such as "index".
+
+Migration 0019 ran the same repair once, with its own copy of this logic;
+the fix_slugs command runs it against the live models, and keeps the
+caches that depend on slugs in step.
+"""
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from . import pagecache
+from .models import RESERVED_SLUGS, Tutorial, TutorialCategory
+from .slugs import slug_registry
+
+
+PLACEHOLDER_SLUGS = {"", "1"}
+
+
+def _usable(slug, seen):
+	return slug and slug not in seen and slug.lower() not in RESERVED_SLUGS
+
+
+def _unique(base, taken):
+	base = (base or "untitled")[:190]
+	candidate, n = base, 2
+	while candidate in taken:
+		candidate = f"{base}-{n}"
+		n += 1
+	taken.add(candidate)
+	return candidate
+
+
+def plan_category_slugs():
+	"""Return {pk: new_slug} for categories whose slug is blank, duplicated or reserved."""
+	taken, changes = set(RESERVED_SLUGS), {}
+	rows = list(TutorialCategory.objects.order_by("pk").values_list("pk", "tutorial_category", "category_slug"))
+	for pk, name, slug in rows:
+		if slug and slug not in taken:
+			taken.add(slug)
+	seen = set()
+	for pk, name, slug in rows:
+		if _usable(slug, seen):
+			seen.add(slug)
+			continue
+		changes[pk] = _unique(slugify(name), taken)
+	return changes
+
+
+def plan_tutorial_slugs(category_changes=None):
+	"""
+	Return {pk: new_slug} for tutorials whose slug is a placeholder, a
+	duplicate, reserved, or shadowed by a category slug (categories win
+	routing).
+	"""
+	category_slugs = set(TutorialCategory.objects.values_list("category_slug", flat=True))
+	category_slugs.update((category_changes or {}).values())
+	rows = list(Tutorial.objects.order_by("pk").values_list("pk", "tutorial_title", "tutorial_slug"))
+	taken = set(category_slugs) | RESERVED_SLUGS
+	taken.update(str(slug) for _, _, slug in rows)
+	seen, changes = set(), {}
+	for pk, title, slug in rows:
+		slug = str(slug)
+		if slug not in PLACEHOLDER_SLUGS and _usable(slug, seen) and slug not in category_slugs:
+			seen.add(slug)
+			continue
+		changes[pk] = _unique(slugify(title), taken)
+	return changes
+
+
+def _invalidate(category_changes, tutorial_changes):
+	series = (Tutorial.objects.filter(pk__in=tutorial_changes)
+		.values_list("tutorial_series_id", flat=True).distinct())
+	# Category and tutorial pages link by slug: the homepage, category grids
+	# (tagged with their series) and series sidebars all change.
+	pagecache.invalidate(
+		pagecache.CATEGORIES_TAG, pagecache.SITEMAP_TAG,
+		*(pagecache.category_tag(pk) for pk in category_changes),
+		*(pagecache.tutorial_tag(pk) for pk in tutorial_changes),
+		*(pagecache.series_tag(pk) for pk in series))
+	slug_registry.clear()
+
+
+def apply_slug_fixes(category_changes=None, tutorial_changes=None):
+	"""
+	Rewrite bad slugs in place, planning them unless given the plans;
+	returns the two change maps. Queryset updates skip the signals, so
+	updated_at, the page cache and the slug registry are refreshed here,
+	once the changes are committed.
+	"""
+	now = timezone.now()
+	if category_changes is None:
+		category_changes = plan_category_slugs()
+	for pk, slug in category_changes.items():
+		TutorialCategory.objects.filter(pk=pk).update(category_slug=slug, updated_at=now)
+	if tutorial_changes is None:
+		tutorial_changes = plan_tutorial_slugs()
+	for pk, slug in tutorial_changes.items():
+		Tutorial.objects.filter(pk=pk).update(tutorial_slug=slug, updated_at=now)
+	if category_changes or tutorial_changes:
+		transaction.on_commit(lambda: _invalidate(category_changes, tutorial_changes))
+	return category_changes, tutorial_changes
@@ -0,0 +1,110 @@
+import threading
+
+from .models import Tutorial, TutorialCategory
+
+
+CATEGORY = "category"
+TUTORIAL = "tutorial"
+
+
+class SlugRegistry:
+	"""
+	In-process map of slug -> (kind, pk) for the catch-all single_slug route.
+
+	Built lazily once per worker and patched through model signals. Other
+	workers do not see those signals, so a miss falls back to the database
+	and a stale hit is dropped by the caller with discard().
+	"""
+
+	def __init__(self):
+		self._lock = threading.RLock()
+		self._slugs = None
+		self._owners = None
+
+	def _ensure_loaded(self):
+		if self._slugs is not None:
+			return
+		with self._lock:
+			if self._slugs is not None:
+				return
+			slugs, owners = {}, {}
+			for pk, slug in Tutorial.objects.values_list("pk", "tutorial_slug"):
+				slugs[str(slug)] = (TUTORIAL, pk)
+				owners[(TUTORIAL, pk)] = str(slug)
+			# Categories win over tutorials, as they always have in single_slug.
+			for pk, slug in TutorialCategory.objects.values_list("pk", "category_slug"):
+				slugs[slug] = (CATEGORY, pk)
+				owners[(CATEGORY, pk)] = slug
+			self._owners = owners
+			self._slugs = slugs
+
+	def _lookup_db(self, slug):
+		pk = TutorialCategory.objects.filter(category_slug=slug).values_list("pk", flat=True).first()
+		if pk is not None:
+			return (CATEGORY, pk)
+		pk = Tutorial.objects.filter(tutorial_slug=slug).values_list("pk", flat=True).first()
+		if pk is not None:
+			return (TUTORIAL, pk)
+		return None
+
+	def resolve(self, slug):
+		"""Return (kind, pk) for slug, or None if nothing owns it."""
+		self._ensure_loaded()
+		match = self._slugs.get(slug)
+		if match is None:
+			match = self._lookup_db(slug)
+			if match is not None:
+				self._set(match[0], match[1], slug)
+		return match
+
+	def _set(self, kind, pk, slug):
+		with self._lock:
+			current = self._slugs.get(slug)
+			if kind == TUTORIAL and current is not None and current[0] == CATEGORY:
+				return
+			self._slugs[slug] = (kind, pk)
+			self._owners[(kind, pk)] = slug
+
+	def _remove(self, kind, pk):
+		with self._lock:
+			slug = self._owners.pop((kind, pk), None)
+			if slug is not None and self._slugs.get(slug) == (kind, pk):
+				del self._slugs[slug]
+
+	def update(self, kind, pk, slug):
+		"""Record that the object (kind, pk) now lives at slug."""
+		if self._slugs is None:
+			return
+		self._remove(kind, pk)
+		self._set(kind, pk, str(slug))
+
+	def remove(self, kind, pk):
+		"""Forget the object (kind, pk)."""
+		if self._slugs is None:
+			return
+		self._remove(kind, pk)
+
+	def discard(self, slug):
+		"""Drop a slug whose entry turned out to be stale."""
+		if self._slugs is None:
+			return
+		with self._lock:
+			match = self._slugs.pop(slug, None)
+			if match is not None and self._owners.get(match) == slug:
+				del self._owners[match]
+
+	def clear(self):
+		with self._lock:
+			self._slugs = None
+			self._owners = None
+
+
+slug_registry = SlugRegistry()
+
+
+def resolve_for_request(request, slug):
+	"""slug_registry.resolve() memoised on the request, for views and their validators."""
+	memo = request.__dict__.setdefault("_slug_matches", {})
+	if slug not in memo:
+		memo[slug] = slug_registry.resolve(slug)
+	return memo[slug]
@@ -0,0 +1,84 @@
+"""
+Serve collected static files from STATIC_ROOT without a separate web server.
+
+Precompressed .br/.gz siblings written by main.storage are chosen by
+Accept-Encoding, and content-hashed names are sent with a one year
+immutable Cache-Control so repeat views never refetch them.
+"""
+import mimetypes
+import os
+import re
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date
+
+
+HASHED_NAME = re.compile(r"\.[0-9a-f]{12}\.\w+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class StaticFilesMiddleware:
+
+	sync_capable = True
+	async_capable = True
+
+	def __init__(self, get_response):
+		self.get_response = get_response
+		self.prefix = settings.STATIC_URL if settings.STATIC_URL.startswith("/") else "/" + settings.STATIC_URL
+		self.root = settings.STATIC_ROOT
+		self.max_age = getattr(settings, "STATIC_MAX_AGE", 60)
+		if iscoroutinefunction(self.get_response):
+			markcoroutinefunction(self)
+
+	def _static(self, request):
+		if (self.root and request.method in ("GET", "HEAD")
+				and request.path_info.startswith(self.prefix)):
+			return self.serve(request, request.path_info[len(self.prefix):])
+		return None
+
+	def __call__(self, request):
+		if iscoroutinefunction(self):
+			return self.__acall__(request)
+		return self._static(request) or self.get_response(request)
+
+	async def __acall__(self, request):
+		# A stat() and an open(); FileResponse streams the body off the loop.
+		return self._static(request) or await self.get_response(request)
+
+	def serve(self, request, name):
+		try:
+			path = safe_join(self.root, name)
+		except ValueError:
+			return None
+		if not os.path.isfile(path):
+			return None
+
+		stat = os.stat(path)
+		content_type, _ = mimetypes.guess_type(path)
+		accepted = request.headers.get("Accept-Encoding", "")
+		encoding = None
+		for coding, suffix in ENCODINGS:
+			if coding in accepted and os.path.isfile(path + suffix):
+				path, encoding = path + suffix, coding
+				break
+
+		# Each encoding is its own representation, so it gets its own ETag.
+		etag = f'"{int(stat.st_mtime)}-{stat.st_size}{"-" + encoding if encoding else ""}"'
+		if etag in (tag.strip() for tag in request.headers.get("If-None-Match", "").split(",")):
+			response = HttpResponseNotModified()
+			response["Vary"] = "Accept-Encoding"
+			response["ETag"] = etag
+			return response
+
+		response = FileResponse(open(path, "rb"), content_type=content_type or "application/octet-stream")
+		if encoding:
+			response["Content-Encoding"] = encoding
+		response["Vary"] = "Accept-Encoding"
+		response["ETag"] = etag
+		response["Last-Modified"] = http_date(stat.st_mtime)
+		response["Cache-Control"] = IMMUTABLE if HASHED_NAME.search(name) else f"public, max-age={self.max_age}"
+		return response
@@ -0,0 +1,73 @@
+import gzip
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+from .assets import minify_css, purge_css, used_tokens
+
+try:
+	import brotli
+except ImportError:
+	brotli = None
+
+
+COMPRESSIBLE = (".css", ".js", ".svg", ".html", ".txt", ".json", ".map", ".xml")
+
+
+class OptimizedStaticFilesStorage(ManifestStaticFilesStorage):
+	"""
+	collectstatic storage that purges and minifies CSS, content-hashes every
+	file and writes .gz (and, when the brotli package is installed, .br)
+	siblings for main.static_serving to hand out.
+
+	Names missing from the manifest (e.g. in tests before collectstatic has
+	run) fall back to their unhashed URL instead of raising.
+	"""
+
+	manifest_strict = False
+
+	def stored_name(self, name):
+		try:
+			return super().stored_name(name)
+		except ValueError:
+			return name
+
+	def _build_css(self, paths):
+		purge = set(getattr(settings, "CSS_PURGE", []))
+		tokens = used_tokens() if purge else set()
+		for name in list(paths):
+			if not name.endswith(".css"):
+				continue
+			source_storage, source_path = paths[name]
+			with source_storage.open(source_path) as f:
+				css = f.read().decode("utf-8")
+			if name in purge:
+				css = purge_css(css, tokens)
+			css = minify_css(css)
+			self.delete(name)
+			self._save(name, ContentFile(css.encode("utf-8")))
+			# Hash and copy the built file rather than the original source.
+			paths[name] = (self, name)
+
+	def _compress(self, name):
+		if not name.endswith(COMPRESSIBLE):
+			return
+		path = self.path(name)
+		with open(path, "rb") as f:
+			data = f.read()
+		with open(path + ".gz", "wb") as f:
+			f.write(gzip.compress(data, 9, mtime=0))
+		if brotli is not None:
+			with open(path + ".br", "wb") as f:
+				f.write(brotli.compress(data))
+
+	def post_process(self, paths, dry_run=False, **options):
+		if dry_run:
+			return
+		self._build_css(paths)
+		for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+			if hashed_name and not isinstance(processed, Exception):
+				self._compress(name)
+				self._compress(hashed_name)
+			yield name, hashed_name, processed
@@ -0,0 +1,28 @@
+from django import template
+
+from main import pagecache
+
+
+register = template.Library()
+
+
+@register.simple_tag
+def content_version(categories=False, category=None, series=None, tutorial=None):
+	"""
+	The current version of the named content, for use as a {% cache %}
+	vary_on argument. Saving or deleting that content bumps the version,
+	so fragments rendered from it are never served stale.
+
+		{% content_version series=tutorial.tutorial_series_id as version %}
+		{% cache fragment_cache_timeout series_sidebar version %}...{% endcache %}
+	"""
+	tags = []
+	if categories:
+		tags.append(pagecache.CATEGORIES_TAG)
+	if category is not None:
+		tags.append(pagecache.category_tag(category))
+	if series is not None:
+		tags.append(pagecache.series_tag(series))
+	if tutorial is not None:
+		tags.append(pagecache.tutorial_tag(tutorial))
+	return pagecache.content_version(*tags)
@@ -0,0 +1,35 @@
+import functools
+import os
+
+from django import template
+from django.conf import settings
+from django.utils.safestring import mark_safe
+
+from main.assets import critical_css_dir
+
+
+register = template.Library()
+
+STYLESHEETS = ("main/css/materialize.css", "main/css/style.css", "main/css/highlight.css")
+
+
+@functools.lru_cache(maxsize=None)
+def _critical_css(page):
+	# Built files only change on deploy, so they are read once per process.
+	try:
+		with open(os.path.join(critical_css_dir(), f"{page}.css"), encoding="utf-8") as f:
+			return mark_safe(f.read())
+	except FileNotFoundError:
+		return None
+
+
+@register.inclusion_tag("main/includes/stylesheets.html")
+def stylesheets(page=None):
+	"""
+	Link the site stylesheets. With the critical CSS for page built, it is
+	inlined and the full stylesheets load without blocking first paint.
+	"""
+	critical = None
+	if page and getattr(settings, "CRITICAL_CSS", True):
+		critical = _critical_css(page)
+	return {"critical_css": critical, "stylesheets": STYLESHEETS}
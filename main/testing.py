@@ -0,0 +1,38 @@
+from contextlib import ContextDecorator
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetExceeded(AssertionError):
+	pass
+
+
+class query_budget(ContextDecorator):
+	"""
+	Fail when the wrapped block or function runs more than limit queries.
+
+	Usable as `with query_budget(3):` or `@query_budget(3)`. The error lists
+	every captured statement so the offending N+1 is visible in the output.
+	"""
+
+	def __init__(self, limit, using=DEFAULT_DB_ALIAS):
+		self.limit = limit
+		self.using = using
+
+	def __enter__(self):
+		self.captured = CaptureQueriesContext(connections[self.using])
+		self.captured.__enter__()
+		return self.captured
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.captured.__exit__(exc_type, exc_value, traceback)
+		if exc_type is not None:
+			return False
+		executed = len(self.captured)
+		if executed > self.limit:
+			statements = "\n".join(
+				f"{i}. {query['sql']}" for i, query in enumerate(self.captured.captured_queries, 1))
+			raise QueryBudgetExceeded(
+				f"{executed} queries executed, budget is {self.limit}:\n{statements}")
+		return False
@@ -1,3 +1,1085 @@
-from django.test import TestCase
+import gzip
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from itertools import islice
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from .assets import critical_css
+from .contact_queue import ContactQueue
+from .export import page_path
+from .instrumentation import metrics
+from . import contact_queue, hashing, pagecache, search, throttle
+from .models import ContactMessage, Tutorial, TutorialCategory, TutorialSeries
+from .rendering import HTML, render_content
+from .slugs import CATEGORY, TUTORIAL, slug_registry
+from .testing import query_budget
+
+
+DUMMY_CACHES = {
+	'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+}
+
+CORPUS_SIZES = [(1, 1, 3), (2, 3, 4), (3, 5, 8)]
+
+
+def build_corpus(prefix, categories, series, tutorials):
+	"""Create a small category/series/tutorial tree and return handy rows from it."""
+	corpus = {"categories": [], "series": [], "tutorials": []}
+	for c in range(categories):
+		category = TutorialCategory.objects.create(
+			tutorial_category=f"{prefix} category {c}",
+			category_summary="Summary",
+			category_slug=f"{prefix}-c{c}")
+		corpus["categories"].append(category)
+		for s in range(series):
+			one_series = TutorialSeries.objects.create(
+				tutorial_series=f"{prefix} series {c}.{s}",
+				tutorial_category=category,
+				series_summary="Learn python step by step")
+			corpus["series"].append(one_series)
+			for t in range(tutorials):
+				corpus["tutorials"].append(Tutorial.objects.create(
+					tutorial_title=f"{prefix} python tutorial {c}.{s}.{t}",
+					tutorial_content="<p>python " * 50 + "</p>",
+					tutorial_series=one_series,
+					tutorial_slug=f"{prefix}-c{c}-s{s}-t{t}"))
+	# A tutorial with both neighbours, so prev and next are rendered.
+	corpus["tutorial"] = corpus["tutorials"][min(1, len(corpus["tutorials"]) - 1)]
+	corpus["category"] = corpus["categories"][-1]
+	return corpus
+
+
+@override_settings(CACHES=DUMMY_CACHES,
+				   PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+				   CONTACT_QUEUE={'ENABLED': False}, CONTACT_THROTTLE=None)
+class QueryBudgetTests(TestCase):
+	"""
+	Every URL in main/urls.py runs within a fixed query budget, and the
+	largest corpus never needs more queries than the smallest.
+	"""
+
+	def setUp(self):
+		slug_registry.clear()
+		self.user = User.objects.create_user("reader", "reader@example.com", "s3cret-pass-phrase")
+
+	def assertQueryBudget(self, budget, request, login=False, status=200):
+		counts = []
+		for n, sizes in enumerate(CORPUS_SIZES):
+			corpus = build_corpus(f"k{n}", *sizes)
+			if login:
+				self.client.force_login(self.user)
+			request(self.client, corpus)  # warm per-process state such as the slug registry
+			if login:
+				self.client.force_login(self.user)
+			with query_budget(budget) as captured:
+				response = request(self.client, corpus)
+			self.assertEqual(response.status_code, status)
+			counts.append(len(captured))
+		self.assertLessEqual(counts[-1], counts[0],
+							 f"query count grows with the corpus: {dict(zip(CORPUS_SIZES, counts))}")
+
+	def test_homepage(self):
+		self.assertQueryBudget(2, lambda c, corpus: c.get("/"))
+
+	def test_category(self):
+		self.assertQueryBudget(3, lambda c, corpus: c.get(f"/{corpus['category'].category_slug}"))
+
+	def test_tutorial(self):
+		self.assertQueryBudget(3, lambda c, corpus: c.get(f"/{corpus['tutorial'].tutorial_slug}"))
+
+	def test_tutorial_signed_in(self):
+		self.assertQueryBudget(5, lambda c, corpus: c.get(f"/{corpus['tutorial'].tutorial_slug}"), login=True)
+
+	def test_unknown_slug(self):
+		self.assertQueryBudget(2, lambda c, corpus: c.get("/no-such-page"), status=404)
+
+	def test_search(self):
+		self.assertQueryBudget(6, lambda c, corpus: c.get("/search/", {"q": "python"}))
+
+	def test_search_empty(self):
+		self.assertQueryBudget(1, lambda c, corpus: c.get("/search/"))
+
+	def test_contact_get(self):
+		self.assertQueryBudget(0, lambda c, corpus: c.get("/contact/"))
+
+	def test_contact_post(self):
+		self.assertQueryBudget(3, lambda c, corpus: c.post("/contact/", {
+			"name": "Reader", "email": "reader@example.com",
+			"subject": "Hello", "message": "Hi there"}), status=302)
+
+	def test_login_get(self):
+		self.assertQueryBudget(0, lambda c, corpus: c.get("/login/"))
+
+	def test_register_get(self):
+		self.assertQueryBudget(0, lambda c, corpus: c.get("/register/"))
+
+	def test_logout(self):
+		self.assertQueryBudget(4, lambda c, corpus: c.get("/logout/"), login=True, status=302)
+
+	def test_account(self):
+		self.assertQueryBudget(2, lambda c, corpus: c.get("/account/"), login=True)
+
+	def test_edit_profile(self):
+		self.assertQueryBudget(2, lambda c, corpus: c.get("/account/edit/"), login=True)
+
+	def test_change_password(self):
+		self.assertQueryBudget(2, lambda c, corpus: c.get("/account/change-password/"), login=True)
+
+	def test_request_metrics(self):
+		self.user.is_staff = True
+		self.user.save()
+		self.assertQueryBudget(2, lambda c, corpus: c.get("/metrics/"), login=True)
+
+	def test_api_tutorial_list(self):
+		self.assertQueryBudget(2, lambda c, corpus: c.get("/api/tutorials/", {"limit": 5}))
+
+	def test_api_series_list(self):
+		self.assertQueryBudget(2, lambda c, corpus: c.get(
+			"/api/series/", {"category": corpus["category"].category_slug}))
+
+	def test_api_tutorial_detail(self):
+		self.assertQueryBudget(1, lambda c, corpus: c.get(f"/api/tutorials/{corpus['tutorial'].tutorial_slug}/"))
+
+	def test_api_category_detail(self):
+		self.assertQueryBudget(1, lambda c, corpus: c.get(f"/api/categories/{corpus['category'].category_slug}/"))
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+									  'LOCATION': 'cached-auth-tests'}},
+				   PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class CachedAuthTests(TestCase):
+
+	def setUp(self):
+		self.user = User.objects.create_user("reader", "reader@example.com", "s3cret-pass-phrase")
+		self.client.force_login(self.user)
+		self.corpus = build_corpus("auth", 1, 1, 3)
+
+	def test_signed_in_tutorial_read_needs_no_auth_queries(self):
+		path = f"/{self.corpus['tutorial'].tutorial_slug}"
+		self.client.get(path)
+		with query_budget(3) as captured:
+			self.assertEqual(self.client.get(path).status_code, 200)
+		tables = " ".join(query["sql"] for query in captured.captured_queries)
+		self.assertNotIn("auth_user", tables)
+		self.assertNotIn("django_session", tables)
+
+	def test_profile_edit_invalidates_cached_user(self):
+		self.client.get("/account/")
+		self.client.post("/account/edit/", {"first_name": "Ada", "last_name": "", "email": "ada@example.com"})
+		response = self.client.get("/account/edit/")
+		self.assertEqual(response.context["user"].email, "ada@example.com")
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+									  'LOCATION': 'fragment-cache-tests'}},
+				   PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class FragmentCacheTests(TestCase):
+
+	def setUp(self):
+		self.user = User.objects.create_user("reader", "reader@example.com", "s3cret-pass-phrase")
+		self.corpus = build_corpus("fragments", 1, 1, 3)
+
+	def test_category_grid_is_cached_until_categories_change(self):
+		self.client.force_login(self.user)
+		self.client.get("/")
+		with CaptureQueriesContext(connection) as captured:
+			self.client.get("/")
+		# Only the conditional-GET freshness check; the grid itself is not queried.
+		self.assertNotIn("category_summary", " ".join(q["sql"] for q in captured.captured_queries))
+
+		TutorialCategory.objects.create(tutorial_category="Brand new", category_summary="New",
+										category_slug="brand-new")
+		self.assertContains(self.client.get("/"), "Brand new")
+
+	def test_navbar_follows_the_signed_in_user(self):
+		self.assertContains(self.client.get("/contact/"), "Login")
+		self.client.force_login(self.user)
+		response = self.client.get("/contact/")
+		self.assertContains(response, "reader")
+		self.assertNotContains(response, "Login")
+
+	def test_series_sidebar_follows_tutorial_titles(self):
+		self.client.force_login(self.user)
+		first, second = self.corpus["tutorials"][:2]
+		self.client.get(f"/{first.tutorial_slug}")
+		second.tutorial_title = "Renamed part two"
+		second.save()
+		self.assertContains(self.client.get(f"/{first.tutorial_slug}"), "Renamed part two")
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+									  'LOCATION': 'page-cache-tests'}})
+class PageCacheTests(TestCase):
+	"""Anonymous pages come from the cache until a save invalidates one of their tags."""
+
+	def setUp(self):
+		caches["default"].clear()
+		self.corpus = build_corpus("pages", 1, 1, 3)
+
+	def assertRefreshedOnSave(self, path, instance, field, value):
+		self.client.get(path)
+		# A write that bypasses the signals leaves the cached page in place...
+		type(instance).objects.filter(pk=instance.pk).update(**{field: value})
+		self.assertNotContains(self.client.get(path), value)
+		# ...and save() drops it.
+		setattr(instance, field, value)
+		instance.save()
+		self.assertContains(self.client.get(path), value)
+
+	def test_category_save_drops_the_homepage(self):
+		self.assertRefreshedOnSave("/", self.corpus["category"], "tutorial_category", "Renamed category")
+
+	def test_series_save_drops_the_category_page(self):
+		self.assertRefreshedOnSave(f"/{self.corpus['category'].category_slug}", self.corpus["series"][0],
+								   "tutorial_series", "Renamed series")
+
+	def test_tutorial_save_drops_the_tutorial_page(self):
+		tutorial = self.corpus["tutorial"]
+		self.assertRefreshedOnSave(f"/{tutorial.tutorial_slug}", tutorial, "tutorial_title", "Renamed tutorial")
+
+	def test_page_invalidated_while_rendering_is_not_stored(self):
+		renders = []
+
+		@pagecache.cache_anonymous_page
+		def view(request):
+			renders.append(request)
+			if len(renders) == 1:
+				pagecache.invalidate("race")
+			return pagecache.tag_response(HttpResponse("page"), "race")
+
+		for _ in range(3):
+			request = RequestFactory().get("/race")
+			request.user = AnonymousUser()
+			view(request)
+		self.assertEqual(len(renders), 2)
+
+
+class ConditionalGetTests(TestCase):
+	"""Public pages answer If-None-Match and If-Modified-Since with 304s, cached or not."""
+
+	def setUp(self):
+		slug_registry.clear()
+		self.corpus = build_corpus("conditional", 1, 1, 3)
+		self.paths = ["/", f"/{self.corpus['category'].category_slug}", f"/{self.corpus['tutorial'].tutorial_slug}"]
+
+	def assertNotModified(self, path):
+		response = self.client.get(path)
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(self.client.get(path, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+		self.assertEqual(self.client.get(path, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code, 304)
+		return response
+
+	@override_settings(CACHES=DUMMY_CACHES)
+	def test_uncached_pages(self):
+		for path in self.paths:
+			with self.subTest(path=path):
+				self.assertNotModified(path)
+
+	@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+										  'LOCATION': 'conditional-get-tests'}})
+	def test_page_cache_hits_reuse_validators_without_queries(self):
+		caches["default"].clear()
+		for path in self.paths:
+			with self.subTest(path=path):
+				first = self.assertNotModified(path)
+				with query_budget(0):
+					hit = self.client.get(path)
+					not_modified = self.client.get(path, HTTP_IF_NONE_MATCH=first["ETag"])
+				self.assertEqual(hit["ETag"], first["ETag"])
+				self.assertEqual(hit["Last-Modified"], first["Last-Modified"])
+				self.assertEqual(not_modified.status_code, 304)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+									  'LOCATION': 'fix-slugs-tests'}})
+class FixSlugsTests(TestCase):
+
+	def setUp(self):
+		caches["default"].clear()
+		slug_registry.clear()
+		self.corpus = build_corpus("slugs", 1, 1, 3)
+
+	def test_fix_refreshes_updated_at_caches_and_registry(self):
+		shadowed, sibling = self.corpus["tutorials"][2], self.corpus["tutorials"][1]
+		old_slug = self.corpus["category"].category_slug
+		Tutorial.objects.filter(pk=shadowed.pk).update(tutorial_slug=old_slug)
+		sibling_path = f"/{sibling.tutorial_slug}"
+		self.assertContains(self.client.get(sibling_path), f'href="/{old_slug}"')
+
+		out = StringIO()
+		with self.captureOnCommitCallbacks(execute=True):
+			call_command("fix_slugs", stdout=out)
+		shadowed.refresh_from_db()
+		self.assertNotEqual(shadowed.tutorial_slug, old_slug)
+		self.assertIn(f"tutorial {shadowed.pk}: {old_slug} -> {shadowed.tutorial_slug}", out.getvalue())
+		self.assertGreater(shadowed.updated_at, sibling.updated_at)
+		# The cached sidebar and the slug registry follow the new slug.
+		self.assertContains(self.client.get(sibling_path), f'href="/{shadowed.tutorial_slug}"')
+		self.assertContains(self.client.get(f"/{shadowed.tutorial_slug}"), shadowed.tutorial_title)
+
+	def test_index_is_reserved(self):
+		category, tutorial = self.corpus["category"], self.corpus["tutorial"]
+		category.category_slug = "index"
+		with self.assertRaises(ValidationError):
+			category.full_clean()
+		TutorialCategory.objects.filter(pk=category.pk).update(category_slug="index", tutorial_category="Index")
+		Tutorial.objects.filter(pk=tutorial.pk).update(tutorial_slug="Index", tutorial_title="Index")
+
+		call_command("fix_slugs", stdout=StringIO())
+		category.refresh_from_db()
+		tutorial.refresh_from_db()
+		self.assertEqual(category.category_slug, "index-2")
+		self.assertEqual(tutorial.tutorial_slug, "index-3")
+		self.assertIsNone(page_path("index"))
+		self.assertEqual(page_path(None), "index.html")
+
+
+@override_settings(CACHES=DUMMY_CACHES)
+class SlugRegistryTests(TestCase):
+	"""The in-process slug registry follows signals, and recovers from changes it never saw."""
+
+	def setUp(self):
+		slug_registry.clear()
+		self.corpus = build_corpus("registry", 1, 1, 3)
+		self.category, self.tutorial = self.corpus["category"], self.corpus["tutorial"]
+		# Load the registry, as the first request in a worker would.
+		self.assertEqual(slug_registry.resolve(self.category.category_slug), (CATEGORY, self.category.pk))
+
+	def assertServes(self, slug, title):
+		self.assertContains(self.client.get(f"/{slug}"), title)
+
+	def assertGone(self, slug):
+		self.assertEqual(self.client.get(f"/{slug}").status_code, 404)
+		self.assertIsNone(slug_registry.resolve(slug))
+
+	def test_renamed_slugs_follow_the_save(self):
+		old_category, old_tutorial = self.category.category_slug, self.tutorial.tutorial_slug
+		self.category.category_slug = "renamed-category"
+		self.category.save()
+		self.tutorial.tutorial_slug = "renamed-tutorial"
+		self.tutorial.save()
+		with self.assertNumQueries(0):
+			self.assertEqual(slug_registry.resolve("renamed-category"), (CATEGORY, self.category.pk))
+			self.assertEqual(slug_registry.resolve("renamed-tutorial"), (TUTORIAL, self.tutorial.pk))
+		self.assertServes("renamed-category", self.corpus["series"][0].tutorial_series)
+		self.assertServes("renamed-tutorial", self.tutorial.tutorial_title)
+		self.assertGone(old_category)
+		self.assertGone(old_tutorial)
+
+	def test_deleted_rows_404(self):
+		category_slug, tutorial_slug = self.category.category_slug, self.tutorial.tutorial_slug
+		self.tutorial.delete()
+		self.assertGone(tutorial_slug)
+		# SET_DEFAULT foreign keys: empty the category before deleting it.
+		Tutorial.objects.all().delete()
+		TutorialSeries.objects.all().delete()
+		self.category.delete()
+		self.assertGone(category_slug)
+
+	def test_stale_entry_from_another_worker_is_discarded(self):
+		# Another worker moves the tutorial and hands its old slug to a
+		# sibling; this worker's registry sees neither change.
+		old_slug, sibling = self.tutorial.tutorial_slug, self.corpus["tutorials"][2]
+		Tutorial.objects.filter(pk=self.tutorial.pk).update(tutorial_slug="moved-elsewhere")
+		Tutorial.objects.filter(pk=sibling.pk).update(tutorial_slug=old_slug)
+		self.assertEqual(slug_registry.resolve(old_slug), (TUTORIAL, self.tutorial.pk))
+
+		self.assertServes(old_slug, sibling.tutorial_title)
+		self.assertEqual(slug_registry.resolve(old_slug), (TUTORIAL, sibling.pk))
+		self.assertServes("moved-elsewhere", self.tutorial.tutorial_title)
+
+		Tutorial.objects.filter(pk=sibling.pk).delete()
+		self.assertGone(old_slug)
+
+
+@override_settings(DATABASE_ROUTERS=["main.routers.PrimaryReplicaRouter"])
+class PrimaryReplicaRouterTests(TransactionTestCase):
+	"""
+	Routing only: the 'replica' alias exists under DJANGO_DB_PROFILE=production,
+	and querysets pick their alias without connecting.
+	"""
+
+	def test_reads_go_to_the_replica(self):
+		self.assertEqual(Tutorial.objects.all().db, "replica")
+		self.assertEqual(TutorialCategory.objects.filter(pk=1).db, "replica")
+
+	def test_reads_inside_a_transaction_stay_on_the_primary(self):
+		with transaction.atomic():
+			self.assertEqual(Tutorial.objects.all().db, "default")
+		self.assertEqual(Tutorial.objects.all().db, "replica")
+
+	def test_reads_through_a_primary_instance_stay_on_the_primary(self):
+		category = TutorialCategory.objects.create(tutorial_category="Routed", category_summary="S",
+												   category_slug="routed")
+		self.assertEqual(category._state.db, "default")
+		self.assertEqual(category.tutorialseries_set.all().db, "default")
+
+
+@override_settings(CACHES=DUMMY_CACHES, REQUEST_METRICS_SAMPLE_RATE=1.0)
+class RequestMetricsTests(TestCase):
+
+	def setUp(self):
+		slug_registry.clear()
+		self.corpus = build_corpus("metrics", 1, 1, 3)
+		metrics.reset()
+		self.addCleanup(metrics.reset)
+
+	def test_sampled_request_is_recorded_under_its_view_name(self):
+		response = self.client.get(f"/{self.corpus['tutorial'].tutorial_slug}")
+		recorded = metrics.snapshot()
+		self.assertEqual(list(recorded), ["main:single_slug"])
+		sample = recorded["main:single_slug"]
+		self.assertEqual({name: h["count"] for name, h in sample.items()},
+						 {"wall_ms": 1, "db_ms": 1, "template_ms": 1, "queries": 1, "response_bytes": 1})
+		self.assertGreaterEqual(sample["queries"]["max"], 2)
+		self.assertGreater(sample["template_ms"]["max"], 0)
+		self.assertGreaterEqual(sample["wall_ms"]["max"], sample["db_ms"]["max"])
+		self.assertEqual(sample["response_bytes"]["max"], len(response.content))
+
+	@override_settings(REQUEST_METRICS_SAMPLE_RATE=0)
+	def test_zero_sample_rate_records_nothing(self):
+		self.client.get("/")
+		self.client.get(f"/{self.corpus['tutorial'].tutorial_slug}")
+		self.assertEqual(metrics.snapshot(), {})
+
+	def test_metrics_are_for_staff_only(self):
+		self.assertEqual(self.client.get("/metrics/").status_code, 302)
+		user = User.objects.create_user("reader", "reader@example.com", "s3cret-pass-phrase")
+		self.client.force_login(user)
+		self.assertEqual(self.client.get("/metrics/").status_code, 302)
+		user.is_staff = True
+		user.save()
+		response = self.client.get("/metrics/")
+		self.assertEqual(response.status_code, 200)
+		self.assertIn("main:request_metrics", response.json())
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class LoginProtectionTests(TestCase):
+
+	def setUp(self):
+		throttle._configured.clear()
+		User.objects.create_user("reader", "reader@example.com", "s3cret-pass-phrase")
+
+	@override_settings(LOGIN_THROTTLE={'USERNAME': {'RATE_PER_MINUTE': 1, 'BURST': 2}})
+	def test_login_is_throttled_per_username(self):
+		attempts = [("reader", "wrong"), ("reader", "s3cret-pass-phrase"), ("READER", "s3cret-pass-phrase")]
+		statuses = [
+			self.client.post("/login/", {"username": username, "password": password},
+							 REMOTE_ADDR=f"10.0.0.{i}").status_code
+			for i, (username, password) in enumerate(attempts)]
+		self.assertEqual(statuses, [200, 302, 429])
+
+	@override_settings(LOGIN_THROTTLE=None,
+					   PASSWORD_HASHING={'MAX_WORKERS': 1, 'MAX_QUEUE': 0, 'QUEUE_TIMEOUT': 0.01})
+	def test_login_is_refused_while_hashing_slots_are_taken(self):
+		started, release = threading.Event(), threading.Event()
+
+		def hold_slot():
+			started.set()
+			release.wait()
+
+		holder = threading.Thread(target=hashing.run, args=(hold_slot,))
+		holder.start()
+		started.wait()
+		try:
+			response = self.client.post("/login/", {"username": "reader", "password": "s3cret-pass-phrase"})
+		finally:
+			release.set()
+			holder.join()
+		self.assertEqual(response.status_code, 503)
+		response = self.client.post("/login/", {"username": "reader", "password": "s3cret-pass-phrase"})
+		self.assertEqual(response.status_code, 302)
+
+	@override_settings(LOGIN_THROTTLE=None)
+	def test_register_hashes_on_executor_and_reports_password_changed(self):
+		with mock.patch.object(hashing, "run", wraps=hashing.run) as run, \
+				mock.patch("django.contrib.auth.password_validation.password_changed") as changed:
+			response = self.client.post("/register/", {
+				"username": "writer", "email": "writer@example.com",
+				"password1": "an0ther-pass-phrase", "password2": "an0ther-pass-phrase"})
+		self.assertEqual(response.status_code, 302)
+		user = User.objects.get(username="writer")
+		self.assertTrue(user.check_password("an0ther-pass-phrase"))
+		run.assert_called()
+		changed.assert_called_once_with("an0ther-pass-phrase", user)
+
+
+@override_settings(CACHES=DUMMY_CACHES,
+				   PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class AsyncViewTests(TestCase):
+	"""The async views behind my_site.asgi_urls render the same pages as the sync ones."""
+
+	def setUp(self):
+		slug_registry.clear()
+		self.corpus = build_corpus("async", 2, 2, 3)
+		self.paths = ["/", f"/{self.corpus['category'].category_slug}",
+					  f"/{self.corpus['tutorial'].tutorial_slug}", "/no-such-page",
+					  "/search/?q=python", "/search/"]
+
+	async def test_async_pages_match_sync_pages(self):
+		for path in self.paths:
+			expected = await sync_to_async(self.client.get)(path)
+			with self.settings(ROOT_URLCONF="my_site.asgi_urls"):
+				response = await self.async_client.get(path)
+			self.assertEqual(response.status_code, expected.status_code, path)
+			self.assertEqual(response.content, expected.content, path)
+			self.assertEqual(response.get("ETag"), expected.get("ETag"), path)
+
+	async def test_async_search_context_matches_sync(self):
+		for params in [{"q": "python"}, {}]:
+			expected = await sync_to_async(self.client.get)("/search/", params)
+			with self.settings(ROOT_URLCONF="my_site.asgi_urls"):
+				response = await self.async_client.get("/search/", params)
+			self.assertEqual(list(response.context["categories"]), self.corpus["categories"], params)
+			for key in ("query", "page", "total", "previous_page", "next_page"):
+				self.assertEqual(response.context[key], expected.context[key], (params, key))
+
+	async def test_signed_in_async_page(self):
+		user = await User.objects.acreate_user("reader", "reader@example.com", "s3cret-pass-phrase")
+		await self.async_client.aforce_login(user)
+		with self.settings(ROOT_URLCONF="my_site.asgi_urls"):
+			response = await self.async_client.get(f"/{self.corpus['tutorial'].tutorial_slug}")
+		self.assertContains(response, "reader")
+
+
+class ContactQueueTests(TestCase):
+
+	def setUp(self):
+		self.spool_dir = tempfile.mkdtemp()
+		self.queue = ContactQueue(self.spool_dir, start_thread=False)
+
+	def submit(self, n):
+		for i in range(n):
+			self.queue.submit({"name": f"Sender {i}", "email": "sender@example.com",
+							   "subject": "Hello", "message": "Hi there"})
+
+	def test_flush_writes_spooled_messages_in_one_batch(self):
+		self.submit(3)
+		self.assertEqual(ContactMessage.objects.count(), 0)
+		with query_budget(3):
+			self.assertEqual(self.queue.flush(), 3)
+		self.assertEqual(ContactMessage.objects.count(), 3)
+		self.assertEqual([name for name in os.listdir(self.spool_dir) if not name.endswith(".lock")], [])
+
+	def test_flush_keeps_the_time_a_message_was_submitted(self):
+		submitted = datetime(2026, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc)
+		with mock.patch.object(contact_queue.timezone, "now", return_value=submitted):
+			self.submit(1)
+		self.queue.flush()
+		self.assertEqual(ContactMessage.objects.get().created_at, submitted)
+
+	def test_orphaned_spool_is_recovered(self):
+		with open(os.path.join(self.spool_dir, "999999999.jsonl"), "w") as f:
+			f.write('{"name": "Lost", "email": "lost@example.com", "subject": "S", "message": "M"}\n')
+		self.assertEqual(self.queue.flush(), 1)
+		self.assertTrue(ContactMessage.objects.filter(name="Lost").exists())
+
+	def test_spool_is_claimed_only_once_its_owner_lock_is_released(self):
+		# Same PID for both queues, as when a crashed worker's PID is reused.
+		other = ContactQueue(self.spool_dir, start_thread=False)
+		other.submit({"name": "Other", "email": "other@example.com", "subject": "S", "message": "M"})
+		self.assertEqual(self.queue.flush(), 0)
+		self.assertTrue(os.path.exists(other.spool_path))
+		os.close(other._lock_fd)  # the kernel releases the flock when a worker dies
+		self.assertEqual(self.queue.flush(), 1)
+		self.assertTrue(ContactMessage.objects.filter(name="Other").exists())
+		self.assertEqual(sorted(os.listdir(self.spool_dir)), [f"{self.queue._owner}.lock"])
+
+	def test_global_queue_is_created_once_under_concurrent_first_use(self):
+		created = []
+
+		def slow_queue(*args, **kwargs):
+			created.append(args)
+			time.sleep(0.05)
+			return mock.Mock()
+
+		start = threading.Barrier(4)
+
+		def first_use():
+			start.wait()
+			contact_queue.get_contact_queue()
+
+		with mock.patch.object(contact_queue, "_queue", None), \
+				mock.patch.object(contact_queue, "ContactQueue", side_effect=slow_queue), \
+				mock.patch.object(contact_queue.atexit, "register") as register:
+			threads = [threading.Thread(target=first_use) for _ in range(4)]
+			for thread in threads:
+				thread.start()
+			for thread in threads:
+				thread.join()
+		self.assertEqual(len(created), 1)
+		register.assert_called_once()
+
+	@override_settings(CONTACT_QUEUE={'ENABLED': False},
+					   CONTACT_THROTTLE={'RATE_PER_MINUTE': 1, 'BURST': 2})
+	def test_contact_posts_are_throttled_per_ip(self):
+		data = {"name": "Spam", "email": "spam@example.com", "subject": "S", "message": "M"}
+		statuses = [self.client.post("/contact/", data).status_code for _ in range(3)]
+		self.assertEqual(statuses, [302, 302, 429])
+		self.assertEqual(ContactMessage.objects.count(), 2)
+
+
+class CriticalCSSTests(SimpleTestCase):
+
+	def test_keeps_only_rules_for_markup_above_the_fold(self):
+		css = """
+			nav .brand-logo { color: red; }
+			.card { margin: 0; }
+			.card:hover { box-shadow: none; }
+			table td { padding: 0; }
+			@media print { nav { display: none; } }
+			@media only screen and (min-width: 601px) { .card { margin: 1px; } .modal { top: 0; } }
+			@keyframes spin { to { transform: rotate(1turn); } }
+		"""
+		html = '<body><nav><a class="brand-logo">T</a></nav>' + "x" * 100 + '<div class="card"></div><table></table>'
+		self.assertEqual(
+			critical_css(css, html, fold_chars=80),
+			"nav .brand-logo{color:red}")
+		self.assertEqual(
+			critical_css(css, html),
+			"nav .brand-logo{color:red}.card{margin:0}"
+			"@media only screen and (min-width:601px){.card{margin:1px}}")
+
+
+class StaticFilesTests(SimpleTestCase):
+	"""collectstatic through main.storage, then serving through main.static_serving."""
+
+	CSS = "/* header */\n.used { color: red; }\n.unused { color: blue; }\n"
+
+	def setUp(self):
+		source, self.root = tempfile.mkdtemp(), tempfile.mkdtemp()
+		files = {"main/css/site.css": self.CSS, "main/js/app.js": "var used = 1;\n" * 50,
+				 "main/img/logo.png": "\x89PNG", "template.html": '<p class="used">'}
+		for name, content in files.items():
+			os.makedirs(os.path.dirname(os.path.join(source, name)), exist_ok=True)
+			with open(os.path.join(source, name), "w") as f:
+				f.write(content)
+		self.settings_override = override_settings(
+			STATIC_ROOT=self.root, STATICFILES_DIRS=[source],
+			STATICFILES_FINDERS=["django.contrib.staticfiles.finders.FileSystemFinder"],
+			CSS_PURGE=["main/css/site.css"], CSS_PURGE_SOURCES=[os.path.join(source, "template.html")])
+		self.settings_override.enable()
+		self.addCleanup(self.settings_override.disable)
+		call_command("collectstatic", interactive=False, verbosity=0)
+		with open(os.path.join(self.root, "staticfiles.json")) as f:
+			self.manifest = json.load(f)["paths"]
+
+	def read(self, name):
+		with open(os.path.join(self.root, name), "rb") as f:
+			return f.read()
+
+	def test_collectstatic_purges_minifies_hashes_and_precompresses(self):
+		css = self.manifest["main/css/site.css"]
+		self.assertRegex(css, r"^main/css/site\.[0-9a-f]{12}\.css$")
+		self.assertEqual(self.read(css), b".used{color:red}")
+		for name in (css, self.manifest["main/js/app.js"], "main/js/app.js"):
+			self.assertEqual(gzip.decompress(self.read(name + ".gz")), self.read(name), name)
+		self.assertFalse(os.path.exists(os.path.join(self.root, self.manifest["main/img/logo.png"] + ".gz")))
+
+	def test_serves_each_encoding_with_its_own_etag(self):
+		path = "/static/" + self.manifest["main/js/app.js"]
+		gzipped = self.client.get(path, headers={"Accept-Encoding": "gzip, deflate"})
+		plain = self.client.get(path)
+		self.assertEqual(gzipped["Content-Encoding"], "gzip")
+		self.assertEqual(b"".join(gzipped.streaming_content), self.read(self.manifest["main/js/app.js"] + ".gz"))
+		self.assertNotIn("Content-Encoding", plain)
+		self.assertTrue(gzipped["ETag"].endswith('-gzip"'))
+		self.assertNotEqual(gzipped["ETag"], plain["ETag"])
+		for response in (gzipped, plain):
+			self.assertEqual(response["Vary"], "Accept-Encoding")
+			self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+			response.close()
+
+		revalidated = self.client.get(path, headers={"Accept-Encoding": "gzip", "If-None-Match": gzipped["ETag"]})
+		self.assertEqual(revalidated.status_code, 304)
+		self.assertEqual(revalidated["ETag"], gzipped["ETag"])
+		# The gzip validator must not revalidate the identity body.
+		response = self.client.get(path, headers={"If-None-Match": gzipped["ETag"]})
+		self.assertEqual(response.status_code, 200)
+		response.close()
+
+	@override_settings(STATIC_MAX_AGE=60)
+	def test_unhashed_names_get_a_short_max_age_and_missing_files_fall_through(self):
+		response = self.client.get("/static/main/js/app.js")
+		self.assertEqual(response["Cache-Control"], "public, max-age=60")
+		response.close()
+		self.assertEqual(self.client.get("/static/main/js/missing.js").status_code, 404)
+
+
+class RenderingTests(TestCase):
+
+	def test_sanitizer_drops_scripts_handlers_and_unsafe_urls(self):
+		rendered = render_content(
+			'<p onclick="x()">Hi<script>alert(1)</script></p>'
+			'<a href="javascript:alert(1)">a</a><a href="https://example.com">b</a>', HTML)
+		self.assertEqual(rendered.html, '<p>Hi</p><a>a</a><a href="https://example.com">b</a>')
+
+	def test_sanitizer_sees_through_control_characters_in_url_schemes(self):
+		for url in ["java&#9;script:alert(1)", "jav&#x0A;ascript:alert(1)", "java&#13;script:alert(1)",
+					"&#1;javascript:alert(1)", " JaVa&#x7f;Script:alert(1)"]:
+			self.assertEqual(render_content(f'<a href="{url}">a</a>', HTML).html, "<a>a</a>", url)
+			self.assertEqual(render_content(f'<img src="{url}">', HTML).html, "<img>", url)
+			self.assertNotIn("href", render_content(f"[a]({url})").html, url)
+		self.assertEqual(render_content('<a href="/tut&#9;orial">a</a>', HTML).html,
+						 '<a href="/tutorial">a</a>')
+
+	def test_markdown_gets_heading_anchors_toc_and_highlighting(self):
+		rendered = render_content("## Setup\n\n### Setup\n\n```python\nimport os\n```\n")
+		self.assertIn('<h2 id="setup">Setup</h2>', rendered.html)
+		self.assertIn('<h3 id="setup-2">Setup</h3>', rendered.html)
+		self.assertIn('<div class="highlight">', rendered.html)
+		self.assertEqual(rendered.toc, [
+			{"level": 2, "id": "setup", "title": "Setup"},
+			{"level": 3, "id": "setup-2", "title": "Setup"},
+		])
+
+	def test_renders_on_save_only_when_the_source_changes(self):
+		tutorial = build_corpus("render", 1, 1, 1)["tutorial"]
+		tutorial.tutorial_content = "# Title\n\nSome *text*."
+		tutorial.save()
+		self.assertIn("<em>text</em>", tutorial.rendered_html)
+		self.assertEqual(tutorial.tutorial_excerpt, "Title Some text.")
+
+		tutorial = Tutorial.objects.get(pk=tutorial.pk)
+		with mock.patch("main.models.render_content") as render:
+			tutorial.tutorial_title = "Renamed"
+			tutorial.save()
+			tutorial.save(update_fields=["tutorial_title"])
+		render.assert_not_called()
+
+
+class SearchIndexTests(TestCase):
+
+	def setUp(self):
+		self.corpus = build_corpus("index", 1, 1, 2)
+		self.backend = search.SQLiteFTS5Backend()
+
+	def test_title_matches_rank_above_body_matches(self):
+		series = self.corpus["series"][0]
+		body_only = Tutorial.objects.create(
+			tutorial_title="Animals", tutorial_content="<p>zebra zebra zebra</p>",
+			tutorial_series=series, tutorial_slug="animals")
+		in_title = Tutorial.objects.create(
+			tutorial_title="Zebra", tutorial_content="<p>Stripes</p>",
+			tutorial_series=series, tutorial_slug="zebra")
+		self.assertEqual(self.backend.search("zebra"),
+						 search.SearchPage(2, [(search.TUTORIAL, in_title.pk), (search.TUTORIAL, body_only.pk)]))
+
+	def test_rebuild_command_restores_the_index(self):
+		with connection.cursor() as cursor:
+			cursor.execute(f"DELETE FROM {self.backend.table}")
+		self.assertEqual(self.backend.search("python").total, 0)
+		out = StringIO()
+		call_command("rebuild_search_index", stdout=out)
+		self.assertIn("Indexed 4 documents", out.getvalue())
+		self.assertEqual(self.backend.search("python").total, 3)
+
+	def test_failed_rebuild_keeps_the_old_index(self):
+		def failing_documents():
+			yield from islice(search.iter_documents(), 1)
+			raise RuntimeError("database went away")
+
+		with mock.patch.object(search, "iter_documents", failing_documents), \
+				self.assertRaises(RuntimeError):
+			self.backend.rebuild()
+		self.assertEqual(self.backend.search("python").total, 3)
+
+
+class ApiTests(TestCase):
+
+	def setUp(self):
+		self.corpus = build_corpus("api", 1, 2, 4)
+		# Ties on tutorial_published must still page without gaps or repeats.
+		Tutorial.objects.filter(pk__in=[t.pk for t in self.corpus["tutorials"][:3]]).update(
+			tutorial_published=self.corpus["tutorials"][0].tutorial_published)
+
+	def get_json(self, path, data=None, **headers):
+		response = self.client.get(path, data, **headers)
+		body = b"".join(response.streaming_content) if response.streaming else response.content
+		return response, json.loads(body) if body else None
+
+	def test_cursor_pagination_walks_every_tutorial_once(self):
+		seen, cursor = [], None
+		while True:
+			params = {"limit": 3, "fields": "id"}
+			if cursor:
+				params["cursor"] = cursor
+			with query_budget(2):
+				response, page = self.get_json("/api/tutorials/", params)
+			self.assertEqual(response.status_code, 200)
+			seen += [row["id"] for row in page["results"]]
+			cursor = page["next"]
+			if cursor is None:
+				break
+		expected = Tutorial.objects.order_by("-tutorial_published", "-pk").values_list("pk", flat=True)
+		self.assertEqual(seen, list(expected))
+
+	def test_bodies_are_only_loaded_when_asked_for(self):
+		with CaptureQueriesContext(connection) as captured:
+			response, page = self.get_json("/api/tutorials/")
+		self.assertNotIn("html", page["results"][0])
+		sql = " ".join(q["sql"] for q in captured.captured_queries)
+		self.assertNotIn("rendered_html", sql)
+		self.assertNotIn("tutorial_content", sql)
+
+		tutorial = self.corpus["tutorial"]
+		response, body = self.get_json(f"/api/tutorials/{tutorial.tutorial_slug}/", {"fields": "title,html"})
+		self.assertEqual(body, {"title": tutorial.tutorial_title, "html": tutorial.rendered_html})
+
+	def test_conditional_get(self):
+		path = f"/api/tutorials/{self.corpus['tutorial'].tutorial_slug}/"
+		response, _ = self.get_json(path)
+		with query_budget(1):
+			not_modified, _ = self.get_json(path, HTTP_IF_NONE_MATCH=response["ETag"])
+		self.assertEqual(not_modified.status_code, 304)
+
+		response, _ = self.get_json("/api/tutorials/")
+		self.assertEqual(self.get_json("/api/tutorials/", HTTP_IF_NONE_MATCH=response["ETag"])[0].status_code, 304)
+		self.corpus["tutorial"].delete()
+		self.assertEqual(self.get_json("/api/tutorials/", HTTP_IF_NONE_MATCH=response["ETag"])[0].status_code, 200)
+
+	def test_bad_parameters(self):
+		self.assertEqual(self.get_json("/api/tutorials/", {"fields": "password"})[0].status_code, 400)
+		self.assertEqual(self.get_json("/api/tutorials/", {"cursor": "bogus"})[0].status_code, 400)
+		self.assertEqual(self.get_json("/api/tutorials/", {"limit": "0"})[0].status_code, 400)
+		self.assertEqual(self.get_json("/api/tutorials/no-such-slug/")[0].status_code, 404)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+									  'LOCATION': 'feed-tests'}})
+class SitemapAndFeedTests(TestCase):
+
+	def setUp(self):
+		self.corpus = build_corpus("feeds", 1, 2, 3)
+
+	def get_xml(self, path):
+		response = self.client.get(path)
+		self.assertEqual(response.status_code, 200)
+		self.assertTrue(response.streaming)
+		return b"".join(response.streaming_content).decode()
+
+	def test_sitemap_lists_every_page_and_follows_changes(self):
+		body = self.get_xml("/sitemap.xml")
+		self.assertEqual(body.count("<url>"), 1 + 1 + 6)
+		self.assertIn(f"<loc>http://testserver/{self.corpus['tutorial'].tutorial_slug}</loc>", body)
+
+		with self.assertNumQueries(0):
+			self.assertEqual(self.get_xml("/sitemap.xml"), body)
+		tutorial = self.corpus["tutorial"]
+		tutorial.tutorial_slug = "moved"
+		tutorial.save()
+		self.assertIn("<loc>http://testserver/moved</loc>", self.get_xml("/sitemap.xml"))
+
+	@override_settings(SITEMAP_LIMIT=5)
+	def test_large_sitemaps_are_sharded(self):
+		index = self.get_xml("/sitemap.xml")
+		self.assertIn("<sitemapindex", index)
+		sections = re.findall(r"<loc>http://testserver/(sitemap-[^<]+\.xml)</loc>", index)
+		self.assertEqual(sections[0], "sitemap-pages.xml")
+		urls = [self.get_xml(f"/{section}").count("<url>") for section in sections]
+		self.assertEqual(sum(urls), 8)
+		self.assertLessEqual(max(urls), 5)
+		self.assertEqual(self.client.get("/sitemap-999.xml").status_code, 404)
+
+	@override_settings(FEED_SIZE=2)
+	def test_feed_has_the_newest_tutorials(self):
+		body = self.get_xml("/feed.atom")
+		newest = Tutorial.objects.order_by("-tutorial_published", "-pk")[:2]
+		self.assertEqual(re.findall(r"<entry><title>([^<]+)</title>", body), [t.tutorial_title for t in newest])
+		newest_change = Tutorial.objects.latest("updated_at").updated_at
+		self.assertIn(f"<updated>{newest_change.isoformat(timespec='seconds')}</updated>\n<author>", body)
+
+	@override_settings(FEED_AUTHOR="Ada & co")
+	def test_feed_without_tutorials_still_has_updated_and_author(self):
+		Tutorial.objects.all().delete()
+		body = self.get_xml("/feed.atom")
+		self.assertNotIn("<entry>", body)
+		self.assertIn("<author><name>Ada &amp; co</name></author>", body)
+		newest_change = TutorialSeries.objects.latest("updated_at").updated_at
+		self.assertIn(f"<updated>{newest_change.isoformat(timespec='seconds')}</updated>", body)
+
+
+class StaticExportTests(TestCase):
+
+	def setUp(self):
+		self.corpus = build_corpus("export", 2, 1, 3)
+		self.output = tempfile.mkdtemp()
+
+	def export(self):
+		out = StringIO()
+		call_command("export_site", output=self.output, processes=1, stdout=out)
+		return out.getvalue()
+
+	def test_reexport_only_writes_changed_pages(self):
+		self.assertIn("Wrote 9 of 9 pages", self.export())
+		tutorial = self.corpus["tutorial"]
+		with open(os.path.join(self.output, f"{tutorial.tutorial_slug}.html"), encoding="utf-8") as f:
+			self.assertIn(tutorial.tutorial_title, f.read())
+		self.assertIn("Wrote 0 of 9 pages", self.export())
+
+		# Renaming a tutorial changes every sidebar in its series and the category's grid.
+		tutorial.tutorial_title = "Renamed"
+		tutorial.save()
+		self.assertIn("Wrote 4 of 9 pages", self.export())
+
+	def test_deleted_pages_are_removed(self):
+		self.export()
+		tutorial = self.corpus["tutorial"]
+		tutorial.delete()
+		self.assertIn("Wrote 3 of 8 pages and removed 1", self.export())
+		self.assertFalse(os.path.exists(os.path.join(self.output, f"{tutorial.tutorial_slug}.html")))
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "jsonl"}})
+class JsonlTests(TestCase):
+
+	def setUp(self):
+		self.corpus = build_corpus("jsonl", 2, 2, 2)
+		self.path = os.path.join(tempfile.mkdtemp(), "corpus.jsonl.gz")
+
+	def export(self):
+		call_command("export_tutorials", output=self.path, stdout=StringIO())
+		with gzip.open(self.path, "rt", encoding="utf-8") as f:
+			return f.read()
+
+	def load(self, path=None, **options):
+		out = StringIO()
+		call_command("import_tutorials", path or self.path, stdout=out, **options)
+		return out.getvalue()
+
+	def test_round_trip_resolves_references_by_slug(self):
+		exported = self.export()
+		Tutorial.objects.all().delete()
+		TutorialSeries.objects.all().delete()
+		TutorialCategory.objects.all().delete()
+
+		out = self.load(batch_size=3)
+		self.assertIn("tutorial: 8 created, 0 updated, 0 unchanged", out)
+		self.assertRegex(out, r"Imported 14 records in [\d.]+s \(\d+ rows/s\)")
+		tutorial = Tutorial.objects.select_related("tutorial_series__tutorial_category").get(tutorial_slug="jsonl-c1-s0-t1")
+		self.assertEqual(tutorial.tutorial_series.tutorial_series, "jsonl series 1.0")
+		self.assertEqual(tutorial.tutorial_series.tutorial_category.category_slug, "jsonl-c1")
+		self.assertEqual(tutorial.series_position, 1)
+		self.assertIn("<p>python", tutorial.rendered_html)
+		self.assertEqual(self.export(), exported)
+
+		self.assertIn("tutorial: 0 created, 0 updated, 8 unchanged", self.load())
+
+	def test_updates_in_place_and_stops_at_a_bad_line(self):
+		self.export()
+		with gzip.open(self.path, "rt", encoding="utf-8") as f:
+			records = [json.loads(line) for line in f]
+		edited = next(r for r in records if r.get("slug") == self.corpus["tutorial"].tutorial_slug)
+		edited["content"] = "# Edited"
+		records.append({**edited, "slug": "jsonl-orphan", "category": "missing"})
+		path = os.path.join(os.path.dirname(self.path), "edited.jsonl")
+		with open(path, "w", encoding="utf-8") as f:
+			f.writelines(json.dumps(r) + "\n" for r in records)
+
+		with self.assertRaisesMessage(CommandError, f"line {len(records)}: unknown category 'missing'"):
+			self.load(path, batch_size=1)
+		# Batches before the bad line were committed and rendered.
+		tutorial = Tutorial.objects.get(pk=self.corpus["tutorial"].pk)
+		self.assertEqual(tutorial.rendered_html, '<h1 id="edited">Edited</h1>')
+		self.assertEqual(Tutorial.objects.count(), 8)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class AdminQueryBudgetTests(TestCase):
+
+	def setUp(self):
+		self.admin = User.objects.create_superuser("admin", "admin@example.com", "s3cret-pass-phrase")
+		self.client.force_login(self.admin)
+
+	def assertChangelistBudget(self, budget, path, grow):
+		counts = []
+		for n in (2, 20):
+			grow(n)
+			self.client.get(path)
+			with query_budget(budget) as captured:
+				self.assertEqual(self.client.get(path).status_code, 200)
+			counts.append(len(captured))
+		self.assertLessEqual(counts[-1], counts[0])
+
+	def test_tutorial_changelist(self):
+		self.assertChangelistBudget(
+			8, "/admin/main/tutorial/",
+			lambda n: build_corpus(f"a{n}", 1, 2, n // 2))
+
+	def test_tutorial_changelist_search(self):
+		self.assertChangelistBudget(
+			9, "/admin/main/tutorial/?q=python",
+			lambda n: build_corpus(f"a{n}", 1, 2, n // 2))
+
+	def test_contact_changelist(self):
+		def grow(n):
+			ContactMessage.objects.bulk_create([
+				ContactMessage(name="Sender", email=f"s{i}@example.com", subject="Hello", message="Hi")
+				for i in range(n)])
+		self.assertChangelistBudget(8, "/admin/main/contactmessage/?is_archived__exact=0", grow)
+
+	def test_tutorial_search_says_when_hits_are_capped(self):
+		build_corpus("cap", 1, 1, 3)
+		with mock.patch("main.admin.ADMIN_SEARCH_LIMIT", 2):
+			response = self.client.get("/admin/main/tutorial/", {"q": "python"})
+		self.assertEqual(len(response.context["cl"].result_list), 2)
+		self.assertIn("Showing the best 2 of 3 matches",
+					  [str(message) for message in response.context["messages"]][0])
+		response = self.client.get("/admin/main/tutorial/", {"q": "python"})
+		self.assertEqual(len(response.context["cl"].result_list), 3)
+		self.assertEqual(list(response.context["messages"]), [])
+
+	def test_contact_changelist_created_at_filter(self):
+		def grow(n):
+			ContactMessage.objects.bulk_create([
+				ContactMessage(name="Sender", email=f"s{i}@example.com", subject="Hello", message="Hi")
+				for i in range(n)])
+		self.assertChangelistBudget(8, "/admin/main/contactmessage/?created_at__gte=2000-01-01", grow)
+
+	def test_contact_search_by_email_name_prefix_or_subject_prefix(self):
+		ContactMessage.objects.bulk_create([
+			ContactMessage(name="Ada Lovelace", email="ada@example.com", subject="Engines", message="Hi"),
+			ContactMessage(name="Grace Hopper", email="grace@example.com", subject="Compilers",
+						   message="Found a moth in the relay"),
+		])
+		for term, expected in [
+				("ada@example.com", ["Ada Lovelace"]),
+				("ada", ["Ada Lovelace"]),
+				("GRACE", ["Grace Hopper"]),
+				("comp", ["Grace Hopper"]),
+				("*lovelace", ["Ada Lovelace"]),
+				("*@EXAMPLE.com", ["Ada Lovelace", "Grace Hopper"]),
+				("* moth ", ["Grace Hopper"])]:
+			response = self.client.get("/admin/main/contactmessage/", {"q": term})
+			names = sorted(message.name for message in response.context["cl"].result_list)
+			self.assertEqual(names, expected, term)
+
+	def test_contact_bulk_actions_issue_one_update(self):
+		ContactMessage.objects.bulk_create([
+			ContactMessage(name="Sender", email="s@example.com", subject="Hello", message="Hi")
+			for _ in range(5)])
+		pks = list(ContactMessage.objects.values_list("pk", flat=True))
+		with query_budget(8) as captured:
+			self.client.post("/admin/main/contactmessage/", {
+				"action": "archive", "_selected_action": pks})
+		updates = [q for q in captured.captured_queries if q["sql"].startswith("UPDATE")]
+		self.assertEqual(len(updates), 1)
+		self.assertEqual(ContactMessage.objects.filter(is_archived=True).count(), 5)
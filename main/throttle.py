@@ -0,0 +1,110 @@
+import threading
+import time
+
+from django.core.cache import caches
+
+
+class TokenBucketThrottle:
+	"""
+	In-process token buckets keyed by an arbitrary string (an IP, a username).
+
+	Each key may spend `burst` tokens at once and regains `rate` tokens per
+	second. Buckets that have refilled completely carry no state, so they
+	are pruned once more than max_keys are tracked.
+	"""
+
+	def __init__(self, rate, burst, max_keys=10000):
+		self.rate = rate
+		self.burst = burst
+		self.max_keys = max_keys
+		self._lock = threading.Lock()
+		self._buckets = {}
+
+	def _refill(self, tokens, last, now):
+		return min(self.burst, tokens + (now - last) * self.rate)
+
+	def allow(self, key, cost=1):
+		"""Take cost tokens from key's bucket; False if there are not enough."""
+		now = time.monotonic()
+		with self._lock:
+			tokens, last = self._buckets.get(key, (self.burst, now))
+			tokens = self._refill(tokens, last, now)
+			allowed = tokens >= cost
+			if allowed:
+				tokens -= cost
+			self._buckets[key] = (tokens, now)
+			if len(self._buckets) > self.max_keys:
+				self._prune(now)
+		return allowed
+
+	def _prune(self, now):
+		full = [key for key, (tokens, last) in self._buckets.items()
+				if self._refill(tokens, last, now) >= self.burst]
+		for key in full:
+			del self._buckets[key]
+
+	def reset(self, key=None):
+		with self._lock:
+			if key is None:
+				self._buckets.clear()
+			else:
+				self._buckets.pop(key, None)
+
+
+class CacheTokenBucketThrottle(TokenBucketThrottle):
+	"""
+	The same buckets kept in a Django cache, so every process shares them.
+
+	Reads and writes are not atomic, so concurrent requests for one key can
+	overspend slightly; that is fine for throttling abuse.
+	"""
+
+	def __init__(self, rate, burst, alias, prefix="throttle:"):
+		super().__init__(rate, burst)
+		self.alias = alias
+		self.prefix = prefix
+
+	def allow(self, key, cost=1):
+		cache = caches[self.alias]
+		cache_key = f"{self.prefix}{key}"
+		now = time.time()
+		tokens, last = cache.get(cache_key, (self.burst, now))
+		tokens = self._refill(tokens, last, now)
+		allowed = tokens >= cost
+		if allowed:
+			tokens -= cost
+		# Untouched buckets are full again after burst / rate seconds.
+		cache.set(cache_key, (tokens, now), timeout=int(self.burst / self.rate) + 1)
+		return allowed
+
+	def reset(self, key=None):
+		if key is None:
+			raise ValueError("A cache-backed throttle can only be reset one key at a time.")
+		caches[self.alias].delete(f"{self.prefix}{key}")
+
+
+_configured = {}
+
+
+def configured_throttle(name, options, cache_alias=None):
+	"""
+	The throttle for a settings dict with RATE_PER_MINUTE and BURST, or
+	None when options is empty. It is rebuilt whenever the options change.
+	"""
+	if not options:
+		return None
+	wanted = (options["RATE_PER_MINUTE"] / 60, options["BURST"], cache_alias)
+	throttle = _configured.get(name)
+	if throttle is None or throttle.options != wanted:
+		rate, burst, alias = wanted
+		if alias:
+			throttle = CacheTokenBucketThrottle(rate, burst, alias, prefix=f"throttle:{name}:")
+		else:
+			throttle = TokenBucketThrottle(rate, burst)
+		throttle.options = wanted
+		_configured[name] = throttle
+	return throttle
+
+
+def client_ip(request):
+	return request.META.get("REMOTE_ADDR", "")
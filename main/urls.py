@@ -14,8 +14,8 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
-from django.urls import path
-from . import views
+from django.urls import path, re_path
+from . import api, views
 
 app_name = "main"
 
@@ -29,5 +29,15 @@ urlpatterns = [
     path('account/change-password/', views.change_password, name='change_password'),
     path('search/', views.search, name='search'),
     path('contact/', views.contact, name='contact'),
+    path('metrics/', views.request_metrics, name='request_metrics'),
+    path('api/categories/', api.category_list, name='api_category_list'),
+    path('api/categories/<str:slug>/', api.category_detail, name='api_category_detail'),
+    path('api/series/', api.series_list, name='api_series_list'),
+    path('api/series/<int:pk>/', api.series_detail, name='api_series_detail'),
+    path('api/tutorials/', api.tutorial_list, name='api_tutorial_list'),
+    path('api/tutorials/<str:slug>/', api.tutorial_detail, name='api_tutorial_detail'),
+    path('sitemap.xml', views.sitemap, name='sitemap'),
+    re_path(r'^sitemap-(?P<section>pages|\d+)\.xml$', views.sitemap_section, name='sitemap_section'),
+    path('feed.atom', views.atom_feed, name='atom_feed'),
     path('<single_slug>', views.single_slug, name='single_slug'),
 ]
@@ -1,66 +1,174 @@
+from django.conf import settings
 from django.shortcuts import render, redirect
-from django.http import HttpResponse
-from django.db.models import Q
+from django.http import HttpResponse, JsonResponse
+from django.db.models import OuterRef, Subquery
 from .models import Tutorial, TutorialCategory, TutorialSeries
 from django.contrib.auth.forms import AuthenticationForm, PasswordChangeForm
-from django.contrib.auth import login, logout, authenticate, update_session_auth_hash
+from django.contrib.auth import login, logout, update_session_auth_hash
 from django.contrib.auth.decorators import login_required
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
+from django.views.decorators.http import condition
 from .forms import NewUserForm, EditProfileForm, ContactForm
+from .slugs import slug_registry, resolve_for_request, CATEGORY, TUTORIAL
+from . import search as search_index
+from . import feeds, freshness
+from .instrumentation import metrics
+from .contact_queue import get_contact_queue
+from .throttle import configured_throttle, client_ip
+from .hashing import PasswordHashingBusy
+from .pagecache import (cache_anonymous_page, tag_response, category_tag,
+                        series_tag, tutorial_tag, CATEGORIES_TAG)
 
 
 # Create your views here.
 
+def _resolve_slug(request, single_slug):
+	"""Resolve single_slug to a (kind, object) pair, or (None, None)."""
+	for attempt in range(2):
+		if attempt == 0:
+			match = resolve_for_request(request, single_slug)
+		else:
+			match = slug_registry.resolve(single_slug)
+		if match is None:
+			return None, None
+		kind, pk = match
+		if kind == CATEGORY:
+			obj = TutorialCategory.objects.filter(pk=pk, category_slug=single_slug).first()
+		else:
+			obj = (Tutorial.objects
+				.select_related("tutorial_series__tutorial_category")
+				.defer("tutorial_content")
+				.filter(pk=pk, tutorial_slug=single_slug)
+				.first())
+		if obj is not None:
+			return kind, obj
+		# Another worker changed or deleted this row; forget it and retry.
+		slug_registry.discard(single_slug)
+	return None, None
+
+
+def _part_one_slug():
+	"""Subquery for the slug of a series' first tutorial, to link series by."""
+	return (Tutorial.objects
+		.filter(tutorial_series=OuterRef("pk"))
+		.order_by("tutorial_published", "pk")
+		.values("tutorial_slug")[:1])
+
+
+def _category_series(category):
+	return (TutorialSeries.objects
+		.filter(tutorial_category=category)
+		.annotate(part_one_slug=Subquery(_part_one_slug()))
+		.filter(part_one_slug__isnull=False))
+
+
+def _series_tutorials(tutorial):
+	return (Tutorial.objects
+		.filter(tutorial_series_id=tutorial.tutorial_series_id)
+		.order_by("series_position", "pk")
+		.only("tutorial_title", "tutorial_slug", "series_position"))
+
+
+def _tutorial_context(tutorial, tutorial_from_Series):
+	"""Context for tutorial.html, or None when the stored series positions are stale."""
+	this_tutorial_idx = tutorial.series_position
+	if not (this_tutorial_idx < len(tutorial_from_Series)
+			and tutorial_from_Series[this_tutorial_idx].pk == tutorial.pk):
+		return None
+
+	sidebar_list = {}
+	if this_tutorial_idx > 0:
+		sidebar_list['prev'] = tutorial_from_Series[this_tutorial_idx - 1]
+	if this_tutorial_idx < len(tutorial_from_Series) - 1:
+		sidebar_list['next'] = tutorial_from_Series[this_tutorial_idx + 1]
+
+	return {"tutorial": tutorial,
+	        "sidebar": tutorial_from_Series,
+	        "this_tutorial_idx": this_tutorial_idx,
+	        "sidebar_list": sidebar_list,
+	        "has_next": this_tutorial_idx < len(tutorial_from_Series) - 1}
+
+
+def _renumbered_tutorial_context(tutorial):
+	# Positions are out of date (e.g. rows loaded with raw fixtures).
+	tutorial_from_Series = Tutorial.renumber_series(tutorial.tutorial_series_id)
+	tutorial.series_position = [t.pk for t in tutorial_from_Series].index(tutorial.pk)
+	return _tutorial_context(tutorial, tutorial_from_Series)
+
+
+def _tutorial_tags(tutorial):
+	return (tutorial_tag(tutorial.pk),
+	        series_tag(tutorial.tutorial_series_id),
+	        category_tag(tutorial.tutorial_series.tutorial_category_id))
+
+
+@condition(etag_func=freshness.single_slug_etag,
+           last_modified_func=freshness.single_slug_last_modified)
+@cache_anonymous_page
 def single_slug(request, single_slug):
-	categories = [c.category_slug for c in TutorialCategory.objects.all()]
-	if single_slug in categories:
-		matching_series = TutorialSeries.objects.filter(tutorial_category__category_slug=single_slug)
+	kind, obj = _resolve_slug(request, single_slug)
+	if kind == CATEGORY:
+		series_urls = {m: m.part_one_slug for m in _category_series(obj)}
 
-		series_urls = {}
-		for m in matching_series.all():
-			part_one = Tutorial.objects.filter(tutorial_series__tutorial_series=m.tutorial_series).earliest("tutorial_published")
-			series_urls[m] = part_one.tutorial_slug
-
-		return render(request,
+		response = render(request,
 			          "main/category.html",
 			          {"part_ones": series_urls})
+		return tag_response(response, category_tag(obj.pk),
+		                    *[series_tag(m.pk) for m in series_urls])
 
-	tutorials = [t.tutorial_slug for t in Tutorial.objects.all()]
-	if single_slug in tutorials:
-		this_tutorial = Tutorial.objects.get(tutorial_slug=single_slug)
-		tutorial_from_Series = Tutorial.objects.filter(tutorial_series__tutorial_series=this_tutorial.tutorial_series).order_by("tutorial_published")
-
-		this_tutorial_idx = list(tutorial_from_Series).index(this_tutorial)
-
-		sidebar_list = {}
-		if this_tutorial_idx > 0:
-			sidebar_list['prev'] = tutorial_from_Series[this_tutorial_idx - 1]
-		if this_tutorial_idx < len(tutorial_from_Series) - 1:
-			sidebar_list['next'] = tutorial_from_Series[this_tutorial_idx + 1]
-
-		return render(request,
-			          "main/tutorial.html",
-			          {"tutorial": this_tutorial,
-			          "sidebar": tutorial_from_Series,
-			          "this_tutorial_idx": this_tutorial_idx,
-			          "sidebar_list": sidebar_list,
-			          "has_next": this_tutorial_idx < len(tutorial_from_Series) - 1})
+	if kind == TUTORIAL:
+		context = (_tutorial_context(obj, list(_series_tutorials(obj)))
+		           or _renumbered_tutorial_context(obj))
+		response = render(request, "main/tutorial.html", context)
+		return tag_response(response, *_tutorial_tags(obj))
 
 	return render(request, "main/404.html", status=404)
 
 
+@condition(etag_func=freshness.homepage_etag,
+           last_modified_func=freshness.homepage_last_modified)
+@cache_anonymous_page
 def homepage(request):
-	return render(request=request,
+	response = render(request=request,
 		          template_name="main/categories.html",
 		          context={"categories": TutorialCategory.objects.all})
+	return tag_response(response, CATEGORIES_TAG)
+
+
+def _sign_in_allowed(request, username=None):
+	"""Per-IP and per-username token buckets, checked before any password is hashed."""
+	options = getattr(settings, "LOGIN_THROTTLE", None) or {}
+	alias = options.get("CACHE_ALIAS")
+	by_ip = configured_throttle("login-ip", options.get("IP"), alias)
+	if by_ip is not None and not by_ip.allow(client_ip(request)):
+		return False
+	by_username = configured_throttle("login-username", options.get("USERNAME"), alias)
+	if username and by_username is not None and not by_username.allow(username.lower()):
+		return False
+	return True
+
+
+def _sign_in_refused(request, template, form, status):
+	if status == 429:
+		messages.error(request, "Too many attempts. Please wait a minute and try again.")
+	else:
+		messages.error(request, "The server is busy. Please try again in a moment.")
+	return render(request, template, {"form": form}, status=status)
 
 
 def register(request):
 	if request.method == "POST":
+		if not _sign_in_allowed(request):
+			return _sign_in_refused(request, "main/register.html", NewUserForm, 429)
+
 		form = NewUserForm(request.POST)
 
 		if form.is_valid():
-			user = form.save()
+			try:
+				user = form.save()
+			except PasswordHashingBusy:
+				return _sign_in_refused(request, "main/register.html", NewUserForm, 503)
 			username = form.cleaned_data.get('username')
 			messages.success(request, f"New Account Created: {username}")
 			login(request, user)
@@ -85,19 +193,22 @@ def logout_request(request):
 
 def login_request(request):
 	if request.method == "POST":
+		if not _sign_in_allowed(request, request.POST.get("username")):
+			return _sign_in_refused(request, "main/login.html", AuthenticationForm(), 429)
+
 		form = AuthenticationForm(request=request, data=request.POST)
 
-		if form.is_valid():
-			username = form.cleaned_data.get('username')
-			password = form.cleaned_data.get('password')
-			user = authenticate(username=username, password=password)
+		try:
+			valid = form.is_valid()
+		except PasswordHashingBusy:
+			return _sign_in_refused(request, "main/login.html", AuthenticationForm(), 503)
 
-			if user is not None:
-				login(request, user)
-				messages.info(request, f"You are now logged in as {username}")
-				return redirect("main:homepage")
-			else:
-				messages.error(request, "Invalid Username or Password.")
+		if valid:
+			# The form has already authenticated; don't hash the password twice.
+			username = form.cleaned_data.get('username')
+			login(request, form.get_user())
+			messages.info(request, f"You are now logged in as {username}")
+			return redirect("main:homepage")
 		else:
 			messages.error(request, "Invalid Username or Password.")
 
@@ -146,66 +257,119 @@ def change_password(request):
 	return render(request, "main/change_password.html", {"form": form})
 
 
-def search(request):
-	query = request.GET.get('q', '')
-	results = []
+SEARCH_PAGE_SIZE = 20
 
-	if query:
-		# Search tutorials
-		tutorials = Tutorial.objects.filter(
-			Q(tutorial_title__icontains=query) |
-			Q(tutorial_content__icontains=query)
-		)
-		for t in tutorials:
+
+def _search_lookups(hits):
+	"""(kind, queryset, pks) for loading the objects behind [(kind, pk), ...] search hits."""
+	pks = {kind: [pk for k, pk in hits if k == kind] for kind in search_index.KINDS}
+	return [
+		(search_index.TUTORIAL,
+		 Tutorial.objects.only("tutorial_title", "tutorial_slug", "tutorial_excerpt"),
+		 pks[search_index.TUTORIAL]),
+		(search_index.CATEGORY, TutorialCategory.objects.all(), pks[search_index.CATEGORY]),
+		(search_index.SERIES,
+		 TutorialSeries.objects
+			.only("tutorial_series", "series_summary")
+			.annotate(part_one_slug=Subquery(_part_one_slug())),
+		 pks[search_index.SERIES]),
+	]
+
+
+def _search_rows(hits, loaded):
+	"""Result rows for hits, in hit order, from {kind: {pk: object}}."""
+	tutorials = loaded[search_index.TUTORIAL]
+	categories = loaded[search_index.CATEGORY]
+	series = loaded[search_index.SERIES]
+
+	results = []
+	for kind, pk in hits:
+		if kind == search_index.TUTORIAL and pk in tutorials:
+			t = tutorials[pk]
 			results.append({
 				'title': t.tutorial_title,
 				'slug': t.tutorial_slug,
-				'summary': t.tutorial_content[:150] + '...' if len(t.tutorial_content) > 150 else t.tutorial_content,
+				'summary': t.tutorial_excerpt,
 				'type': 'Tutorial',
 			})
-
-		# Search categories
-		categories_qs = TutorialCategory.objects.filter(
-			Q(tutorial_category__icontains=query) |
-			Q(category_summary__icontains=query)
-		)
-		for c in categories_qs:
+		elif kind == search_index.CATEGORY and pk in categories:
+			c = categories[pk]
 			results.append({
 				'title': c.tutorial_category,
 				'slug': c.category_slug,
 				'summary': c.category_summary,
 				'type': 'Category',
 			})
+		elif kind == search_index.SERIES and pk in series and series[pk].part_one_slug:
+			s = series[pk]
+			results.append({
+				'title': s.tutorial_series,
+				'slug': s.part_one_slug,
+				'summary': s.series_summary,
+				'type': 'Series',
+			})
+	return results
+
+
+def _search_results(hits):
+	"""Load the objects behind [(kind, pk), ...] search hits, keeping their order."""
+	return _search_rows(hits, {kind: queryset.in_bulk(pks) for kind, queryset, pks in _search_lookups(hits)})
+
+
+def _search_params(request):
+	query = request.GET.get('q', '')
+	try:
+		page = max(int(request.GET.get('page', 1)), 1)
+	except ValueError:
+		page = 1
+	return query, page
 
-		# Search series
-		series = TutorialSeries.objects.filter(
-			Q(tutorial_series__icontains=query) |
-			Q(series_summary__icontains=query)
-		)
-		for s in series:
-			first_tutorial = Tutorial.objects.filter(
-				tutorial_series=s
-			).order_by('tutorial_published').first()
-			if first_tutorial:
-				results.append({
-					'title': s.tutorial_series,
-					'slug': first_tutorial.tutorial_slug,
-					'summary': s.series_summary,
-					'type': 'Series',
-				})
-
-	return render(request, "main/search.html", {
+
+def _search_context(query, page, total, results):
+	return {
 		"query": query,
 		"results": results,
+		"total": total,
+		"page": page,
+		"previous_page": page - 1 if page > 1 else None,
+		"next_page": page + 1 if page * SEARCH_PAGE_SIZE < total else None,
 		"categories": TutorialCategory.objects.all(),
-	})
+	}
+
+
+def search(request):
+	query, page = _search_params(request)
+	results = []
+	total = 0
+
+	if query:
+		offset = (page - 1) * SEARCH_PAGE_SIZE
+		found = search_index.get_search_backend().search(query, offset, SEARCH_PAGE_SIZE)
+		total = found.total
+		results = _search_results(found.hits)
+
+	return render(request, "main/search.html",
+				  _search_context(query, page, total, results))
+
+
+def _contact_allowed(request):
+	"""Per-IP token bucket, checked before the form is even validated."""
+	throttle = configured_throttle("contact", getattr(settings, "CONTACT_THROTTLE", None))
+	return throttle is None or throttle.allow(client_ip(request))
 
 
 def contact(request):
 	if request.method == "POST":
+		if not _contact_allowed(request):
+			messages.error(request, "You are sending messages too quickly. Please try again later.")
+			return render(request, "main/contact.html", {"form": ContactForm()}, status=429)
+
 		form = ContactForm(request.POST)
 		if form.is_valid():
-			form.save()
+			if getattr(settings, "CONTACT_QUEUE", {}).get("ENABLED", False):
+				get_contact_queue().submit(form.cleaned_data)
+			else:
+				form.save()
 			messages.success(request, "Your message has been sent! We'll get back to you soon.")
 			return redirect("main:contact")
 		else:
@@ -216,6 +380,24 @@ def contact(request):
 	return render(request, "main/contact.html", {"form": form})
 
 
+def sitemap(request):
+	return feeds.streaming_xml(request, "sitemap", feeds.sitemap_chunks)
+
+
+def sitemap_section(request, section):
+	return feeds.streaming_xml(request, f"sitemap-{section}",
+	                           lambda base: feeds.section_chunks(base, section))
+
+
+def atom_feed(request):
+	return feeds.streaming_xml(request, "feed", feeds.feed_chunks, content_type="application/atom+xml")
+
+
+@staff_member_required
+def request_metrics(request):
+	return JsonResponse(metrics.snapshot())
+
+
 def custom_404(request, exception):
 	return render(request, "main/404.html", status=404)
 
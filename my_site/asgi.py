@@ -0,0 +1,19 @@
+"""
+ASGI config for my_site project.
+
+It exposes the ASGI callable as a module-level variable named ``application``,
+and routes the read-heavy pages to the async views (see my_site.asgi_urls).
+Serve it with any ASGI server, e.g. ``uvicorn my_site.asgi:application``.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'my_site.settings')
+os.environ.setdefault('DJANGO_ASYNC_VIEWS', '1')
+
+application = get_asgi_application()
@@ -0,0 +1,16 @@
+"""my_site URL Configuration for ASGI
+
+Same as my_site.urls, but the read-heavy pages are served by the async
+views in main.async_views. Selected when DJANGO_ASYNC_VIEWS=1, which
+my_site/asgi.py sets.
+"""
+from django.contrib import admin
+from django.urls import path, include
+
+urlpatterns = [
+    path('', include('main.async_urls')),
+    path('admin/', admin.site.urls),
+]
+
+handler404 = 'main.views.custom_404'
+handler500 = 'main.views.custom_500'
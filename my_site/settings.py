@@ -40,6 +40,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'main.static_serving.StaticFilesMiddleware',
+    'main.instrumentation.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -49,25 +51,75 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'my_site.urls'
+# Sessions and request.user are served from the cache so that pages read
+# by signed-in users need no auth queries. cached_db writes sessions
+# through to the database, so they survive a cache restart; set
+# DJANGO_SESSION_ENGINE=django.contrib.sessions.backends.signed_cookies
+# to keep them in the cookie instead (they then cannot be revoked
+# server-side). Messages always travel in their own cookie.
+SESSION_ENGINE = os.environ.get('DJANGO_SESSION_ENGINE', 'django.contrib.sessions.backends.cached_db')
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+AUTHENTICATION_BACKENDS = ['main.auth.CachedModelBackend']
+AUTH_USER_CACHE_TIMEOUT = 60
+
+# Login and registration hash passwords on a small bounded executor (see
+# main.hashing) behind per-IP and per-username token buckets. Set
+# CACHE_ALIAS to share the buckets between processes. Half the cores are
+# left for page traffic however hard /login/ is hit.
+PASSWORD_HASHING = {
+    'MAX_WORKERS': max(1, (os.cpu_count() or 2) // 2),
+    'MAX_QUEUE': 16,
+    'QUEUE_TIMEOUT': 2.0,
+}
+LOGIN_THROTTLE = {
+    'IP': {'RATE_PER_MINUTE': 10, 'BURST': 5},
+    'USERNAME': {'RATE_PER_MINUTE': 3, 'BURST': 5},
+    'CACHE_ALIAS': None,
+}
 
+# Per-view request metrics (see main.instrumentation). Lower the sample
+# rate to cut overhead; set a dump path to write snapshots periodically.
+REQUEST_METRICS_SAMPLE_RATE = 1.0
+REQUEST_METRICS_DUMP_PATH = None
+REQUEST_METRICS_DUMP_INTERVAL = 60
+
+# asgi.py sets DJANGO_ASYNC_VIEWS=1 to serve the read-heavy pages with the
+# async views; the sync views stay in place for WSGI.
+ASYNC_VIEWS = os.environ.get('DJANGO_ASYNC_VIEWS') == '1'
+ROOT_URLCONF = 'my_site.asgi_urls' if ASYNC_VIEWS else 'my_site.urls'
+
+# Templates are compiled once per process by the cached loader (the dev
+# server's autoreloader resets it when a template changes). The navbar,
+# footer, series sidebar and category grid are also cached as rendered
+# fragments, keyed on the user's auth state or the page cache's content
+# versions, for FRAGMENT_CACHE_TIMEOUT seconds.
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'main.context_processors.assets',
+                'main.context_processors.fragment_cache',
+            ],
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
             ],
         },
     },
 ]
 
+FRAGMENT_CACHE_TIMEOUT = 600
+
 WSGI_APPLICATION = 'my_site.wsgi.application'
+ASGI_APPLICATION = 'my_site.asgi.application'
 
 
 # Database
@@ -80,6 +132,82 @@ DATABASES = {
     }
 }
 
+# Production SQLite profile, enabled with DJANGO_DB_PROFILE=production.
+# WAL lets readers run alongside the single writer, connections are kept
+# open between requests, and reads go to a read-only connection to the
+# same file through main.routers.PrimaryReplicaRouter.
+if os.environ.get('DJANGO_DB_PROFILE') == 'production':
+    SQLITE_PRAGMAS = ';'.join([
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA mmap_size=268435456',
+        'PRAGMA cache_size=-65536',
+        'PRAGMA temp_store=MEMORY',
+    ])
+    DATABASES['default'].update({
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': SQLITE_PRAGMAS,
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
+    })
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': 'file:%s?mode=ro' % DATABASES['default']['NAME'],
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': 'PRAGMA mmap_size=268435456;PRAGMA cache_size=-65536',
+            'timeout': 20,
+        },
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_ROUTERS = ['main.routers.PrimaryReplicaRouter']
+
+
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Local memory is per process; point 'default' at FileBasedCache (or a shared
+# server) so page-cache invalidations reach every worker.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'main',
+    }
+}
+
+# Anonymous full-page cache for the home, category and tutorial pages.
+PAGE_CACHE_ALIAS = 'default'
+PAGE_CACHE_TIMEOUT = 600
+
+# sitemap.xml switches to a sitemap index past SITEMAP_LIMIT URLs; it and
+# the Atom feed (the FEED_SIZE newest tutorials, credited to FEED_AUTHOR)
+# are cached until a tutorial or category changes, or FEED_CACHE_TIMEOUT
+# seconds.
+SITEMAP_LIMIT = 50000
+FEED_SIZE = 20
+FEED_AUTHOR = 'Tutorials'
+FEED_CACHE_TIMEOUT = 3600
+
+
+# Contact form submissions are spooled to disk and inserted in batches by a
+# background thread (main.contact_queue); each IP may send BURST messages at
+# once and RATE_PER_MINUTE after that.
+CONTACT_QUEUE = {
+    'ENABLED': True,
+    'SPOOL_DIR': os.path.join(BASE_DIR, 'var', 'contact-spool'),
+    'BATCH_SIZE': 100,
+    'FLUSH_INTERVAL': 2.0,
+}
+
+CONTACT_THROTTLE = {
+    'RATE_PER_MINUTE': 5,
+    'BURST': 5,
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/2.1/ref/settings/#auth-password-validators
@@ -120,7 +248,38 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# collectstatic purges unused selectors from the CSS listed in CSS_PURGE,
+# minifies all CSS, content-hashes every file and writes .gz/.br copies;
+# main.static_serving then serves STATIC_ROOT with far-future headers.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'main.storage.OptimizedStaticFilesStorage',
+    },
+}
+CSS_PURGE = ['main/css/materialize.css']
+
+# Inline the above-the-fold CSS written by build_critical_css into the
+# pages that have it and load the full stylesheets asynchronously.
+CRITICAL_CSS = True
+STATIC_MAX_AGE = 60
+
+# Drop MaterialIcons-Regular.woff2 into main/static/main/fonts/ to serve
+# the icon font locally instead of from Google Fonts.
+VENDORED_ICON_FONT = os.path.exists(
+    os.path.join(BASE_DIR, 'main', 'static', 'main', 'fonts', 'MaterialIcons-Regular.woff2'))
+
+# export_site writes the public pages here as static files, e.g. for
+# nginx: try_files $uri $uri.html $uri/index.html @django;
+STATIC_EXPORT_DIR = os.path.join(BASE_DIR, 'var', 'site')
+
 LOGIN_URL = '/login/'
 LOGIN_REDIRECT_URL = '/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Full-text search backend used by main.views.search. LikeSearchBackend
+# works on any database; swap in a tsvector backend on Postgres.
+SEARCH_BACKEND = 'main.search.SQLiteFTS5Backend'